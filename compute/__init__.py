@@ -0,0 +1,7 @@
+"""
+VERICOM DLP 3D Printer GUI - Compute Package
+프로세스 풀 작업자용 연산 모듈 (PySide6/하드웨어 비의존)
+
+작업자 프로세스는 작업 함수가 있는 모듈만 import하므로
+이 패키지는 서브모듈을 다시 내보내지 않음 (compute.layer_check 등으로 직접 import).
+"""
@@ -0,0 +1,153 @@
+"""
+VERICOM DLP 3D Printer - Layer Check
+레이어 PNG 무결성 검사 (순수 Python, 프로세스 풀 작업자용)
+
+Qt 없이 ZIP CRC, PNG 청크 CRC, IDAT 압축 해제 길이, 필터 바이트,
+해상도, 비트 깊이를 검사하여 디코딩 가능 여부를 판단.
+이 모듈은 작업자 프로세스에서 import되므로 PySide6에 의존하지 않음.
+"""
+
+import struct
+import zipfile
+import zlib
+from typing import List, Optional, Sequence, Tuple
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 컬러 타입별 채널 수 (0=Gray, 2=RGB, 3=Palette, 4=Gray+Alpha, 6=RGBA)
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# 슬라이서 출력으로 허용하는 비트 깊이 (1bit 흑백, 8bit 그레이/안티앨리어싱)
+ALLOWED_BIT_DEPTHS = (1, 8)
+
+# Adam7 인터레이스 패스 (x0, y0, dx, dy)
+_ADAM7 = ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4),
+          (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2))
+
+
+def _row_bytes(width: int, channels: int, bit_depth: int) -> int:
+    """스캔라인 바이트 수 (필터 바이트 제외)"""
+    return (width * channels * bit_depth + 7) // 8
+
+
+def _expected_raw_size(width: int, height: int, channels: int, bit_depth: int,
+                       interlace: int) -> int:
+    """IDAT 압축 해제 후 기대 길이"""
+    if not interlace:
+        return height * (1 + _row_bytes(width, channels, bit_depth))
+
+    total = 0
+    for x0, y0, dx, dy in _ADAM7:
+        pass_w = (width - x0 + dx - 1) // dx if width > x0 else 0
+        pass_h = (height - y0 + dy - 1) // dy if height > y0 else 0
+        if pass_w and pass_h:
+            total += pass_h * (1 + _row_bytes(pass_w, channels, bit_depth))
+    return total
+
+
+def check_png(data: bytes, expected_size: Optional[Tuple[int, int]] = None) -> Optional[str]:
+    """
+    PNG 데이터 무결성 검사
+
+    Args:
+        data: PNG 바이트 데이터
+        expected_size: 기대 해상도 (width, height), None이면 검사 안 함
+
+    Returns:
+        오류 메시지, 정상이면 None
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return "PNG 시그니처 없음"
+
+    pos = len(PNG_SIGNATURE)
+    header = None
+    idat = []
+    has_iend = False
+
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack_from('>I4s', data, pos)
+        body_start = pos + 8
+        body_end = body_start + length
+        if body_end + 4 > len(data):
+            return f"{chunk_type.decode('latin-1')} 청크가 잘림"
+
+        crc = struct.unpack_from('>I', data, body_end)[0]
+        if zlib.crc32(data[pos + 4:body_end]) != crc:
+            return f"{chunk_type.decode('latin-1')} 청크 CRC 불일치"
+
+        if chunk_type == b'IHDR':
+            if length != 13:
+                return "IHDR 길이 오류"
+            header = struct.unpack_from('>IIBBBBB', data, body_start)
+        elif chunk_type == b'IDAT':
+            idat.append(data[body_start:body_end])
+        elif chunk_type == b'IEND':
+            has_iend = True
+            break
+
+        pos = body_end + 4
+
+    if header is None:
+        return "IHDR 없음"
+    if not idat:
+        return "IDAT 없음"
+    if not has_iend:
+        return "IEND 없음 (파일 잘림)"
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if expected_size and (width, height) != tuple(expected_size):
+        return f"해상도 불일치: {width}x{height} (기대 {expected_size[0]}x{expected_size[1]})"
+    if color_type not in _CHANNELS:
+        return f"알 수 없는 컬러 타입: {color_type}"
+    if bit_depth not in ALLOWED_BIT_DEPTHS:
+        return f"지원하지 않는 비트 깊이: {bit_depth}"
+
+    try:
+        raw = zlib.decompress(b''.join(idat))
+    except zlib.error as e:
+        return f"IDAT 압축 해제 실패: {e}"
+
+    channels = _CHANNELS[color_type]
+    expected = _expected_raw_size(width, height, channels, bit_depth, interlace)
+    if len(raw) != expected:
+        return f"IDAT 길이 불일치: {len(raw)} (기대 {expected})"
+
+    # 비인터레이스: 각 스캔라인의 필터 타입(0~4) 확인
+    if not interlace:
+        stride = 1 + _row_bytes(width, channels, bit_depth)
+        if max(raw[0::stride]) > 4:
+            return "스캔라인 필터 타입 오류"
+
+    return None
+
+
+def check_zip_layers(zip_path: str, names: Sequence[str],
+                     expected_size: Optional[Tuple[int, int]] = None) -> List[Tuple[str, str]]:
+    """
+    ZIP 레이어 묶음 검사 (프로세스 풀 작업 단위)
+
+    zipfile.read()가 멤버 CRC-32를 검사하므로 ZIP 손상도 함께 검출
+
+    Args:
+        zip_path: ZIP 파일 경로
+        names: 검사할 레이어 엔트리 이름
+        expected_size: 기대 해상도
+
+    Returns:
+        [(엔트리 이름, 오류 메시지), ...] (정상이면 빈 리스트)
+    """
+    errors = []
+    with zipfile.ZipFile(zip_path, 'r') as z:
+        for name in names:
+            try:
+                data = z.read(name)
+            except (zipfile.BadZipFile, zlib.error, KeyError) as e:
+                errors.append((name, f"ZIP 멤버 손상: {e}"))
+                continue
+
+            error = check_png(data, expected_size)
+            if error:
+                errors.append((name, error))
+
+    return errors
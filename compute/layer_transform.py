@@ -0,0 +1,190 @@
+"""
+VERICOM DLP 3D Printer - Layer Transform
+레이어 프레임 보정 (XY 보정 + 내부 디밍 + 안티앨리어싱 임계값, NumPy 벡터화)
+
+레진 과경화로 커지는 외곽을 PC 재슬라이싱 없이 프린터에서 보정:
+1. 안티앨리어싱 임계값: threshold 이상은 255, 미만은 0 (가장자리 회색 제거)
+2. XY 보정: N픽셀 팽창(+) / 침식(-) — 그레이스케일 최대/최소 필터
+3. 내부 디밍: 외곽에서 depth 픽셀 이상 들어간 내부 픽셀 밝기를 percent로 낮춤
+
+형태학 연산은 3x3 십자/정사각 이웃을 번갈아 적용 (팔각형 근사, 반복 횟수 = 반경).
+이 모듈은 작업자 프로세스에서 import되므로 PySide6에 의존하지 않음.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
+
+
+# XY 보정 범위 (픽셀, +팽창 / -침식)
+MAX_OFFSET_PX = 10
+
+# 디밍 범위 (%)
+MIN_DIM_PERCENT = 50
+
+# 디밍 적용 깊이 범위 (외곽에서 내부로, 픽셀)
+MAX_DIM_DEPTH_PX = 32
+
+
+@dataclass(frozen=True)
+class LayerTransform:
+    """
+    레이어 프레임 보정 설정 (소재 프리셋별)
+
+    사용 예:
+        transform = LayerTransform.from_preset(preset)
+        if not transform.is_identity:
+            pixels = transform.apply(pixels)   # (height, width) uint8
+    """
+    offset_px: int = 0        # XY 보정 (+팽창 / -침식, 픽셀)
+    dim_percent: int = 100    # 내부 픽셀 밝기 (%, 100=디밍 없음)
+    dim_depth_px: int = 8     # 디밍 시작 깊이 (외곽에서 내부로, 픽셀)
+    aa_threshold: int = 0     # 안티앨리어싱 임계값 (0=사용 안 함, 1~255)
+
+    def __post_init__(self):
+        # 프리셋 JSON 값 범위 보정
+        object.__setattr__(self, 'offset_px',
+                           max(-MAX_OFFSET_PX, min(MAX_OFFSET_PX, int(self.offset_px))))
+        object.__setattr__(self, 'dim_percent',
+                           max(MIN_DIM_PERCENT, min(100, int(self.dim_percent))))
+        object.__setattr__(self, 'dim_depth_px',
+                           max(1, min(MAX_DIM_DEPTH_PX, int(self.dim_depth_px))))
+        object.__setattr__(self, 'aa_threshold', max(0, min(255, int(self.aa_threshold))))
+
+    @classmethod
+    def from_preset(cls, preset) -> 'LayerTransform':
+        """MaterialPreset으로 생성"""
+        return cls(
+            offset_px=preset.xy_offset_px,
+            dim_percent=preset.dim_percent,
+            dim_depth_px=preset.dim_depth_px,
+            aa_threshold=preset.aa_threshold,
+        )
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> 'LayerTransform':
+        """프린트 파라미터 딕셔너리(FilePreviewPage 키)로 생성"""
+        return cls(
+            offset_px=params.get('xyOffsetPx', 0),
+            dim_percent=params.get('dimPercent', 100),
+            dim_depth_px=params.get('dimDepthPx', 8),
+            aa_threshold=params.get('aaThreshold', 0),
+        )
+
+    @property
+    def is_identity(self) -> bool:
+        """보정 없음 (원본 프레임 그대로)"""
+        return self.offset_px == 0 and self.dim_percent >= 100 and self.aa_threshold == 0
+
+    def key(self) -> str:
+        """캐시 구분 키 (파일명에 사용, 보정 없으면 빈 문자열)"""
+        if self.is_identity:
+            return ""
+        parts = []
+        if self.aa_threshold:
+            parts.append(f"t{self.aa_threshold}")
+        if self.offset_px:
+            parts.append(f"{'g' if self.offset_px > 0 else 's'}{abs(self.offset_px)}")
+        if self.dim_percent < 100:
+            parts.append(f"d{self.dim_percent}x{self.dim_depth_px}")
+        return "xy-" + "-".join(parts)
+
+    def summary(self) -> str:
+        """로그용 요약"""
+        if self.is_identity:
+            return "보정 없음"
+        parts = []
+        if self.aa_threshold:
+            parts.append(f"AA 임계값 {self.aa_threshold}")
+        if self.offset_px:
+            parts.append(f"XY {'팽창' if self.offset_px > 0 else '침식'} {abs(self.offset_px)}px")
+        if self.dim_percent < 100:
+            parts.append(f"내부 디밍 {self.dim_percent}% (깊이 {self.dim_depth_px}px)")
+        return ", ".join(parts)
+
+    def apply(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        프레임 보정
+
+        Args:
+            pixels: (height, width) uint8 배열 (변경하지 않음)
+
+        Returns:
+            보정된 (height, width) uint8 배열 (보정 없으면 입력 그대로)
+        """
+        if self.is_identity:
+            return pixels
+
+        if self.aa_threshold:
+            pixels = np.where(pixels >= self.aa_threshold, 255, 0).astype(np.uint8)
+
+        if self.offset_px > 0:
+            pixels = _morph(pixels, self.offset_px, np.maximum)
+        elif self.offset_px < 0:
+            pixels = _morph(pixels, -self.offset_px, np.minimum)
+
+        if self.dim_percent < 100:
+            # 침식 후에도 켜진 픽셀 = 모든 방향으로 depth 픽셀 이상 내부
+            interior = _morph(pixels, self.dim_depth_px, np.minimum) > 0
+            lut = ((np.arange(256, dtype=np.uint16) * self.dim_percent + 50) // 100).astype(np.uint8)
+            pixels = np.where(interior, lut[pixels], pixels)
+
+        return pixels
+
+
+def _morph_step(pixels: np.ndarray, op, square: bool) -> np.ndarray:
+    """3x3 이웃 최대/최소 1회 (square=False면 십자 이웃)"""
+    horizontal = pixels.copy()
+    op(horizontal[:, 1:], pixels[:, :-1], out=horizontal[:, 1:])
+    op(horizontal[:, :-1], pixels[:, 1:], out=horizontal[:, :-1])
+
+    # 정사각: 가로 결과를 세로로 한 번 더 (분리 가능 필터), 십자: 원본 세로 이웃만
+    base = horizontal if square else pixels
+    out = horizontal.copy() if square else horizontal
+    op(out[1:], base[:-1], out=out[1:])
+    op(out[:-1], base[1:], out=out[:-1])
+    return out
+
+
+def _morph(pixels: np.ndarray, radius: int, op) -> np.ndarray:
+    """
+    반경 radius 팽창(np.maximum) / 침식(np.minimum)
+
+    십자와 정사각 이웃을 번갈아 적용하여 원에 가까운 팔각형 구조 요소 근사
+    (프레임 밖은 연산에서 제외되므로 가장자리에 닿은 형상은 바깥쪽에서 침식되지 않음)
+    """
+    for step in range(radius):
+        pixels = _morph_step(pixels, op, square=bool(step % 2))
+    return pixels
+
+
+def transform_frame_bytes(data: bytes, width: int, height: int,
+                          transform: LayerTransform) -> bytes:
+    """
+    프로세스 풀 작업: Grayscale8 픽셀 (패딩 없는 width*height 바이트) 보정
+
+    Returns:
+        보정된 픽셀 바이트 (같은 크기)
+    """
+    pixels = np.frombuffer(data, dtype=np.uint8, count=width * height).reshape(height, width)
+    return np.ascontiguousarray(transform.apply(pixels)).tobytes()
+
+
+# 테스트용
+if __name__ == "__main__":
+    import time
+
+    frame = np.zeros((1080, 1920), dtype=np.uint8)
+    frame[300:700, 500:1400] = 255
+    frame[450:550, 900:1000] = 0
+
+    for transform in (LayerTransform(offset_px=-2),
+                      LayerTransform(offset_px=3, dim_percent=80),
+                      LayerTransform(aa_threshold=128, dim_percent=70, dim_depth_px=16)):
+        start = time.perf_counter()
+        result = transform.apply(frame)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{transform.key():<20} {transform.summary()}: "
+              f"켜진 픽셀 {np.count_nonzero(frame)} → {np.count_nonzero(result)}, "
+              f"최소 밝기 {result[result > 0].min()}, {elapsed:.1f}ms")
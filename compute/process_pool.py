@@ -0,0 +1,25 @@
+"""
+VERICOM DLP 3D Printer - Process Pool
+spawn 작업자 프로세스 풀
+
+spawn 작업자는 부모의 __main__ 스크립트(main.py)를 __mp_main__으로 다시 실행함.
+main.py는 GUI(app.py)를 __main__ 가드 안에서만 import하는 실행 진입점이므로
+작업자는 작업 함수가 있는 compute 모듈만 import (PySide6/하드웨어 비의존).
+fork는 GUI 프로세스의 Qt 스레드 상태를 복제하므로 사용하지 않음.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def spawn_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    spawn 프로세스 풀 생성
+
+    Args:
+        max_workers: 작업자 프로세스 수
+
+    Returns:
+        ProcessPoolExecutor (작업 함수는 compute 패키지 모듈에 있어야 함)
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
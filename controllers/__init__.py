@@ -6,10 +6,18 @@ VERICOM DLP 3D Printer GUI - Controllers Package
 from .motor_controller import MotorController
 from .dlp_controller import DLPController
 from .gcode_parser import GCodeParser, extract_print_parameters
+from .print_archive import PrintArchive
+from .chitu_file import ChituFile
+from .layer_source import open_layer_source
+from .layer_geometry import LayerGeometry
 
 __all__ = [
     'MotorController',
     'DLPController',
     'GCodeParser',
-    'extract_print_parameters'
+    'extract_print_parameters',
+    'PrintArchive',
+    'ChituFile',
+    'open_layer_source',
+    'LayerGeometry'
 ]
@@ -0,0 +1,403 @@
+"""
+VERICOM DLP 3D Printer - ChiTu File Reader
+ChiTuBox 바이너리 형식(.ctb, .photon, .cbddlp 계열 .dlp) 스트리밍 리더
+
+헤더와 레이어 정의 테이블만 읽어 두고, 레이어 RLE 데이터는
+요청 시 해당 위치만 읽어서 디코딩 (파일 전체를 메모리에 올리지 않음)
+"""
+
+import struct
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+
+# 매직 넘버
+MAGIC_PHOTON = 0x12FD0019       # .photon / .cbddlp (1bit RLE, AA는 비트플레인 반복)
+MAGIC_CTB = 0x12FD0086          # .ctb v2~v3 (7bit 그레이 RLE, 선택적 XOR 암호화)
+MAGIC_CTB_ENCRYPTED = 0x12FD0107  # .ctb v4 (헤더 전체 암호화, 지원 안 함)
+
+CHITU_EXTENSIONS = ('.ctb', '.photon', '.cbddlp', '.dlp')
+
+# 헤더 (0x00~0x67)
+_HEADER = struct.Struct('<IIfffIIfffffIIIIIIIIIIIIHHI')
+_HEADER_FIELDS = (
+    'magic', 'version', 'bed_x', 'bed_y', 'bed_z', '_unknown1', '_unknown2',
+    'total_height', 'layer_height', 'exposure', 'bottom_exposure', 'light_off_delay',
+    'bottom_layers', 'resolution_x', 'resolution_y', 'preview_large_offset',
+    'layer_defs_offset', 'layer_count', 'preview_small_offset', 'print_time',
+    'projector_type', 'print_params_offset', 'print_params_size', 'anti_alias',
+    'light_pwm', 'bottom_light_pwm', 'encryption_key',
+)
+
+# 프린트 파라미터 블록 (v2+, 앞부분만 사용)
+_PRINT_PARAMS = struct.Struct('<fffff')  # bottomLiftHeight, bottomLiftSpeed, liftHeight, liftSpeed, retractSpeed
+
+# 레이어 정의 (36바이트): z, exposure, light_off, data_offset, data_size, ...
+_LAYER_DEF = struct.Struct('<fffII16x')
+
+# 미리보기 헤더: width, height, data_offset, data_size
+_PREVIEW = struct.Struct('<IIII')
+
+# CTB 레이어 XOR 키 생성 상수
+_CTB_KEY_MUL = 0x2D83CDAC
+_CTB_KEY_ADD = 0xD8A83423
+_CTB_LAYER_MUL = 0x1E1530CD
+_CTB_LAYER_ADD = 0xEC3D47CD
+
+
+def read_magic(file_path: str) -> int:
+    """파일 앞 4바이트 매직 넘버 (읽기 실패 시 0)"""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read(4)
+    except OSError:
+        return 0
+    return struct.unpack('<I', data)[0] if len(data) == 4 else 0
+
+
+def is_chitu_file(file_path: str) -> bool:
+    """ChiTu 바이너리 형식인지 확인 (확장자가 아닌 매직 넘버 기준)"""
+    return read_magic(file_path) in (MAGIC_PHOTON, MAGIC_CTB, MAGIC_CTB_ENCRYPTED)
+
+
+class ChituFile:
+    """
+    ChiTu 바이너리 슬라이스 파일
+
+    PrintArchive / VLayerStore와 같은 레이어 접근 인터페이스 제공
+    (layer_count, layer_image(), frame_size(), close())
+
+    사용 예:
+        with ChituFile(path) as chitu:
+            image = chitu.layer_image(0)
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: .ctb / .photon / .dlp 파일 경로
+
+        Raises:
+            ValueError: 지원하지 않는 형식/버전인 경우
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.path = file_path
+        self._file = open(file_path, 'rb')
+        # 선읽기 스레드와 워커 스레드가 같은 파일 핸들을 공유하므로 seek+read 보호
+        self._lock = threading.Lock()
+
+        try:
+            self._read_header()
+            self._read_layer_defs()
+        except Exception:
+            self.close()
+            raise
+
+    # ==================== 헤더 ====================
+
+    def _read_header(self):
+        """헤더 + 프린트 파라미터 블록 읽기"""
+        data = self._file.read(_HEADER.size)
+        if len(data) < _HEADER.size:
+            raise ValueError("ChiTu 헤더가 잘렸습니다")
+
+        header = dict(zip(_HEADER_FIELDS, _HEADER.unpack(data)))
+        magic = header['magic']
+        if magic == MAGIC_CTB_ENCRYPTED:
+            raise ValueError("암호화된 CTB v4 파일은 지원하지 않습니다")
+        if magic not in (MAGIC_PHOTON, MAGIC_CTB):
+            raise ValueError("ChiTu 파일 형식이 아닙니다")
+
+        # Photon/CBDDLP는 0x64 이후가 암호화 키가 아님
+        if magic == MAGIC_PHOTON:
+            header['encryption_key'] = 0
+
+        self.header = header
+        self.is_ctb = magic == MAGIC_CTB
+        self.width = header['resolution_x']
+        self.height = header['resolution_y']
+        self.anti_alias = max(1, header['anti_alias']) if header['version'] >= 2 else 1
+
+        # v2+ 리프트 파라미터
+        self.lift = {}
+        offset, size = header['print_params_offset'], header['print_params_size']
+        if header['version'] >= 2 and offset and size >= _PRINT_PARAMS.size:
+            raw = self._read_at(offset, _PRINT_PARAMS.size)
+            (self.lift['bottom_lift_height'], self.lift['bottom_lift_speed'],
+             self.lift['lift_height'], self.lift['lift_speed'],
+             self.lift['retract_speed']) = _PRINT_PARAMS.unpack(raw)
+
+    def _read_layer_defs(self):
+        """레이어 정의 테이블 읽기 (Photon AA는 레벨별 테이블 반복)"""
+        count = self.header['layer_count']
+        # CTB의 안티앨리어싱은 그레이 RLE로 처리되므로 테이블 1세트
+        levels = 1 if self.is_ctb else self.anti_alias
+
+        raw = self._read_at(self.header['layer_defs_offset'], _LAYER_DEF.size * count * levels)
+        if len(raw) < _LAYER_DEF.size * count * levels:
+            raise ValueError("레이어 정의 테이블이 잘렸습니다")
+
+        # _layers[idx] = [(z, exposure, light_off, offset, size), ...] (AA 레벨별)
+        self._layers: List[List[Tuple[float, float, float, int, int]]] = [
+            [_LAYER_DEF.unpack_from(raw, (level * count + idx) * _LAYER_DEF.size)
+             for level in range(levels)]
+            for idx in range(count)
+        ]
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        """지정 위치에서 읽기"""
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    # ==================== 정보 ====================
+
+    @property
+    def layer_count(self) -> int:
+        """레이어 개수"""
+        return len(self._layers)
+
+    def frame_size(self) -> Tuple[int, int]:
+        """레이어 해상도 (width, height)"""
+        return self.width, self.height
+
+    def print_parameters(self) -> Dict[str, Any]:
+        """PrintParameters 필드 이름으로 변환한 파라미터"""
+        h = self.header
+        params = {
+            'totalLayer': h['layer_count'],
+            'layerHeight': round(h['layer_height'], 4),
+            'estimatedPrintTime': float(h['print_time']),
+            'bottomLayerCount': h['bottom_layers'],
+            'bottomLayerExposureTime': round(h['bottom_exposure'], 3),
+            'normalExposureTime': round(h['exposure'], 3),
+            'resolutionX': self.width,
+            'resolutionY': self.height,
+            'machineX': round(h['bed_x'], 3),
+            'machineY': round(h['bed_y'], 3),
+        }
+        if self.lift:
+            params.update({
+                'bottomLayerLiftHeight': round(self.lift['bottom_lift_height'], 3),
+                'bottomLayerLiftSpeed': int(self.lift['bottom_lift_speed']),
+                'normalLayerLiftHeight': round(self.lift['lift_height'], 3),
+                'normalLayerLiftSpeed': int(self.lift['lift_speed']),
+                'normalDropSpeed': int(self.lift['retract_speed']),
+            })
+        return params
+
+    def data_end(self) -> int:
+        """레이어 데이터가 끝나는 최대 파일 오프셋 (잘린 파일 검사용)"""
+        return max((offset + size for defs in self._layers for _, _, _, offset, size in defs),
+                   default=0)
+
+    def machine_size(self) -> Tuple[float, float, float]:
+        """빌드 영역 (bed_x, bed_y, bed_z) mm"""
+        return self.header['bed_x'], self.header['bed_y'], self.header['bed_z']
+
+    # ==================== 레이어 접근 ====================
+
+    def layer_image(self, layer_index: int) -> Optional[QImage]:
+        """
+        레이어 프레임 디코딩 (Grayscale8)
+
+        Args:
+            layer_index: 레이어 인덱스 (0부터 시작)
+
+        Returns:
+            QImage 또는 None (범위 초과)
+
+        Raises:
+            ValueError: RLE 데이터가 손상된 경우
+        """
+        if not 0 <= layer_index < len(self._layers):
+            print(f"[ChiTu] 레이어 인덱스 범위 초과: {layer_index} (총 {len(self._layers)}개)")
+            return None
+
+        pixel_count = self.width * self.height
+        if self.is_ctb:
+            _, _, _, offset, size = self._layers[layer_index][0]
+            data = self._read_at(offset, size)
+            key = self.header['encryption_key']
+            if key:
+                data = _ctb_decrypt(data, key, layer_index)
+            pixels = _decode_ctb_rle(data, pixel_count)
+        else:
+            # AA 레벨별 1bit 평면을 합산하여 그레이 값 생성
+            levels = len(self._layers[layer_index])
+            total = np.zeros(pixel_count, dtype=np.uint16)
+            for _, _, _, offset, size in self._layers[layer_index]:
+                total += _decode_photon_rle(self._read_at(offset, size), pixel_count)
+            pixels = (total * 255 // levels).astype(np.uint8)
+
+        image = QImage(self.width, self.height, QImage.Format_Grayscale8)
+        bytes_per_line = image.bytesPerLine()
+        target = np.frombuffer(image.bits(), dtype=np.uint8, count=bytes_per_line * self.height)
+        target.reshape(self.height, bytes_per_line)[:, :self.width] = pixels.reshape(self.height, self.width)
+        return image
+
+    def preview_image(self) -> Optional[QImage]:
+        """미리보기 이미지 (큰 미리보기 우선, RGB565 RLE)"""
+        for offset in (self.header['preview_large_offset'], self.header['preview_small_offset']):
+            if not offset:
+                continue
+            try:
+                width, height, data_offset, data_size = _PREVIEW.unpack(
+                    self._read_at(offset, _PREVIEW.size)
+                )
+                if width and height and data_size:
+                    return _decode_preview(self._read_at(data_offset, data_size), width, height)
+            except Exception as e:
+                print(f"[ChiTu] 미리보기 디코딩 오류: {e}")
+        return None
+
+    # ==================== 수명 관리 ====================
+
+    def close(self):
+        """파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def is_closed(self) -> bool:
+        return self._file is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+# ==================== 디코더 ====================
+
+def _decode_photon_rle(data: bytes, pixel_count: int) -> np.ndarray:
+    """
+    Photon/CBDDLP 1bit RLE → 0/1 배열
+
+    바이트당 1런: bit7 = 색(1=흰색), bit0~6 = 길이. 바이트마다 독립이므로 완전 벡터화.
+    """
+    runs = np.frombuffer(data, dtype=np.uint8)
+    pixels = np.repeat(runs >> 7, runs & 0x7F)
+    return _fit(pixels, pixel_count)
+
+
+def _decode_ctb_rle(data: bytes, pixel_count: int) -> np.ndarray:
+    """
+    CTB 7bit 그레이 RLE → uint8 배열
+
+    bit7이 켜진 바이트 뒤에는 1~4바이트 가변 길이 런이 따라옴.
+    런 파싱은 순차적이지만 런 수가 적으므로 (값, 길이)만 모은 뒤 np.repeat로 전개.
+    """
+    values = []
+    lengths = []
+    n = len(data)
+    i = 0
+    while i < n:
+        code = data[i]
+        i += 1
+        length = 1
+        if code & 0x80:
+            code &= 0x7F
+            if i >= n:
+                raise ValueError("CTB RLE 런 길이가 잘렸습니다")
+            s = data[i]
+            if s & 0x80 == 0:
+                length = s
+                i += 1
+            elif s & 0xC0 == 0x80:
+                length = ((s & 0x3F) << 8) | data[i + 1]
+                i += 2
+            elif s & 0xE0 == 0xC0:
+                length = ((s & 0x1F) << 16) | (data[i + 1] << 8) | data[i + 2]
+                i += 3
+            elif s & 0xF0 == 0xE0:
+                length = ((s & 0x0F) << 24) | (data[i + 1] << 16) | (data[i + 2] << 8) | data[i + 3]
+                i += 4
+            else:
+                raise ValueError("CTB RLE 런 길이 인코딩 오류")
+        # 7bit → 8bit (0x7F → 0xFF)
+        values.append((code << 1) | (code & 1))
+        lengths.append(length)
+
+    pixels = np.repeat(np.array(values, dtype=np.uint8), np.array(lengths, dtype=np.int64))
+    return _fit(pixels, pixel_count)
+
+
+def _ctb_decrypt(data: bytes, seed: int, layer_index: int) -> bytes:
+    """CTB 레이어 XOR 복호화 (4바이트마다 키 증가, 벡터화)"""
+    init = (seed * _CTB_KEY_MUL + _CTB_KEY_ADD) & 0xFFFFFFFF
+    key = ((layer_index * _CTB_LAYER_MUL + _CTB_LAYER_ADD) * init) & 0xFFFFFFFF
+
+    words = (len(data) + 3) // 4
+    keys = (key + init * np.arange(words, dtype=np.uint64)) & 0xFFFFFFFF
+    stream = keys.astype('<u4').view(np.uint8)[:len(data)]
+    return (np.frombuffer(data, dtype=np.uint8) ^ stream).tobytes()
+
+
+def _fit(pixels: np.ndarray, pixel_count: int) -> np.ndarray:
+    """디코딩 결과를 프레임 크기에 맞춤 (짧으면 검은색 채움)"""
+    if pixels.size > pixel_count:
+        raise ValueError(f"RLE 픽셀 수 초과: {pixels.size} (최대 {pixel_count})")
+    if pixels.size < pixel_count:
+        pixels = np.concatenate((pixels, np.zeros(pixel_count - pixels.size, dtype=pixels.dtype)))
+    return pixels
+
+
+def _decode_preview(data: bytes, width: int, height: int) -> QImage:
+    """ChiTu 미리보기 RGB565 RLE → QImage (RGB888)"""
+    words = np.frombuffer(data[:len(data) - len(data) % 2], dtype='<u2')
+    colors = []
+    lengths = []
+    i = 0
+    n = len(words)
+    while i < n:
+        dot = int(words[i])
+        i += 1
+        repeat = 1
+        if dot & 0x0020 and i < n:
+            repeat += int(words[i]) & 0x0FFF
+            i += 1
+        colors.append(dot)
+        lengths.append(repeat)
+
+    dots = np.repeat(np.array(colors, dtype=np.uint16), np.array(lengths, dtype=np.int64))
+    dots = _fit(dots, width * height)
+
+    rgb = np.empty((width * height, 3), dtype=np.uint8)
+    rgb[:, 0] = ((dots >> 11) & 0x1F) << 3
+    rgb[:, 1] = ((dots >> 6) & 0x1F) << 3
+    rgb[:, 2] = (dots & 0x1F) << 3
+
+    image = QImage(width, height, QImage.Format_RGB888)
+    bytes_per_line = image.bytesPerLine()
+    target = np.frombuffer(image.bits(), dtype=np.uint8, count=bytes_per_line * height)
+    target.reshape(height, bytes_per_line)[:, :width * 3] = rgb.reshape(height, width * 3)
+    return image
+
+
+# 테스트용
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("사용법: python chitu_file.py <file.ctb|.photon|.dlp>")
+        sys.exit(1)
+
+    with ChituFile(sys.argv[1]) as chitu:
+        print(f"형식: {'CTB' if chitu.is_ctb else 'Photon'} v{chitu.header['version']}, "
+              f"AA {chitu.anti_alias}, 암호화 {'ON' if chitu.header['encryption_key'] else 'OFF'}")
+        print(f"해상도: {chitu.width}x{chitu.height}, 빌드 영역: {chitu.machine_size()}")
+        for key, value in chitu.print_parameters().items():
+            print(f"  {key}: {value}")
+
+        start = time.monotonic()
+        image = chitu.layer_image(min(10, chitu.layer_count - 1))
+        print(f"레이어 디코딩: {(time.monotonic() - start) * 1000:.1f}ms ({image.width()}x{image.height()})")
@@ -1,13 +1,28 @@
 """
 VERICOM DLP 3D Printer - G-code Parser
 ZIP 파일 내 run.gcode에서 프린트 파라미터 추출
+(ChiTu 바이너리 형식은 헤더에서 추출)
 """
 
+import io
 import os
 import re
 import zipfile
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterable, Optional
+from dataclasses import dataclass, asdict, field
+
+try:
+    from controllers.print_archive import PrintArchive, is_layer_name, THUMBNAIL_NAMES
+    from controllers.chitu_file import ChituFile, is_chitu_file
+except ImportError:
+    from .print_archive import PrintArchive, is_layer_name, THUMBNAIL_NAMES
+    from .chitu_file import ChituFile, is_chitu_file
+
+
+# 머신 사양 (ChiTu 헤더 검증용, run.gcode는 validate_zip_file의 문자열 검사 사용)
+MACHINE_RESOLUTION = (1920, 1080)
+MACHINE_SIZE = (124.8, 70.2, 80.0)  # mm
+MACHINE_SIZE_TOLERANCE = 0.05  # mm (float 저장 오차)
 
 
 @dataclass
@@ -36,11 +51,32 @@ class PrintParameters:
     # 빌드 정보
     resolutionX: int = 1440
     resolutionY: int = 2560
+    machineX: float = 124.8   # 노광 영역 폭 (mm)
+    machineY: float = 70.2    # 노광 영역 높이 (mm)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
+# 필수 머신 설정 (run.gcode 헤더 값이 이 문자열로 시작해야 함)
+REQUIRED_MACHINE_HEADERS = {
+    'resolutionX': '1920',
+    'resolutionY': '1080',
+    'machineX': '124.8',
+    'machineY': '70.2',
+    'machineZ': '80',
+}
+
+
+@dataclass
+class GCodeHeader:
+    """run.gcode 헤더 (;key:value 원문 값 + 블레이드 속도)"""
+    values: Dict[str, str] = field(default_factory=dict)
+    blade_speed: Optional[int] = None
+    lines_read: int = 0        # 읽은 줄 수 (헤더만 읽고 멈췄는지 확인용)
+    full_scan: bool = False    # 헤더에 없는 필드 때문에 본문까지 읽었는지
+
+
 class GCodeParser:
     """
     G-code 파서 클래스
@@ -48,59 +84,149 @@ class GCodeParser:
     ZIP 파일 내 run.gcode 분석하여 프린트 파라미터 추출
     """
 
-    # G-code 주석에서 파라미터 추출용 정규식 패턴
-    PATTERNS = {
-        'totalLayer': r';totalLayer:(\d+)',
-        'layerHeight': r';layerHeight:([\d.]+)',
-        'estimatedPrintTime': r';estimatedPrintTime:([\d.]+)',
-        'bottomLayerCount': r';bottomLayerCount:(\d+)',
-        'bottomLayerExposureTime': r';bottomLayerExposureTime:([\d.]+)',
-        'bottomLayerLiftHeight': r';bottomLayerLiftHeight:([\d.]+)',
-        'bottomLayerLiftSpeed': r';bottomLayerLiftSpeed:([\d.]+)',
-        'normalExposureTime': r';normalExposureTime:([\d.]+)',
-        'normalLayerLiftHeight': r';normalLayerLiftHeight:([\d.]+)',
-        'normalLayerLiftSpeed': r';normalLayerLiftSpeed:([\d.]+)',
-        'normalDropSpeed': r';normalDropSpeed:([\d.]+)',
-        'resolutionX': r';resolutionX:(\d+)',
-        'resolutionY': r';resolutionY:(\d+)',
-    }
+    # run.gcode 헤더에서 읽는 파라미터 (;이름:값)
+    HEADER_FIELDS = (
+        'totalLayer', 'layerHeight', 'estimatedPrintTime',
+        'bottomLayerCount', 'bottomLayerExposureTime',
+        'bottomLayerLiftHeight', 'bottomLayerLiftSpeed',
+        'normalExposureTime', 'normalLayerLiftHeight',
+        'normalLayerLiftSpeed', 'normalDropSpeed',
+        'resolutionX', 'resolutionY', 'machineX', 'machineY',
+    )
+
+    # 헤더 한 줄 (;key:value) — 모든 필드를 정규식 1개로
+    HEADER_PATTERN = re.compile(r'^;(\w+):(.*)$')
+
+    # 헤더 값의 숫자 부분
+    NUMBER_PATTERN = re.compile(r'[\d.]+')
 
     # 블레이드 속도 추출용 (G0 X... F{speed})
-    BLADE_SPEED_PATTERN = r'G0\s+X[\d.]+\s+F(\d+)'
+    BLADE_SPEED_PATTERN = re.compile(r'G0\s+X[\d.]+\s+F(\d+)')
+
+    # 블레이드 속도는 헤더 필드가 아니므로 헤더 이후 이 줄 수까지만 찾음 (없으면 기본값)
+    BLADE_SPEED_SCAN_LINES = 1000
 
     @staticmethod
-    def parse_gcode_content(content: str) -> PrintParameters:
+    def scan_header(lines: Iterable[str]) -> GCodeHeader:
         """
-        G-code 내용에서 파라미터 추출
+        G-code 헤더 스트리밍 파싱
+
+        선두 주석 블록의 ;key:value를 한 번에 수집하고, 헤더가 끝난 뒤에는
+        빠진 헤더 필드가 있을 때만 그 필드를 찾을 때까지 계속 읽음.
+        블레이드 속도(G0 X… F)는 헤더 이후 BLADE_SPEED_SCAN_LINES줄 안에서만 찾음.
 
         Args:
-            content: run.gcode 파일 내용
+            lines: run.gcode 줄 반복자 (스트림이면 필요한 만큼만 읽음)
 
         Returns:
-            PrintParameters 객체
+            GCodeHeader 객체
         """
-        params = PrintParameters()
+        header = GCodeHeader()
+        wanted = set(GCodeParser.HEADER_FIELDS) | set(REQUIRED_MACHINE_HEADERS)
+        missing = set(wanted)
+        in_header = True
+        header_end = 0
+
+        for line in lines:
+            header.lines_read += 1
+            line = line.strip()
+            if not line:
+                continue
+
+            if line[0] == ';':
+                match = GCodeParser.HEADER_PATTERN.match(line)
+                if match:
+                    key = match.group(1)
+                    # 헤더 블록은 전부 수집, 이후에는 빠진 필드만 (첫 값 우선)
+                    if (in_header or key in missing) and key not in header.values:
+                        header.values[key] = match.group(2).strip()
+                        missing.discard(key)
+            else:
+                if in_header and header.values:
+                    in_header = False  # 헤더 블록 끝
+                    header_end = header.lines_read
+                if header.blade_speed is None and line.startswith('G0'):
+                    blade_match = GCodeParser.BLADE_SPEED_PATTERN.search(line)
+                    if blade_match:
+                        header.blade_speed = int(blade_match.group(1))
+
+            if not in_header:
+                blade_done = (header.blade_speed is not None or
+                              header.lines_read - header_end >= GCodeParser.BLADE_SPEED_SCAN_LINES)
+                if not missing and blade_done:
+                    break
+                if missing:
+                    header.full_scan = True
+
+        return header
+
+    @staticmethod
+    def read_zip_header(z: zipfile.ZipFile, gcode_name: str) -> GCodeHeader:
+        """ZIP 안의 run.gcode를 압축 해제하면서 헤더만 읽음 (전체를 메모리에 올리지 않음)"""
+        with z.open(gcode_name) as raw:
+            stream = io.TextIOWrapper(raw, encoding='utf-8', errors='ignore', newline='')
+            return GCodeParser.scan_header(stream)
 
-        # 각 패턴으로 파라미터 추출
-        for param_name, pattern in GCodeParser.PATTERNS.items():
-            match = re.search(pattern, content)
-            if match:
-                value = match.group(1)
+    @staticmethod
+    def params_from_header(header: GCodeHeader) -> PrintParameters:
+        """헤더 값 → PrintParameters (필드 타입에 맞게 변환, 없는 값은 기본값)"""
+        params = PrintParameters()
 
+        for param_name in GCodeParser.HEADER_FIELDS:
+            value = header.values.get(param_name)
+            match = GCodeParser.NUMBER_PATTERN.match(value) if value else None
+            if not match:
+                continue
+            try:
                 # 타입에 맞게 변환
                 current_value = getattr(params, param_name)
                 if isinstance(current_value, int):
-                    setattr(params, param_name, int(float(value)))
+                    setattr(params, param_name, int(float(match.group(0))))
                 elif isinstance(current_value, float):
-                    setattr(params, param_name, float(value))
+                    setattr(params, param_name, float(match.group(0)))
+            except ValueError:
+                continue
 
-        # 블레이드 속도 추출 (G0 X... F{speed} 명령에서)
-        blade_match = re.search(GCodeParser.BLADE_SPEED_PATTERN, content)
-        if blade_match:
-            params.blade_speed = int(blade_match.group(1))
+        if header.blade_speed is not None:
+            params.blade_speed = header.blade_speed
 
         return params
 
+    @staticmethod
+    def parse_gcode_content(content: str) -> PrintParameters:
+        """
+        G-code 내용에서 파라미터 추출
+
+        Args:
+            content: run.gcode 파일 내용
+
+        Returns:
+            PrintParameters 객체
+        """
+        return GCodeParser.params_from_header(GCodeParser.scan_header(content.splitlines()))
+
+    @staticmethod
+    def parse_zip_contents(namelist: list, header: Optional[GCodeHeader]) -> PrintParameters:
+        """
+        이미 읽은 ZIP 목록/run.gcode 헤더에서 파라미터 추출 (파일을 다시 열지 않음)
+
+        Args:
+            namelist: ZIP 엔트리 이름 목록
+            header: run.gcode 헤더 (없으면 None)
+
+        Returns:
+            PrintParameters 객체 (totalLayer는 레이어 PNG 개수 우선)
+        """
+        # PNG 파일 개수 카운트 (레이어 수)
+        # 썸네일 제외, 숫자 포함된 PNG만 카운트
+        png_count = sum(1 for name in namelist if is_layer_name(name))
+
+        params = GCodeParser.params_from_header(header) if header is not None else PrintParameters()
+        if png_count > 0:
+            params.totalLayer = png_count  # PNG 카운트 우선
+            print(f"[Parser] PNG 파일 발견: {png_count}개")
+        return params
+
     @staticmethod
     def parse_zip_file(zip_path: str) -> PrintParameters:
         """
@@ -117,50 +243,11 @@ class GCodeParser:
         try:
             with zipfile.ZipFile(zip_path, 'r') as z:
                 namelist = z.namelist()
-
-                # PNG 파일 개수 카운트 (레이어 수)
-                # 썸네일 제외, 숫자 포함된 PNG만 카운트
-                png_files = []
-                thumbnail_names = ['preview_cropping.png', 'preview.png', 'thumbnail.png']
-
-                for name in namelist:
-                    if not name.lower().endswith('.png'):
-                        continue
-
-                    filename = os.path.basename(name)
-
-                    # 썸네일 제외
-                    if filename.lower() in [t.lower() for t in thumbnail_names]:
-                        continue
-
-                    # 숫자가 포함된 PNG 파일 (1.png, 001.png, layer_1.png 등)
-                    if re.search(r'\d+', filename):
-                        png_files.append(name)
-
-                print(f"[Parser] ZIP 내 파일 목록: {namelist[:10]}...")
-                print(f"[Parser] 레이어 이미지 후보: {png_files[:5]}...")
-
-                if png_files:
-                    params.totalLayer = len(png_files)
-                    print(f"[Parser] PNG 파일 발견: {len(png_files)}개")
-
-                # run.gcode 파일 찾기
-                gcode_file = None
-                for name in namelist:
-                    if name.lower() == 'run.gcode':
-                        gcode_file = name
-                        break
+                gcode_file = find_gcode_name(namelist)
+                header = GCodeParser.read_zip_header(z, gcode_file) if gcode_file else None
+                params = GCodeParser.parse_zip_contents(namelist, header)
 
                 if gcode_file:
-                    content = z.read(gcode_file).decode('utf-8', errors='ignore')
-                    gcode_params = GCodeParser.parse_gcode_content(content)
-
-                    # run.gcode에서 추출한 값으로 업데이트 (totalLayer는 PNG 카운트 우선)
-                    png_count = params.totalLayer
-                    params = gcode_params
-                    if png_count > 0:
-                        params.totalLayer = png_count  # PNG 카운트 우선
-
                     print(f"[Parser] run.gcode 파싱 완료: {zip_path}")
                 else:
                     print(f"[Parser] run.gcode 파일 없음: {zip_path}")
@@ -173,8 +260,32 @@ class GCodeParser:
         print(f"[Parser] 최종 totalLayer: {params.totalLayer}")
         return params
 
+    @staticmethod
+    def parse_chitu_file(file_path: str) -> PrintParameters:
+        """
+        ChiTu 바이너리 파일(.ctb/.photon/.dlp) 헤더에서 프린트 파라미터 추출
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            PrintParameters 객체
+        """
+        params = PrintParameters()
+
+        try:
+            with ChituFile(file_path) as chitu:
+                for key, value in chitu.print_parameters().items():
+                    setattr(params, key, value)
+            print(f"[Parser] ChiTu 헤더 파싱 완료: {file_path}")
+        except Exception as e:
+            print(f"[Parser] ChiTu 파싱 오류: {e}")
+
+        print(f"[Parser] 최종 totalLayer: {params.totalLayer}")
+        return params
+
     # 썸네일 파일명 (제외 대상)
-    THUMBNAIL_NAMES = ['preview_cropping.png', 'preview.png', 'thumbnail.png']
+    THUMBNAIL_NAMES = list(THUMBNAIL_NAMES)
 
     @staticmethod
     def get_layer_images(zip_path: str) -> list:
@@ -187,36 +298,13 @@ class GCodeParser:
         Returns:
             레이어 이미지 파일명 리스트 (정렬됨)
         """
-        images = []
-
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                for name in z.namelist():
-                    if not name.lower().endswith('.png'):
-                        continue
-
-                    # 파일명만 추출
-                    filename = os.path.basename(name)
-
-                    # 썸네일 제외
-                    if filename.lower() in [t.lower() for t in GCodeParser.THUMBNAIL_NAMES]:
-                        continue
-
-                    # 파일명에 숫자가 포함되어 있으면 레이어 이미지
-                    if re.search(r'\d+', filename):
-                        images.append(name)
-
+            with PrintArchive(zip_path) as archive:
+                return archive.layer_names()
         except Exception as e:
             print(f"[Parser] 이미지 목록 추출 오류: {e}")
 
-        # 숫자 기준 정렬 (파일명에서 숫자 추출)
-        def sort_key(name):
-            filename = os.path.basename(name)
-            match = re.search(r'(\d+)', filename)
-            return int(match.group(1)) if match else 0
-
-        images.sort(key=sort_key)
-        return images
+        return []
 
     @staticmethod
     def get_preview_image(zip_path: str) -> Optional[bytes]:
@@ -250,28 +338,28 @@ class GCodeParser:
         return None
 
     @staticmethod
-    def get_layer_image(zip_path: str, layer_index: int) -> Optional[bytes]:
+    def get_layer_image(zip_path: str, layer_index: int,
+                        archive: Optional[PrintArchive] = None) -> Optional[bytes]:
         """
         특정 레이어 이미지 추출
 
+        프린트 중에는 이미 열린 PrintArchive를 넘겨 ZIP 재오픈과
+        레이어 목록 재스캔을 피함 (O(1) 조회)
+
         Args:
             zip_path: ZIP 파일 경로
             layer_index: 레이어 인덱스 (0부터 시작)
+            archive: 열린 PrintArchive (None이면 한 번 열어서 조회)
 
         Returns:
             이미지 바이트 데이터 또는 None
         """
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                # 이미지 목록 가져와서 인덱스로 접근 (참고 파일 방식)
-                images = GCodeParser.get_layer_images(zip_path)
+            if archive is not None:
+                return archive.layer_bytes(layer_index)
 
-                if 0 <= layer_index < len(images):
-                    image_name = images[layer_index]
-                    print(f"[Parser] 레이어 {layer_index} 이미지: {image_name}")
-                    return z.read(image_name)
-                else:
-                    print(f"[Parser] 레이어 인덱스 범위 초과: {layer_index} (총 {len(images)}개)")
+            with PrintArchive(zip_path) as temp_archive:
+                return temp_archive.layer_bytes(layer_index)
 
         except Exception as e:
             print(f"[Parser] 레이어 이미지 추출 오류: {e}")
@@ -281,15 +369,20 @@ class GCodeParser:
 
 def extract_print_parameters(zip_path: str) -> Dict[str, Any]:
     """
-    편의 함수: ZIP 파일에서 프린트 파라미터 추출 (딕셔너리 반환)
+    편의 함수: 프린트 파일에서 프린트 파라미터 추출 (딕셔너리 반환)
+
+    ChiTu 바이너리 형식이면 헤더에서, 그 외에는 ZIP의 run.gcode에서 추출
 
     Args:
-        zip_path: ZIP 파일 경로
+        zip_path: ZIP 또는 ChiTu 파일 경로
 
     Returns:
         파라미터 딕셔너리
     """
-    params = GCodeParser.parse_zip_file(zip_path)
+    if is_chitu_file(zip_path):
+        params = GCodeParser.parse_chitu_file(zip_path)
+    else:
+        params = GCodeParser.parse_zip_file(zip_path)
     return params.to_dict()
 
 
@@ -300,6 +393,61 @@ class ZipValidationResult:
     error_message: str = ""
 
 
+def find_gcode_name(namelist: list) -> Optional[str]:
+    """ZIP 엔트리 중 run.gcode 이름 (대소문자 무시, 없으면 None)"""
+    for name in namelist:
+        if name.lower() == 'run.gcode':
+            return name
+    return None
+
+
+def check_zip_contents(namelist: list, header: Optional[GCodeHeader]) -> ZipValidationResult:
+    """
+    이미 읽은 ZIP 목록/run.gcode 헤더 검증 (파일을 다시 열지 않음)
+
+    Args:
+        namelist: ZIP 엔트리 이름 목록
+        header: run.gcode 헤더 (없으면 None)
+    """
+    # 1. run.gcode 파일 존재 확인
+    if header is None:
+        return ZipValidationResult(False, "run.gcode 파일이 없습니다")
+
+    # 2. run.gcode 헤더에 필수 머신 설정 확인
+    for key, expected in REQUIRED_MACHINE_HEADERS.items():
+        if not header.values.get(key, "").startswith(expected):
+            return ZipValidationResult(False, "지원하지 않는 프린터 파일입니다")
+
+    # 3. preview_cropping.png, preview.png 존재 확인
+    namelist_lower = [name.lower() for name in namelist]
+    if 'preview_cropping.png' not in namelist_lower:
+        return ZipValidationResult(False, "미리보기 이미지가 없습니다")
+    if 'preview.png' not in namelist_lower:
+        return ZipValidationResult(False, "미리보기 이미지가 없습니다")
+
+    # 4. 숫자.png 파일들 연속성 확인
+    layer_numbers = []
+    for name in namelist:
+        filename = os.path.basename(name).lower()
+        # 숫자.png 패턴 (예: 1.png, 2.png, 001.png)
+        match = re.match(r'^(\d+)\.png$', filename)
+        if match:
+            layer_numbers.append(int(match.group(1)))
+
+    if not layer_numbers:
+        return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
+
+    # 정렬 후 연속성 확인
+    layer_numbers.sort()
+    expected_start = layer_numbers[0]
+    for i, num in enumerate(layer_numbers):
+        if num != expected_start + i:
+            return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
+
+    # 모든 검증 통과
+    return ZipValidationResult(True, "")
+
+
 def validate_zip_file(zip_path: str) -> ZipValidationResult:
     """
     ZIP 파일 유효성 검증
@@ -316,70 +464,81 @@ def validate_zip_file(zip_path: str) -> ZipValidationResult:
     Returns:
         ZipValidationResult 객체
     """
-    # 필수 머신 설정
-    REQUIRED_MACHINE_SETTINGS = [
-        ";resolutionX:1920",
-        ";resolutionY:1080",
-        ";machineX:124.8",
-        ";machineY:70.2",
-        ";machineZ:80",
-    ]
-
     try:
         with zipfile.ZipFile(zip_path, 'r') as z:
             namelist = z.namelist()
+            gcode_file = find_gcode_name(namelist)
+            header = GCodeParser.read_zip_header(z, gcode_file) if gcode_file else None
+            return check_zip_contents(namelist, header)
 
-            # 1. run.gcode 파일 존재 확인
-            gcode_file = None
-            for name in namelist:
-                if name.lower() == 'run.gcode':
-                    gcode_file = name
-                    break
+    except zipfile.BadZipFile:
+        return ZipValidationResult(False, "ZIP 파일이 손상되었습니다")
+    except Exception as e:
+        print(f"[Parser] ZIP 검증 오류: {e}")
+        return ZipValidationResult(False, "ZIP 파일을 읽을 수 없습니다")
 
-            if not gcode_file:
-                return ZipValidationResult(False, "run.gcode 파일이 없습니다")
-
-            # 2. run.gcode 내용에 필수 머신 설정 확인
-            content = z.read(gcode_file).decode('utf-8', errors='ignore')
-
-            for setting in REQUIRED_MACHINE_SETTINGS:
-                if setting not in content:
-                    return ZipValidationResult(False, "지원하지 않는 프린터 파일입니다")
-
-            # 3. preview_cropping.png, preview.png 존재 확인
-            namelist_lower = [name.lower() for name in namelist]
-            if 'preview_cropping.png' not in namelist_lower:
-                return ZipValidationResult(False, "미리보기 이미지가 없습니다")
-            if 'preview.png' not in namelist_lower:
-                return ZipValidationResult(False, "미리보기 이미지가 없습니다")
-
-            # 4. 숫자.png 파일들 연속성 확인
-            layer_numbers = []
-            for name in namelist:
-                filename = os.path.basename(name).lower()
-                # 숫자.png 패턴 (예: 1.png, 2.png, 001.png)
-                match = re.match(r'^(\d+)\.png$', filename)
-                if match:
-                    layer_numbers.append(int(match.group(1)))
 
-            if not layer_numbers:
-                return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
+def check_chitu_header(chitu: ChituFile, file_size: int) -> ZipValidationResult:
+    """이미 연 ChiTu 파일 헤더 검증 (파일을 다시 열지 않음)"""
+    if chitu.frame_size() != MACHINE_RESOLUTION:
+        return ZipValidationResult(False, "지원하지 않는 프린터 파일입니다")
 
-            # 정렬 후 연속성 확인
-            layer_numbers.sort()
-            expected_start = layer_numbers[0]
-            for i, num in enumerate(layer_numbers):
-                if num != expected_start + i:
-                    return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
+    for actual, expected in zip(chitu.machine_size(), MACHINE_SIZE):
+        if abs(actual - expected) > MACHINE_SIZE_TOLERANCE:
+            return ZipValidationResult(False, "지원하지 않는 프린터 파일입니다")
 
-            # 모든 검증 통과
-            return ZipValidationResult(True, "")
+    if chitu.layer_count == 0:
+        return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
 
-    except zipfile.BadZipFile:
-        return ZipValidationResult(False, "ZIP 파일이 손상되었습니다")
+    if chitu.data_end() > file_size:
+        return ZipValidationResult(False, "레이어 이미지가 손상되었습니다")
+
+    return ZipValidationResult(True, "")
+
+
+def validate_chitu_file(file_path: str) -> ZipValidationResult:
+    """
+    ChiTu 바이너리 파일 유효성 검증
+
+    검증 조건:
+    1. 지원하는 형식/버전 (암호화된 CTB v4 제외)
+    2. 해상도/빌드 영역이 머신 사양과 일치
+    3. 레이어 정의가 파일 범위 안에 존재
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        ZipValidationResult 객체
+    """
+    try:
+        with ChituFile(file_path) as chitu:
+            return check_chitu_header(chitu, os.path.getsize(file_path))
+
+    except ValueError as e:
+        return ZipValidationResult(False, str(e))
     except Exception as e:
-        print(f"[Parser] ZIP 검증 오류: {e}")
-        return ZipValidationResult(False, "ZIP 파일을 읽을 수 없습니다")
+        print(f"[Parser] ChiTu 검증 오류: {e}")
+        return ZipValidationResult(False, "파일을 읽을 수 없습니다")
+
+
+def validate_print_file(file_path: str) -> ZipValidationResult:
+    """
+    프린트 파일 유효성 검증 (형식별 분기)
+
+    .dlp는 ZIP이면 ZIP으로, ChiTu 매직이면 바이너리로 처리
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        ZipValidationResult 객체
+    """
+    if is_chitu_file(file_path):
+        return validate_chitu_file(file_path)
+    if zipfile.is_zipfile(file_path):
+        return validate_zip_file(file_path)
+    return ZipValidationResult(False, "지원하지 않는 파일 형식입니다")
 
 
 # 테스트용
@@ -0,0 +1,194 @@
+"""
+VERICOM DLP 3D Printer - Job Manifest
+프린트 파일을 한 번만 열어 검증/파라미터/레이어 목록/미리보기/머신 설정을 함께 추출
+
+파일 선택 → 미리보기 페이지 → 프린트 시작까지 같은 JobManifest를 사용하므로
+ZIP을 여러 번 열거나 run.gcode를 반복 파싱하지 않음.
+(경로, 크기, 수정시각) 기준 메모리 캐시.
+"""
+
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtGui import QImage
+
+try:
+    from controllers.gcode_parser import (
+        GCodeParser, PrintParameters, ZipValidationResult,
+        check_chitu_header, check_zip_contents, find_gcode_name
+    )
+    from controllers.print_archive import THUMBNAIL_NAMES, is_layer_name, layer_sort_key
+    from controllers.chitu_file import ChituFile, is_chitu_file
+    from utils.job_cache import file_key
+except ImportError:
+    from .gcode_parser import (
+        GCodeParser, PrintParameters, ZipValidationResult,
+        check_chitu_header, check_zip_contents, find_gcode_name
+    )
+    from .print_archive import THUMBNAIL_NAMES, is_layer_name, layer_sort_key
+    from .chitu_file import ChituFile, is_chitu_file
+    from ..utils.job_cache import file_key
+
+
+# 메모리 캐시 항목 수 (선택/미리보기/시작 사이 재사용 정도면 충분)
+CACHE_ENTRIES = 8
+
+
+@dataclass
+class JobManifest:
+    """
+    프린트 파일 1개의 분석 결과
+
+    layer_names: ZIP 레이어 엔트리 (정렬됨, ChiTu는 빈 목록)
+    preview: 미리보기 이미지 (ZIP PNG / ChiTu RLE 디코딩 결과, 없으면 None)
+    machine: 파일의 머신 설정 (resolutionX/Y, machineX/Y/Z)
+    """
+    path: str
+    format: str                                   # "zip" / "chitu" / ""
+    params: PrintParameters = field(default_factory=PrintParameters)
+    validation: ZipValidationResult = field(default_factory=ZipValidationResult)
+    layer_names: List[str] = field(default_factory=list)
+    preview: Optional[QImage] = None
+    machine: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.validation.is_valid
+
+    @property
+    def layer_count(self) -> int:
+        return self.params.totalLayer
+
+    def params_dict(self) -> Dict[str, Any]:
+        """프린트 파라미터 딕셔너리 (extract_print_parameters와 같은 키)"""
+        return self.params.to_dict()
+
+
+def build_manifest(file_path: str) -> JobManifest:
+    """
+    프린트 파일 분석 (ZIP/ChiTu 모두 파일을 한 번만 엶)
+
+    Args:
+        file_path: 프린트 파일 경로
+
+    Returns:
+        JobManifest (읽기 실패 시 validation에 오류 메시지)
+    """
+    if is_chitu_file(file_path):
+        return _build_chitu(file_path)
+    if zipfile.is_zipfile(file_path):
+        return _build_zip(file_path)
+    return JobManifest(file_path, "",
+                       validation=ZipValidationResult(False, "지원하지 않는 파일 형식입니다"))
+
+
+def _build_zip(file_path: str) -> JobManifest:
+    manifest = JobManifest(file_path, "zip")
+    try:
+        with zipfile.ZipFile(file_path, 'r') as z:
+            namelist = z.namelist()
+            gcode_file = find_gcode_name(namelist)
+            header = GCodeParser.read_zip_header(z, gcode_file) if gcode_file else None
+
+            manifest.validation = check_zip_contents(namelist, header)
+            manifest.params = GCodeParser.parse_zip_contents(namelist, header)
+            manifest.layer_names = sorted((name for name in namelist if is_layer_name(name)),
+                                          key=layer_sort_key)
+
+            preview_name = _find_preview_name(namelist)
+            if preview_name:
+                image = QImage.fromData(z.read(preview_name))
+                manifest.preview = None if image.isNull() else image
+
+            match = GCodeParser.NUMBER_PATTERN.match(header.values.get('machineZ', '')) if header else None
+            manifest.machine = {
+                'resolutionX': manifest.params.resolutionX,
+                'resolutionY': manifest.params.resolutionY,
+                'machineX': manifest.params.machineX,
+                'machineY': manifest.params.machineY,
+                'machineZ': float(match.group(0)) if match else 0.0,
+            }
+    except zipfile.BadZipFile:
+        manifest.validation = ZipValidationResult(False, "ZIP 파일이 손상되었습니다")
+    except Exception as e:
+        print(f"[Manifest] ZIP 분석 오류: {e}")
+        manifest.validation = ZipValidationResult(False, "ZIP 파일을 읽을 수 없습니다")
+    return manifest
+
+
+def _find_preview_name(namelist: List[str]) -> Optional[str]:
+    """미리보기 엔트리 (PrintArchive.preview_bytes와 같은 우선순위)"""
+    by_lower = {os.path.basename(name).lower(): name for name in namelist}
+    for thumbnail in THUMBNAIL_NAMES:
+        if thumbnail in by_lower:
+            return by_lower[thumbnail]
+    for name in namelist:
+        if 'preview' in name.lower() and name.lower().endswith('.png'):
+            return name
+    return None
+
+
+def _build_chitu(file_path: str) -> JobManifest:
+    manifest = JobManifest(file_path, "chitu")
+    try:
+        with ChituFile(file_path) as chitu:
+            manifest.validation = check_chitu_header(chitu, os.path.getsize(file_path))
+            for key, value in chitu.print_parameters().items():
+                setattr(manifest.params, key, value)
+            manifest.preview = chitu.preview_image()
+            width, height = chitu.frame_size()
+            bed_x, bed_y, bed_z = chitu.machine_size()
+            manifest.machine = {
+                'resolutionX': width, 'resolutionY': height,
+                'machineX': bed_x, 'machineY': bed_y, 'machineZ': bed_z,
+            }
+    except ValueError as e:
+        manifest.validation = ZipValidationResult(False, str(e))
+    except Exception as e:
+        print(f"[Manifest] ChiTu 분석 오류: {e}")
+        manifest.validation = ZipValidationResult(False, "파일을 읽을 수 없습니다")
+    return manifest
+
+
+_cache: "OrderedDict[str, JobManifest]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_manifest(file_path: str) -> JobManifest:
+    """
+    JobManifest (같은 파일이 바뀌지 않았으면 캐시 사용, 워커 스레드에서도 호출)
+    """
+    key = file_key(file_path)
+    if key is not None:
+        with _cache_lock:
+            manifest = _cache.get(key)
+            if manifest is not None:
+                _cache.move_to_end(key)
+                return manifest
+
+    manifest = build_manifest(file_path)
+    print(f"[Manifest] {os.path.basename(file_path)}: {manifest.layer_count} 레이어, "
+          f"{'정상' if manifest.is_valid else manifest.validation.error_message}")
+
+    if key is not None:
+        with _cache_lock:
+            _cache[key] = manifest
+            while len(_cache) > CACHE_ENTRIES:
+                _cache.popitem(last=False)
+    return manifest
+
+
+# 테스트용
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        manifest = load_manifest(sys.argv[1])
+        print(f"형식: {manifest.format}, 검증: {manifest.validation}")
+        print(f"레이어: {manifest.layer_count} ({manifest.layer_names[:3]}...)")
+        print(f"머신: {manifest.machine}")
+        print(f"미리보기: {manifest.preview.size() if manifest.preview else None}")
@@ -0,0 +1,306 @@
+"""
+VERICOM DLP 3D Printer - Layer Geometry
+레이어별 형상 인덱스 (노광 픽셀 수, 면적 mm², 바운딩 박스)
+
+작업당 1회 NumPy로 계산하여 data/cache/geometry/ 에 .npz 사이드카로 저장.
+적응형 모션(블레이드/리프트), 레진 계획, 남은 시간 추정에 사용.
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+try:
+    from controllers.layer_source import open_layer_source
+    from utils.job_cache import CACHE_DIR, file_key
+    from utils.rle_codec import image_pixels
+except ImportError:
+    from .layer_source import open_layer_source
+    from ..utils.job_cache import CACHE_DIR, file_key
+    from ..utils.rle_codec import image_pixels
+
+
+GEOMETRY_DIR = os.path.join(CACHE_DIR, "geometry")
+GEOMETRY_VERSION = 1
+
+# 사이드카 최대 개수 (오래된 것부터 삭제)
+GEOMETRY_CACHE_MAX = 50
+
+# 작업 단위 레이어 수 (진행률 갱신/취소 확인 간격)
+CHUNK_LAYERS = 32
+
+# 레이어 분석 결과: (노광 픽셀 수, (x0, y0, x1, y1))
+FrameStats = Tuple[int, Tuple[int, int, int, int]]
+
+
+@dataclass
+class LayerGeometry:
+    """
+    레이어별 형상 인덱스
+
+    바운딩 박스는 레이어 이미지 픽셀 좌표 [x0, x1) × [y0, y1),
+    빈 레이어는 (0, 0, 0, 0).
+    """
+    width: int                      # 레이어 이미지 폭 (px)
+    height: int                     # 레이어 이미지 높이 (px)
+    machine_size: Tuple[float, float]  # 노광 영역 (machineX, machineY) mm
+    pixel_counts: np.ndarray        # (N,) uint32 노광 픽셀 수
+    bboxes: np.ndarray              # (N, 4) int32 바운딩 박스
+
+    @property
+    def layer_count(self) -> int:
+        return len(self.pixel_counts)
+
+    @property
+    def pixel_size(self) -> Tuple[float, float]:
+        """픽셀 크기 (x, y) mm"""
+        return self.machine_size[0] / self.width, self.machine_size[1] / self.height
+
+    @property
+    def areas_mm2(self) -> np.ndarray:
+        """전체 레이어 노광 면적 (mm²)"""
+        px, py = self.pixel_size
+        return self.pixel_counts.astype(np.float64) * (px * py)
+
+    def is_empty(self, layer_index: int) -> bool:
+        """노광 픽셀이 없는 레이어인지 (범위 밖이면 False)"""
+        if not 0 <= layer_index < self.layer_count:
+            return False
+        return bool(self.pixel_counts[layer_index] == 0)
+
+    def area_mm2(self, layer_index: int) -> float:
+        """레이어 노광 면적 (mm²)"""
+        px, py = self.pixel_size
+        return float(self.pixel_counts[layer_index]) * px * py
+
+    def bbox(self, layer_index: int) -> Optional[Tuple[int, int, int, int]]:
+        """레이어 바운딩 박스 (px, 빈 레이어면 None)"""
+        if self.is_empty(layer_index):
+            return None
+        return tuple(int(v) for v in self.bboxes[layer_index])
+
+    def x_extent_mm(self, layer_index: int) -> Optional[Tuple[float, float]]:
+        """레이어 노광 영역의 X 범위 (mm, 노광 영역 왼쪽 기준, 빈 레이어면 None)"""
+        box = self.bbox(layer_index)
+        if box is None:
+            return None
+        px = self.pixel_size[0]
+        return box[0] * px, box[2] * px
+
+    def summary(self) -> str:
+        """로그용 요약"""
+        areas = self.areas_mm2
+        empty = int(np.count_nonzero(self.pixel_counts == 0))
+        return (f"{self.layer_count}개 레이어, 빈 레이어 {empty}개, "
+                f"최대 면적 {areas.max(initial=0.0):.1f}mm², 평균 {areas.mean() if len(areas) else 0.0:.1f}mm²")
+
+    def save(self, path: str):
+        """.npz 사이드카 저장 (임시 파일 → rename)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez(f, version=GEOMETRY_VERSION,
+                     size=np.array([self.width, self.height], dtype=np.int32),
+                     machine_size=np.array(self.machine_size, dtype=np.float64),
+                     pixel_counts=self.pixel_counts, bboxes=self.bboxes)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['LayerGeometry']:
+        """사이드카 로드 (없거나 버전이 다르면 None)"""
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != GEOMETRY_VERSION:
+                    return None
+                width, height = (int(v) for v in data['size'])
+                return cls(
+                    width=width,
+                    height=height,
+                    machine_size=tuple(float(v) for v in data['machine_size']),
+                    pixel_counts=data['pixel_counts'],
+                    bboxes=data['bboxes'],
+                )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[Geometry] 사이드카 로드 실패 ({path}): {e}")
+            return None
+
+
+# ==================== 프레임 분석 ====================
+
+def _frame_pixels(image: QImage) -> np.ndarray:
+    """프레임 픽셀 배열 (Grayscale8이 아니면 변환)"""
+    if image.format() != QImage.Format_Grayscale8:
+        image = image.convertToFormat(QImage.Format_Grayscale8)
+    return image_pixels(image)
+
+
+def is_blank_frame(image: QImage) -> bool:
+    """노광할 픽셀이 하나도 없는 프레임인지 (모두 검은색)"""
+    return not _frame_pixels(image).any()
+
+
+def analyse_frame(image: QImage) -> FrameStats:
+    """
+    레이어 프레임의 노광 픽셀 수와 바운딩 박스 (0보다 큰 픽셀 = 노광)
+
+    Args:
+        image: 레이어 QImage (Grayscale8, Mono 등)
+    """
+    pixels = _frame_pixels(image)
+
+    count = int(np.count_nonzero(pixels))
+    if count == 0:
+        return 0, (0, 0, 0, 0)
+
+    rows = np.flatnonzero(pixels.any(axis=1))
+    y0, y1 = int(rows[0]), int(rows[-1]) + 1
+    cols = np.flatnonzero(pixels[y0:y1].any(axis=0))
+    return count, (int(cols[0]), y0, int(cols[-1]) + 1, y1)
+
+
+def _analyse_layers(source, indices: Sequence[int], full: FrameStats) -> List[FrameStats]:
+    """레이어 묶음 분석 (스레드 풀 작업 단위, 읽기 실패 레이어는 전체 영역으로 간주)"""
+    results = []
+    for index in indices:
+        try:
+            image = source.layer_image(index)
+        except Exception as e:
+            print(f"[Geometry] 레이어 {index} 읽기 실패: {e}")
+            image = None
+        results.append(full if image is None or image.isNull() else analyse_frame(image))
+    return results
+
+
+def build_layer_geometry(file_path: str, machine_size: Tuple[float, float],
+                         progress: Optional[Callable[[int], None]] = None,
+                         cancelled: Optional[Callable[[], bool]] = None,
+                         max_workers: Optional[int] = None) -> Optional[LayerGeometry]:
+    """
+    프린트 파일 전체 레이어 분석
+
+    PNG/zlib 디코딩과 NumPy 연산은 GIL을 해제하므로 스레드 풀로 코어를 모두 사용
+    (프로세스 풀은 레이어 픽셀을 프로세스 간 복사해야 하므로 사용하지 않음).
+
+    Args:
+        file_path: 프린트 파일 경로 (.vlayers가 있으면 자동 사용)
+        machine_size: 노광 영역 (machineX, machineY) mm
+        progress: 진행률 콜백 (0~100)
+        cancelled: 취소 확인 콜백
+        max_workers: 스레드 수 (None이면 CPU 코어 수)
+
+    Returns:
+        LayerGeometry, 취소되면 None
+
+    Raises:
+        ValueError, OSError: 파일을 열 수 없는 경우
+    """
+    started = time.monotonic()
+    source = open_layer_source(file_path)
+    try:
+        count = source.layer_count
+        size = source.frame_size()
+        if size is None:
+            first = source.layer_image(0) if count else None
+            if first is None:
+                raise ValueError("레이어 이미지를 읽을 수 없습니다")
+            size = (first.width(), first.height())
+        width, height = size
+
+        pixel_counts = np.zeros(count, dtype=np.uint32)
+        bboxes = np.zeros((count, 4), dtype=np.int32)
+        full = (width * height, (0, 0, width, height))
+
+        workers = max_workers or max(1, os.cpu_count() or 1)
+        chunks = [range(i, min(i + CHUNK_LAYERS, count)) for i in range(0, count, CHUNK_LAYERS)]
+        done_layers = 0
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Geometry")
+        try:
+            pending = {executor.submit(_analyse_layers, source, chunk, full): chunk for chunk in chunks}
+            while pending:
+                if cancelled and cancelled():
+                    return None
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    for index, (pixels, box) in zip(chunk, future.result()):
+                        pixel_counts[index] = pixels
+                        bboxes[index] = box
+                    done_layers += len(chunk)
+                if done and progress:
+                    progress(done_layers * 100 // max(1, count))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        source.close()
+
+    geometry = LayerGeometry(width, height, tuple(machine_size), pixel_counts, bboxes)
+    print(f"[Geometry] 분석 완료 ({time.monotonic() - started:.1f}초): {geometry.summary()}")
+    return geometry
+
+
+# ==================== 사이드카 캐시 ====================
+
+def geometry_cache_path(file_path: str) -> Optional[str]:
+    """프린트 파일의 형상 인덱스 사이드카 경로 (경로/크기/수정시각 기준, 파일이 없으면 None)"""
+    key = file_key(file_path)
+    if key is None:
+        return None
+    return os.path.join(GEOMETRY_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + ".npz")
+
+
+def load_layer_geometry(file_path: str) -> Optional[LayerGeometry]:
+    """캐시된 형상 인덱스 (없으면 None)"""
+    path = geometry_cache_path(file_path)
+    if path is None or not os.path.exists(path):
+        return None
+    geometry = LayerGeometry.load(path)
+    if geometry is not None:
+        os.utime(path)  # LRU 갱신
+    return geometry
+
+
+def save_layer_geometry(file_path: str, geometry: LayerGeometry):
+    """형상 인덱스 사이드카 저장 후 오래된 사이드카 정리"""
+    path = geometry_cache_path(file_path)
+    if path is None:
+        return
+    try:
+        geometry.save(path)
+    except OSError as e:
+        print(f"[Geometry] 사이드카 저장 실패: {e}")
+        return
+
+    entries = [os.path.join(GEOMETRY_DIR, name) for name in os.listdir(GEOMETRY_DIR)
+               if name.endswith(".npz")]
+    entries.sort(key=os.path.getmtime)
+    for old in entries[:max(0, len(entries) - GEOMETRY_CACHE_MAX)]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+
+# 테스트용
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("사용법: python layer_geometry.py <프린트 파일> [machineX machineY]")
+        sys.exit(1)
+
+    machine = (float(sys.argv[2]), float(sys.argv[3])) if len(sys.argv) >= 4 else (124.8, 70.2)
+    result = build_layer_geometry(sys.argv[1], machine,
+                                  progress=lambda p: print(f"\r{p}%", end="", flush=True))
+    print()
+    for i in range(min(10, result.layer_count)):
+        print(f"레이어 {i}: {result.pixel_counts[i]}px, {result.area_mm2(i):.1f}mm², "
+              f"bbox {result.bbox(i)}, X {result.x_extent_mm(i)}")
@@ -0,0 +1,119 @@
+"""
+VERICOM DLP 3D Printer - Layer Source
+프린트 파일 형식별 레이어 소스 선택
+
+모든 레이어 소스(PrintArchive, VLayerStore, ChituFile)는 같은 인터페이스 제공:
+    layer_count         레이어 개수
+    layer_image(i)      레이어 프레임 (Grayscale8 또는 Mono QImage, 범위 밖이면 None)
+    frame_size()        (width, height) 또는 None
+    close()             리소스 해제
+"""
+
+import zipfile
+from typing import Optional, Tuple, Union
+
+from PySide6.QtGui import QImage
+
+try:
+    from controllers.print_archive import PrintArchive
+    from controllers.chitu_file import ChituFile, is_chitu_file
+    from controllers.layer_store import VLayerStore, open_layer_store, transform_image
+    from compute.layer_transform import LayerTransform
+except ImportError:
+    from .print_archive import PrintArchive
+    from .chitu_file import ChituFile, is_chitu_file
+    from .layer_store import VLayerStore, open_layer_store, transform_image
+    from ..compute.layer_transform import LayerTransform
+
+
+class TransformedSource:
+    """
+    레이어 보정을 프레임마다 적용하는 소스 (보정 스토어가 아직 없을 때)
+
+    layer_image()는 선읽기 스레드에서 호출되므로 노광 경로에는 보정된 프레임만 전달됨.
+    """
+
+    def __init__(self, source: 'LayerSource', transform: LayerTransform):
+        self.source = source
+        self.transform = transform
+
+    @property
+    def layer_count(self) -> int:
+        return self.source.layer_count
+
+    def layer_image(self, layer_index: int) -> Optional[QImage]:
+        image = self.source.layer_image(layer_index)
+        if image is None or image.isNull():
+            return image
+        return transform_image(image, self.transform)
+
+    def frame_size(self) -> Optional[Tuple[int, int]]:
+        return self.source.frame_size()
+
+    def close(self):
+        self.source.close()
+
+
+LayerSource = Union[PrintArchive, VLayerStore, ChituFile, TransformedSource]
+
+
+def open_layer_source(file_path: str, transform: Optional[LayerTransform] = None) -> LayerSource:
+    """
+    프린트 파일의 레이어 소스 열기
+
+    우선순위: 변환된 .vlayers → ChiTu 바이너리 → ZIP (.zip 또는 ZIP 형식 .dlp)
+    보정 설정이 있으면 보정 스토어(name.<key>.vlayers)를 먼저 찾고,
+    없으면 위 소스를 TransformedSource로 감싸서 반환.
+
+    Args:
+        file_path: 프린트 파일 경로
+        transform: 레이어 보정 (None 또는 보정 없음이면 원본 프레임)
+
+    Returns:
+        레이어 소스
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+        OSError: 파일을 열 수 없는 경우
+    """
+    if transform is not None and not transform.is_identity:
+        store = open_layer_store(file_path, transform.key())
+        if store:
+            return store
+        return TransformedSource(open_layer_source(file_path), transform)
+
+    store = open_layer_store(file_path)
+    if store:
+        return store
+
+    if is_chitu_file(file_path):
+        return ChituFile(file_path)
+
+    if zipfile.is_zipfile(file_path):
+        return PrintArchive(file_path)
+
+    raise ValueError("지원하지 않는 파일 형식입니다")
+
+
+def load_preview_image(file_path: str) -> Optional[QImage]:
+    """
+    프린트 파일의 미리보기 이미지 (없으면 None)
+
+    Args:
+        file_path: ZIP 또는 ChiTu 파일 경로
+    """
+    try:
+        if is_chitu_file(file_path):
+            with ChituFile(file_path) as chitu:
+                return chitu.preview_image()
+
+        if zipfile.is_zipfile(file_path):
+            with PrintArchive(file_path) as archive:
+                data = archive.preview_bytes()
+            if data:
+                image = QImage.fromData(data)
+                return None if image.isNull() else image
+    except Exception as e:
+        print(f"[LayerSource] 미리보기 로드 오류: {e}")
+
+    return None
@@ -0,0 +1,548 @@
+"""
+VERICOM DLP 3D Printer - Layer Store
+프린트용 레이어 컨테이너 (.vlayers)
+
+PNG-in-ZIP / ChiTu RLE는 배포용 형식이므로, 검증된 작업을 한 번 변환하여
+mmap으로 바로 읽을 수 있는 형식으로 저장 (재출력/재개 시 즉시 시작)
+
+파일 구조 (리틀 엔디안):
+    [헤더 48B] magic, version, layer_count, width, height,
+               params_offset, params_size, table_offset
+    [파라미터 JSON] 원본 정보 + PrintParameters
+    [레이어 데이터...] 16바이트 정렬, QImage 스캔라인 그대로 (또는 RLE/zlib)
+    [오프셋 테이블] 레이어당 24B: offset, size, bytes_per_line, encoding, format
+
+소재 프리셋의 레이어 보정(LayerTransform)은 보정 키별 스토어(name.<key>.vlayers)로
+한 번 변환해 두고, 같은 파일/보정으로 재출력하면 그대로 사용.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+try:
+    from compute.layer_transform import LayerTransform, transform_frame_bytes
+    from compute.process_pool import spawn_pool
+    from controllers.print_archive import PrintArchive
+    from controllers.chitu_file import ChituFile, is_chitu_file
+    from controllers.gcode_parser import extract_print_parameters
+    from utils.rle_codec import encode_image, decode_image, image_pixels, pixels_image
+except ImportError:
+    from ..compute.layer_transform import LayerTransform, transform_frame_bytes
+    from ..compute.process_pool import spawn_pool
+    from .print_archive import PrintArchive
+    from .chitu_file import ChituFile, is_chitu_file
+    from .gcode_parser import extract_print_parameters
+    from ..utils.rle_codec import encode_image, decode_image, image_pixels, pixels_image
+
+
+# 파일 식별
+STORE_MAGIC = b'VLYR'
+STORE_VERSION = 1
+STORE_EXTENSION = '.vlayers'
+
+# 헤더: magic, version, reserved, layer_count, width, height,
+#       params_offset, params_size, table_offset, reserved
+_HEADER = struct.Struct('<4sHHIIIQIQ8x')
+
+# 오프셋 테이블 엔트리: offset, size, bytes_per_line, encoding, format
+_ENTRY = struct.Struct('<QIIBB6x')
+
+# 레이어 인코딩
+ENCODING_RAW = 0    # 스캔라인 그대로 (mmap 제로카피)
+ENCODING_ZLIB = 1   # zlib 압축 (RLE 효과가 적은 레이어)
+ENCODING_RLE = 2    # 런렝스 (Grayscale8, NumPy 벡터화 디코딩)
+
+# 레이어 픽셀 형식
+FORMAT_MONO = 1
+FORMAT_GRAY8 = 8
+
+_QT_FORMATS = {
+    FORMAT_MONO: QImage.Format_Mono,
+    FORMAT_GRAY8: QImage.Format_Grayscale8,
+}
+
+# Mono 색상표 (0=검은색, 1=흰색으로 고정)
+_MONO_COLOR_TABLE = [0xFF000000, 0xFFFFFFFF]
+
+# 데이터 정렬 (QImage 스캔라인은 4바이트 정렬 필요)
+_ALIGNMENT = 16
+
+# zlib 압축 레벨 (빠른 해제 우선)
+ZLIB_LEVEL = 1
+
+# 압축 후 크기가 이 비율 이하일 때만 압축 저장
+MIN_SAVING = 0.5
+
+# 보정 변환 시 프로세스당 미리 제출할 프레임 수 (메모리 상한)
+TRANSFORM_WINDOW_PER_WORKER = 2
+
+
+def store_path_for(file_path: str, transform_key: str = "") -> str:
+    """프린트 파일에 대응하는 .vlayers 경로 (보정 키가 있으면 name.<key>.vlayers)"""
+    base = os.path.splitext(file_path)[0]
+    if transform_key:
+        base += "." + transform_key
+    return base + STORE_EXTENSION
+
+
+def _source_info(file_path: str) -> Dict[str, Any]:
+    """변환 원본 식별 정보 (변경 감지용)"""
+    stat = os.stat(file_path)
+    return {
+        'name': os.path.basename(file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+
+class VLayerStore:
+    """
+    .vlayers 레이어 컨테이너 (읽기 전용, mmap)
+
+    RAW 레이어는 mmap 영역의 memoryview를 그대로 QImage 버퍼로 사용 (복사 없음).
+    반환된 QImage는 close() 전까지만 유효하므로, 작업 종료 시
+    선읽기를 먼저 멈춘 뒤 close() 호출.
+
+    사용 예:
+        with VLayerStore(path) as store:
+            image = store.layer_image(0)
+    """
+
+    def __init__(self, store_path: str):
+        """
+        Args:
+            store_path: .vlayers 파일 경로
+
+        Raises:
+            ValueError: 형식이 올바르지 않은 경우
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.path = store_path
+        self._file = open(store_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        """헤더, 파라미터, 오프셋 테이블 읽기"""
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("레이어 스토어 헤더가 잘렸습니다")
+
+        (magic, version, _, layer_count, width, height,
+         params_offset, params_size, table_offset) = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != STORE_MAGIC:
+            raise ValueError("레이어 스토어 형식이 아닙니다")
+        if version != STORE_VERSION:
+            raise ValueError(f"지원하지 않는 레이어 스토어 버전: {version}")
+        if table_offset + layer_count * _ENTRY.size > len(self._mmap):
+            raise ValueError("레이어 스토어 오프셋 테이블이 잘렸습니다")
+
+        self.width = width
+        self.height = height
+        self.metadata: Dict[str, Any] = json.loads(
+            bytes(self._view[params_offset:params_offset + params_size]).decode('utf-8')
+        )
+        self._entries: List[Tuple[int, int, int, int, int]] = [
+            _ENTRY.unpack_from(self._mmap, table_offset + i * _ENTRY.size)
+            for i in range(layer_count)
+        ]
+
+    # ==================== 정보 ====================
+
+    @property
+    def layer_count(self) -> int:
+        """레이어 개수"""
+        return len(self._entries)
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """변환 시 저장된 프린트 파라미터"""
+        return self.metadata.get('params', {})
+
+    def frame_size(self) -> Tuple[int, int]:
+        """레이어 해상도 (width, height)"""
+        return self.width, self.height
+
+    def matches_source(self, file_path: str) -> bool:
+        """원본 파일이 변환 이후 바뀌지 않았는지 확인"""
+        try:
+            return self.metadata.get('source') == _source_info(file_path)
+        except OSError:
+            return False
+
+    # ==================== 레이어 접근 ====================
+
+    def layer_image(self, layer_index: int) -> Optional[QImage]:
+        """
+        레이어 프레임 (Grayscale8 또는 Mono)
+
+        Args:
+            layer_index: 레이어 인덱스 (0부터 시작)
+
+        Returns:
+            QImage 또는 None (범위 초과)
+        """
+        if not 0 <= layer_index < len(self._entries):
+            print(f"[LayerStore] 레이어 인덱스 범위 초과: {layer_index} (총 {len(self._entries)}개)")
+            return None
+
+        offset, size, bytes_per_line, encoding, fmt = self._entries[layer_index]
+        data = self._view[offset:offset + size]
+
+        if encoding == ENCODING_RLE:
+            # QImage 소유 버퍼에 바로 디코딩
+            return decode_image(data)
+        if encoding == ENCODING_ZLIB:
+            data = zlib.decompress(data)
+        elif encoding != ENCODING_RAW:
+            raise ValueError(f"알 수 없는 레이어 인코딩: {encoding}")
+
+        image = QImage(data, self.width, self.height, bytes_per_line, _QT_FORMATS[fmt])
+        if fmt == FORMAT_MONO:
+            image.setColorTable(_MONO_COLOR_TABLE)
+
+        # 압축 해제 버퍼는 이 함수 밖에서 해제되므로 복사하여 소유
+        return image if encoding == ENCODING_RAW else image.copy()
+
+    # ==================== 수명 관리 ====================
+
+    def close(self):
+        """mmap 및 파일 닫기"""
+        view = getattr(self, '_view', None)
+        if view is not None:
+            try:
+                view.release()
+            except BufferError:
+                pass
+            self._view = None
+
+        mm = getattr(self, '_mmap', None)
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                # 아직 참조 중인 프레임이 있으면 GC에 맡김
+                pass
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def is_closed(self) -> bool:
+        return self._file is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def open_layer_store(file_path: str, transform_key: str = "") -> Optional[VLayerStore]:
+    """
+    프린트 파일에 대응하는 최신 .vlayers 열기 (없거나 오래되었으면 None)
+
+    Args:
+        file_path: 프린트 파일 경로
+        transform_key: LayerTransform.key() (빈 문자열이면 보정 없는 스토어)
+    """
+    store_path = store_path_for(file_path, transform_key)
+    if not os.path.exists(store_path):
+        return None
+
+    try:
+        store = VLayerStore(store_path)
+    except Exception as e:
+        print(f"[LayerStore] 스토어 열기 실패: {e}")
+        return None
+
+    if not store.matches_source(file_path):
+        print(f"[LayerStore] 원본 변경됨, 스토어 무시: {store_path}")
+        store.close()
+        return None
+
+    if store.metadata.get('transform', "") != transform_key:
+        print(f"[LayerStore] 보정 설정 불일치, 스토어 무시: {store_path}")
+        store.close()
+        return None
+
+    return store
+
+
+def transform_image(image: QImage, transform: LayerTransform) -> QImage:
+    """
+    프레임 보정 (GUI 외 스레드에서 호출, Mono는 Grayscale8로 변환)
+
+    Returns:
+        보정된 Grayscale8 QImage (보정 없으면 입력 그대로)
+    """
+    if transform.is_identity:
+        return image
+    if image.format() != QImage.Format_Grayscale8:
+        image = image.convertToFormat(QImage.Format_Grayscale8)
+    return pixels_image(transform.apply(image_pixels(image)))
+
+
+def _frame_record(image: QImage) -> Tuple[bytes, int, int, int]:
+    """컴팩트 프레임 → (저장 데이터, bytes_per_line, encoding, format)"""
+    if image.format() == QImage.Format_Mono:
+        fmt = FORMAT_MONO
+        # 색상표를 0=검은색으로 통일 (RLE 인코딩은 색상표 기준으로 Grayscale8 변환)
+        if image.colorCount() >= 1 and image.color(0) & 0xFFFFFF:
+            image = image.copy()
+            image.invertPixels()
+        if image.colorTable() != _MONO_COLOR_TABLE:
+            image = image.copy()
+            image.setColorTable(_MONO_COLOR_TABLE)
+    else:
+        fmt = FORMAT_GRAY8
+
+    raw = bytes(image.constBits()[:image.sizeInBytes()])
+
+    # 디코딩이 빠른 RLE 우선, 효과가 없으면 zlib, 그래도 안 되면 RAW (Mono도 동일)
+    # Mono RAW도 1080p 레이어당 259KB → 수천 레이어면 GB 단위이므로 압축 필수
+    limit = len(raw) * MIN_SAVING
+    rle = encode_image(image)
+    if len(rle) <= limit:
+        # RLE는 Grayscale8로 디코딩됨
+        return rle, image.width(), ENCODING_RLE, FORMAT_GRAY8
+    packed = zlib.compress(raw, ZLIB_LEVEL)
+    if len(packed) <= limit:
+        return packed, image.bytesPerLine(), ENCODING_ZLIB, fmt
+
+    return raw, image.bytesPerLine(), ENCODING_RAW, fmt
+
+
+def _read_frame(source, idx: int) -> QImage:
+    """원본 레이어 프레임 (디코딩 실패 시 ValueError)"""
+    image = source.layer_image(idx)
+    if image is None or image.isNull():
+        raise ValueError(f"레이어 {idx} 디코딩 실패")
+    return image
+
+
+def _source_frames(source, count: int) -> Iterator[QImage]:
+    """원본 프레임 그대로"""
+    for idx in range(count):
+        yield _read_frame(source, idx)
+
+
+def _transformed_frames(source, count: int, transform: LayerTransform,
+                        cancelled: Optional[Callable[[], bool]]) -> Iterator[QImage]:
+    """
+    프로세스 풀에서 보정한 프레임 (순서 유지)
+
+    디코딩은 이 스레드, 형태학 연산은 작업자 프로세스에서 실행.
+    미리 제출하는 프레임 수를 제한하여 메모리 사용량을 고정.
+    """
+    workers = max(1, os.cpu_count() or 1)
+    window = workers * TRANSFORM_WINDOW_PER_WORKER
+    print(f"[LayerStore] 레이어 보정 ({transform.summary()}), 프로세스 {workers}개")
+
+    executor = spawn_pool(workers)
+    pending = deque()
+    submitted = 0
+    try:
+        for _ in range(count):
+            while submitted < count and len(pending) < window:
+                image = _read_frame(source, submitted)
+                if image.format() != QImage.Format_Grayscale8:
+                    image = image.convertToFormat(QImage.Format_Grayscale8)
+                width, height = image.width(), image.height()
+                raw = image_pixels(image).tobytes()
+                pending.append((executor.submit(transform_frame_bytes, raw, width, height, transform),
+                                width, height))
+                submitted += 1
+
+            if cancelled and cancelled():
+                return
+            future, width, height = pending.popleft()
+            pixels = np.frombuffer(future.result(), dtype=np.uint8).reshape(height, width)
+            yield pixels_image(pixels)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _open_convert_source(file_path: str, transform: Optional[LayerTransform]):
+    """변환 원본 (보정 변환은 보정 없는 스토어가 있으면 그 스토어, 없으면 원본 파일)"""
+    source = open_layer_store(file_path) if transform else None
+    if source is None:
+        source = ChituFile(file_path) if is_chitu_file(file_path) else PrintArchive(file_path)
+    return source
+
+
+def estimate_store_size(file_path: str, transform: Optional[LayerTransform] = None) -> int:
+    """
+    변환될 스토어 크기 상한 (디코딩 없이 헤더만 읽음)
+
+    모든 레이어가 RAW Grayscale8로 저장되는 경우의 크기 — 변환 전 공간 확보용
+
+    Args:
+        file_path: 원본 프린트 파일 경로
+        transform: 레이어 보정 (convert_to_layer_store와 같은 값)
+
+    Raises:
+        ValueError: 레이어 크기를 알 수 없는 경우
+    """
+    if transform is not None and transform.is_identity:
+        transform = None
+
+    with _open_convert_source(file_path, transform) as source:
+        count = source.layer_count
+        size = source.frame_size()
+    if not size:
+        raise ValueError("레이어 크기를 알 수 없습니다")
+
+    width, height = size
+    frame_bytes = (width + 3) // 4 * 4 * height + _ALIGNMENT + _ENTRY.size
+    # 헤더 + 파라미터 JSON 여유분
+    return _HEADER.size + 64 * 1024 + count * frame_bytes
+
+
+def convert_to_layer_store(file_path: str, store_path: Optional[str] = None,
+                           progress: Optional[Callable[[int], None]] = None,
+                           cancelled: Optional[Callable[[], bool]] = None,
+                           transform: Optional[LayerTransform] = None) -> Optional[str]:
+    """
+    검증된 프린트 파일(ZIP 또는 ChiTu)을 .vlayers로 변환
+
+    임시 파일에 기록 후 rename하므로 중단되어도 불완전한 스토어가 남지 않음.
+    보정 설정이 있으면 프로세스 풀에서 보정한 프레임을 보정 키별 스토어로 저장
+    (이미 변환된 보정 없는 스토어가 있으면 PNG 대신 그 스토어에서 읽음).
+
+    Args:
+        file_path: 원본 프린트 파일 경로
+        store_path: 출력 경로 (None이면 원본 옆에 생성)
+        progress: 진행률 콜백 (0~100)
+        cancelled: 취소 확인 콜백
+        transform: 레이어 보정 (None 또는 보정 없음이면 원본 프레임)
+
+    Returns:
+        생성된 스토어 경로, 취소 시 None
+
+    Raises:
+        ValueError: 레이어가 없거나 디코딩/크기가 맞지 않는 경우
+    """
+    if transform is not None and transform.is_identity:
+        transform = None
+    transform_key = transform.key() if transform else ""
+    store_path = store_path or store_path_for(file_path, transform_key)
+    temp_path = store_path + ".tmp"
+
+    info = {
+        'source': _source_info(file_path),
+        'params': extract_print_parameters(file_path),
+    }
+    if transform_key:
+        info['transform'] = transform_key
+    metadata = json.dumps(info, ensure_ascii=False).encode('utf-8')
+
+    source = _open_convert_source(file_path, transform)
+
+    try:
+        with source, open(temp_path, 'wb') as out:
+            count = source.layer_count
+            if count == 0:
+                raise ValueError("변환할 레이어가 없습니다")
+
+            # 헤더는 마지막에 다시 기록
+            out.write(b'\x00' * _HEADER.size)
+            params_offset = out.tell()
+            out.write(metadata)
+
+            if transform:
+                frames = _transformed_frames(source, count, transform, cancelled)
+            else:
+                frames = _source_frames(source, count)
+
+            entries = []
+            width = height = 0
+            with closing(frames):
+                for idx in range(count):
+                    if cancelled and cancelled():
+                        raise InterruptedError()
+
+                    image = next(frames, None)
+                    if image is None:
+                        raise InterruptedError()
+
+                    if idx == 0:
+                        width, height = image.width(), image.height()
+                    elif (image.width(), image.height()) != (width, height):
+                        raise ValueError(f"레이어 {idx} 크기 불일치: "
+                                         f"{image.width()}x{image.height()} (기준 {width}x{height})")
+
+                    data, bytes_per_line, encoding, fmt = _frame_record(image)
+
+                    # QImage 버퍼 정렬
+                    pad = -out.tell() % _ALIGNMENT
+                    if pad:
+                        out.write(b'\x00' * pad)
+                    entries.append(_ENTRY.pack(out.tell(), len(data), bytes_per_line, encoding, fmt))
+                    out.write(data)
+
+                    if progress:
+                        progress(int((idx + 1) * 100 / count))
+
+            table_offset = out.tell()
+            out.write(b''.join(entries))
+
+            out.seek(0)
+            out.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, count, width, height,
+                                   params_offset, len(metadata), table_offset))
+            out.flush()
+            os.fsync(out.fileno())
+
+        os.replace(temp_path, store_path)
+
+    except InterruptedError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        print(f"[LayerStore] 변환 취소: {file_path}")
+        return None
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    print(f"[LayerStore] 변환 완료: {store_path} ({count}개 레이어, "
+          f"{os.path.getsize(store_path) / 1024 / 1024:.1f}MB)")
+    return store_path
+
+
+# 테스트용
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("사용법: python layer_store.py <print.zip|.ctb|.photon>")
+        sys.exit(1)
+
+    start = time.monotonic()
+    path = convert_to_layer_store(sys.argv[1])
+    print(f"변환 시간: {time.monotonic() - start:.1f}s")
+
+    with VLayerStore(path) as store:
+        print(f"레이어: {store.layer_count}, 크기: {store.width}x{store.height}")
+        start = time.monotonic()
+        for i in range(store.layer_count):
+            store.layer_image(i)
+        print(f"전체 읽기: {time.monotonic() - start:.2f}s")
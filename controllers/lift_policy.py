@@ -0,0 +1,142 @@
+"""
+VERICOM DLP 3D Printer - Lift Policy
+노광 후 Z축 리프트 높이/속도 결정
+
+모드:
+- fixed: 기존 동작 (+3mm @ 300mm/min, 하강 300mm/min)
+- gcode: 프린트 파일의 bottom/normal 리프트 높이·속도, 하강 속도 사용
+- adaptive: gcode 값을 기준으로 레이어 노광 면적에 따라 축소
+  (작은 단면은 낮고 빠르게, full_area 이상은 파일 값 그대로, 바닥 레이어는 축소 안 함)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+
+LIFT_MODES = ("fixed", "gcode", "adaptive")
+
+# fixed 모드 (기존 하드코딩 값)
+FIXED_LIFT_HEIGHT = 3.0   # mm
+FIXED_LIFT_SPEED = 300    # mm/min
+
+# adaptive 모드: 작은 단면 리프트 속도 배율 및 상한
+ADAPTIVE_SPEED_FACTOR = 3.0
+MAX_LIFT_SPEED = 600      # mm/min
+
+
+@dataclass(frozen=True)
+class LiftMove:
+    """레이어 1회 리프트 (높이 mm, 상승/하강 속도 mm/min)"""
+    height: float
+    speed: int
+    drop_speed: int
+
+    def duration(self) -> float:
+        """리프트 + 다음 레이어 하강 시간 (초)"""
+        return self.height / (self.speed / 60.0) + self.height / (self.drop_speed / 60.0)
+
+
+@dataclass(frozen=True)
+class LiftPolicy:
+    """
+    레이어별 리프트 정책
+
+    사용 예:
+        policy = LiftPolicy.from_params(params, mode="adaptive")
+        move = policy.for_layer(layer_idx, geometry.area_mm2(layer_idx))
+    """
+    mode: str = "fixed"
+    bottom_layer_count: int = 0
+    bottom_height: float = FIXED_LIFT_HEIGHT
+    bottom_speed: int = FIXED_LIFT_SPEED
+    normal_height: float = FIXED_LIFT_HEIGHT
+    normal_speed: int = FIXED_LIFT_SPEED
+    drop_speed: int = FIXED_LIFT_SPEED
+    min_height: float = 1.0      # adaptive: 최소 리프트 높이 (mm)
+    full_area: float = 1500.0    # adaptive: 파일 리프트를 그대로 쓰는 면적 (mm²)
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any], mode: str = "fixed",
+                    min_height: float = 1.0, full_area: float = 1500.0) -> 'LiftPolicy':
+        """
+        프린트 파라미터(gcode_parser 키)로 정책 생성
+
+        Args:
+            params: PrintParameters.to_dict() 또는 파일 미리보기 파라미터
+            mode: "fixed" / "gcode" / "adaptive" (알 수 없는 값은 fixed)
+            min_height: adaptive 최소 리프트 높이 (mm)
+            full_area: adaptive 기준 면적 (mm²)
+        """
+        if mode not in LIFT_MODES or mode == "fixed":
+            return cls(mode="fixed")
+
+        def speed(key: str, default: int) -> int:
+            value = int(params.get(key, default) or 0)
+            return value if value > 0 else default
+
+        return cls(
+            mode=mode,
+            bottom_layer_count=int(params.get('bottomLayerCount', 0)),
+            bottom_height=max(0.0, float(params.get('bottomLayerLiftHeight', 5.0))),
+            bottom_speed=speed('bottomLayerLiftSpeed', 65),
+            normal_height=max(0.0, float(params.get('normalLayerLiftHeight', 5.0))),
+            normal_speed=speed('normalLayerLiftSpeed', 65),
+            drop_speed=speed('normalDropSpeed', 150),
+            min_height=max(0.0, min_height),
+            full_area=max(1.0, full_area),
+        )
+
+    def for_layer(self, layer_index: int, area_mm2: Optional[float] = None) -> LiftMove:
+        """
+        레이어 리프트 계산
+
+        Args:
+            layer_index: 레이어 번호 (0부터)
+            area_mm2: 레이어 노광 면적 (형상 인덱스, None이면 최대 리프트)
+        """
+        if self.mode == "fixed":
+            return LiftMove(FIXED_LIFT_HEIGHT, FIXED_LIFT_SPEED, FIXED_LIFT_SPEED)
+
+        if layer_index < self.bottom_layer_count:
+            height, speed = self.bottom_height, self.bottom_speed
+        else:
+            height, speed = self.normal_height, self.normal_speed
+
+        adaptive = self.mode == "adaptive" and layer_index >= self.bottom_layer_count
+        if adaptive and area_mm2 is not None and height > self.min_height:
+            # 면적 비율 (0 = 빈 레이어, 1 = full_area 이상)
+            ratio = min(1.0, max(0.0, area_mm2 / self.full_area))
+            height = self.min_height + (height - self.min_height) * ratio
+            fast = max(speed, min(MAX_LIFT_SPEED, int(speed * ADAPTIVE_SPEED_FACTOR)))
+            speed = int(round(fast - (fast - speed) * ratio))
+
+        return LiftMove(round(height, 3), speed, self.drop_speed)
+
+    def job_time(self, total_layers: int, areas: Optional[Sequence[float]] = None) -> float:
+        """
+        작업 전체 리프트 + 하강 시간 (초)
+
+        Args:
+            total_layers: 총 레이어 수
+            areas: 레이어별 노광 면적 (mm², 없으면 최대 리프트로 계산)
+        """
+        if areas is not None and len(areas) != total_layers:
+            areas = None
+        if self.mode != "adaptive" or areas is None:
+            bottom = min(total_layers, self.bottom_layer_count)
+            return (bottom * self.for_layer(0).duration()
+                    + (total_layers - bottom) * self.for_layer(self.bottom_layer_count).duration())
+        return sum(self.for_layer(i, float(area)).duration() for i, area in enumerate(areas))
+
+
+# 테스트용
+if __name__ == "__main__":
+    sample = {'bottomLayerCount': 8, 'bottomLayerLiftHeight': 6.0, 'bottomLayerLiftSpeed': 60,
+              'normalLayerLiftHeight': 5.0, 'normalLayerLiftSpeed': 90, 'normalDropSpeed': 150}
+    for name in LIFT_MODES:
+        policy = LiftPolicy.from_params(sample, mode=name)
+        print(f"{name}: bottom {policy.for_layer(0)}, 20mm² {policy.for_layer(10, 20.0)}, "
+              f"3000mm² {policy.for_layer(10, 3000.0)}")
+    adaptive = LiftPolicy.from_params(sample, mode="adaptive")
+    print(f"1000레이어 리프트 시간: fixed {LiftPolicy().job_time(1000):.0f}초, "
+          f"adaptive(100mm²) {adaptive.job_time(1000, [100.0] * 1000):.0f}초")
@@ -0,0 +1,163 @@
+"""
+VERICOM DLP 3D Printer - Motion Planner
+레이어별 블레이드(X축) 평탄화 동작 계획
+
+기본 동작: blade_start → blade_boundary (구간1 속도) → blade_end (구간2 속도),
+노광 후 blade_end → blade_start 고속 복귀.
+바운딩 박스 제한 모드에서는 레이어 노광 영역의 X 끝 + 안전 여유까지만 평탄화하여
+느린 평탄화 구간과 복귀 구간을 모두 줄임.
+양방향 모드에서는 홀수 번째 레이어는 정방향, 짝수 번째 레이어는 역방향으로 평탄화하고
+복귀 이동을 생략 (역방향의 구간 경계는 blade_start/blade_end 기준으로 대칭).
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+# 블레이드 복귀 속도 (평탄화가 아니므로 고정 고속, 50mm/s)
+BLADE_RETURN_SPEED = 3000  # mm/min
+
+# 바운딩 박스 제한 시 최소 평탄화 거리 (시작 위치 근처에서 멈추지 않도록)
+MIN_SWEEP_DISTANCE = 10.0  # mm
+
+
+@dataclass(frozen=True)
+class BladeSweep:
+    """
+    레이어 1회 평탄화 계획
+
+    moves: 평탄화 이동 [(목표 위치 mm, 속도 mm/min), ...]
+    return_position: 노광 후 복귀 위치 (mm, 양방향 모드는 None = 제자리)
+    """
+    moves: Tuple[Tuple[float, int], ...]
+    return_position: Optional[float]
+
+    @property
+    def end_position(self) -> float:
+        """평탄화 종료 위치 (노광 중 블레이드 대기 위치)"""
+        return self.moves[-1][0]
+
+    def travel(self, start: float) -> float:
+        """평탄화 + 복귀 총 이동 거리 (mm)"""
+        distance = 0.0
+        position = start
+        for target, _ in self.moves:
+            distance += abs(target - position)
+            position = target
+        if self.return_position is not None:
+            distance += abs(self.return_position - position)
+        return distance
+
+
+def two_speed_moves(start: float, end: float, boundary: float,
+                    speed1: int, speed2: int) -> List[Tuple[float, int]]:
+    """
+    start → end 평탄화를 구간 경계 기준 2단 속도 이동으로 분할
+
+    경계가 구간 밖이면 전체를 구간1 속도로 이동.
+    """
+    if min(start, end) < boundary < max(start, end):
+        return [(boundary, speed1), (end, speed2)]
+    return [(end, speed1)]
+
+
+def bbox_sweep_end(blade_start: float, blade_end: float,
+                   x_extent: Optional[Tuple[float, float]],
+                   field_offset: float, margin: float) -> float:
+    """
+    레이어 노광 영역을 덮는 최소 평탄화 끝 위치
+
+    Args:
+        blade_start: 블레이드 시작 위치 (mm)
+        blade_end: 블레이드 끝 위치 (mm)
+        x_extent: 노광 영역 X 범위 (노광 영역 왼쪽 기준 mm, None이면 전체)
+        field_offset: 노광 영역 왼쪽 끝의 X축 위치 (mm)
+        margin: 안전 여유 (mm, 블레이드 폭 + 레진 흐름 고려)
+
+    Returns:
+        평탄화 끝 위치 (blade_start + MIN_SWEEP_DISTANCE ~ blade_end)
+    """
+    if x_extent is None:
+        return blade_end
+    end = field_offset + x_extent[1] + margin
+    return max(min(blade_start + MIN_SWEEP_DISTANCE, blade_end), min(end, blade_end))
+
+
+def bbox_sweep_start(blade_start: float, blade_end: float,
+                     x_extent: Optional[Tuple[float, float]],
+                     field_offset: float, margin: float) -> float:
+    """
+    역방향 평탄화의 최소 끝 위치 (노광 영역 X 시작 - 안전 여유)
+
+    Returns:
+        blade_start ~ blade_end - MIN_SWEEP_DISTANCE
+    """
+    if x_extent is None:
+        return blade_start
+    start = field_offset + x_extent[0] - margin
+    return min(max(blade_end - MIN_SWEEP_DISTANCE, blade_start), max(start, blade_start))
+
+
+def plan_blade_sweep(blade_start: float, blade_end: float, blade_boundary: float,
+                     speed1: int, speed2: int,
+                     x_extent: Optional[Tuple[float, float]] = None,
+                     bbox_limited: bool = False,
+                     field_offset: float = 0.0, margin: float = 10.0,
+                     bidirectional: bool = False, reverse: bool = False,
+                     position: Optional[float] = None) -> BladeSweep:
+    """
+    레이어 평탄화 계획
+
+    Args:
+        blade_start, blade_end, blade_boundary: 블레이드 위치 (mm)
+        speed1: 구간1 속도 (mm/min)
+        speed2: 구간2 속도 (mm/min)
+        x_extent: 레이어 노광 영역 X 범위 (mm, 형상 인덱스)
+        bbox_limited: 바운딩 박스 제한 모드
+        field_offset: 노광 영역 왼쪽 끝의 X축 위치 (mm)
+        margin: 안전 여유 (mm)
+        bidirectional: 양방향 모드 (복귀 이동 없음)
+        reverse: 역방향 평탄화 (양방향 모드의 짝수 번째 레이어)
+        position: 현재 블레이드 위치 (mm, 양방향 모드에서 시작점이 다르면 먼저 이동)
+    """
+    end = blade_end
+    if bbox_limited:
+        end = bbox_sweep_end(blade_start, blade_end, x_extent, field_offset, margin)
+
+    if not bidirectional:
+        moves = two_speed_moves(blade_start, end, blade_boundary, speed1, speed2)
+        return BladeSweep(moves=tuple(moves), return_position=blade_start)
+
+    # 양방향: 정방향은 start → end, 역방향은 end → start (구간 경계 대칭)
+    start = blade_start
+    if bbox_limited:
+        start = bbox_sweep_start(blade_start, blade_end, x_extent, field_offset, margin)
+    if reverse:
+        origin, target = end, start
+        boundary = blade_start + blade_end - blade_boundary
+    else:
+        origin, target = start, end
+        boundary = blade_boundary
+
+    moves = []
+    if position is not None and abs(position - origin) > 0.01:
+        # 이전 레이어가 다른 위치에서 끝난 경우 평탄화 시작점까지 구간1 속도로 이동
+        moves.append((origin, speed1))
+    moves.extend(two_speed_moves(origin, target, boundary, speed1, speed2))
+    return BladeSweep(moves=tuple(moves), return_position=None)
+
+
+# 테스트용
+if __name__ == "__main__":
+    full = plan_blade_sweep(0.0, 130.0, 60.0, 300, 1200)
+    print(f"전체: {full.moves}, 이동 {full.travel(0.0):.1f}mm")
+
+    narrow = plan_blade_sweep(0.0, 130.0, 60.0, 300, 1200, x_extent=(30.0, 50.0),
+                              bbox_limited=True, field_offset=2.6, margin=10.0)
+    print(f"20mm 파트: {narrow.moves}, 이동 {narrow.travel(0.0):.1f}mm")
+
+    forward = plan_blade_sweep(0.0, 130.0, 60.0, 300, 1200, bidirectional=True, position=0.0)
+    backward = plan_blade_sweep(0.0, 130.0, 60.0, 300, 1200, bidirectional=True, reverse=True,
+                                position=130.0)
+    print(f"양방향: {forward.moves} / {backward.moves}, 2레이어 이동 "
+          f"{forward.travel(0.0) + backward.travel(130.0):.1f}mm")
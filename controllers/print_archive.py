@@ -0,0 +1,215 @@
+"""
+VERICOM DLP 3D Printer - Print Archive
+프린트 작업 동안 ZIP 파일을 한 번만 열고 레이어 인덱스를 유지
+"""
+
+import os
+import re
+import threading
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtGui import QImage
+
+try:
+    from utils.frame_utils import compact_frame, png_size
+except ImportError:
+    from ..utils.frame_utils import compact_frame, png_size
+
+
+# 썸네일 파일명 (레이어에서 제외)
+THUMBNAIL_NAMES = ('preview_cropping.png', 'preview.png', 'thumbnail.png')
+
+# 레이어 파일명 숫자 추출
+_LAYER_NUMBER_PATTERN = re.compile(r'(\d+)')
+
+
+def is_layer_name(name: str) -> bool:
+    """
+    ZIP 엔트리 이름이 레이어 이미지인지 확인
+
+    썸네일을 제외하고 파일명에 숫자가 포함된 PNG를 레이어로 판단
+    """
+    if not name.lower().endswith('.png'):
+        return False
+
+    filename = os.path.basename(name).lower()
+    if filename in THUMBNAIL_NAMES:
+        return False
+
+    return _LAYER_NUMBER_PATTERN.search(filename) is not None
+
+
+def layer_sort_key(name: str) -> int:
+    """레이어 파일명의 첫 숫자 기준 정렬 키"""
+    match = _LAYER_NUMBER_PATTERN.search(os.path.basename(name))
+    return int(match.group(1)) if match else 0
+
+
+class PrintArchive:
+    """
+    프린트 ZIP 아카이브
+
+    ZipFile을 한 번만 열고 레이어 인덱스 → ZipInfo 테이블을 미리 만들어
+    레이어 데이터를 O(1)로 제공. 프린트 워커가 작업 시작 시 생성하고
+    작업 종료 시 close() 호출.
+
+    사용 예:
+        with PrintArchive(zip_path) as archive:
+            data = archive.layer_bytes(0)
+    """
+
+    def __init__(self, zip_path: str):
+        """
+        Args:
+            zip_path: ZIP 파일 경로
+
+        Raises:
+            zipfile.BadZipFile: ZIP 파일이 손상된 경우
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.path = zip_path
+        self._zip = zipfile.ZipFile(zip_path, 'r')
+        # ZipFile 읽기는 스레드 간 공유되므로 보호
+        self._lock = threading.Lock()
+
+        self._layers: List[zipfile.ZipInfo] = []
+        self._entries: Dict[str, zipfile.ZipInfo] = {}
+        self._build_index()
+
+    def _build_index(self):
+        """중앙 디렉토리를 한 번만 스캔하여 레이어 테이블 생성"""
+        layers = []
+        for info in self._zip.infolist():
+            self._entries[info.filename] = info
+            if is_layer_name(info.filename):
+                layers.append(info)
+
+        layers.sort(key=lambda info: layer_sort_key(info.filename))
+        self._layers = layers
+        print(f"[Archive] 레이어 인덱스 생성: {len(layers)}개 ({os.path.basename(self.path)})")
+
+    # ==================== 레이어 접근 ====================
+
+    @property
+    def layer_count(self) -> int:
+        """레이어 개수"""
+        return len(self._layers)
+
+    def layer_names(self) -> List[str]:
+        """정렬된 레이어 파일명 리스트"""
+        return [info.filename for info in self._layers]
+
+    def layer_info(self, layer_index: int) -> Optional[zipfile.ZipInfo]:
+        """레이어 인덱스의 ZipInfo (범위 밖이면 None)"""
+        if 0 <= layer_index < len(self._layers):
+            return self._layers[layer_index]
+        return None
+
+    def layer_bytes(self, layer_index: int) -> Optional[bytes]:
+        """
+        레이어 이미지 데이터
+
+        Args:
+            layer_index: 레이어 인덱스 (0부터 시작)
+
+        Returns:
+            PNG 바이트 데이터 또는 None (범위 초과)
+
+        Raises:
+            ValueError: 이미 닫힌 아카이브인 경우
+        """
+        info = self.layer_info(layer_index)
+        if info is None:
+            print(f"[Archive] 레이어 인덱스 범위 초과: {layer_index} (총 {len(self._layers)}개)")
+            return None
+
+        return self._read(info)
+
+    def layer_image(self, layer_index: int) -> Optional[QImage]:
+        """
+        레이어 프레임 디코딩 (Grayscale8 또는 Mono)
+
+        Returns:
+            QImage 또는 None (범위 초과)
+
+        Raises:
+            ValueError: 이미지 데이터가 손상된 경우
+        """
+        data = self.layer_bytes(layer_index)
+        if not data:
+            return None
+
+        image = QImage.fromData(data)
+        if image.isNull():
+            raise ValueError(f"이미지 데이터 손상 (레이어 {layer_index})")
+
+        # 8bit/1bit 컴팩트 형식으로 유지 (선읽기 큐 메모리 절감)
+        return compact_frame(image)
+
+    def frame_size(self) -> Optional[Tuple[int, int]]:
+        """첫 레이어 PNG 헤더의 (width, height) (디코딩 없음)"""
+        data = self.layer_bytes(0)
+        return png_size(data) if data else None
+
+    # ==================== 기타 엔트리 ====================
+
+    def has_entry(self, name: str) -> bool:
+        """엔트리 존재 여부"""
+        return name in self._entries
+
+    def read_entry(self, name: str) -> Optional[bytes]:
+        """이름으로 엔트리 읽기 (없으면 None)"""
+        info = self._entries.get(name)
+        if info is None:
+            return None
+
+        return self._read(info)
+
+    def _read(self, info: zipfile.ZipInfo) -> bytes:
+        """엔트리 읽기 (close() 이후 늦게 호출된 선읽기/검증은 ValueError)"""
+        with self._lock:
+            if self._zip is None:
+                raise ValueError(f"닫힌 아카이브에서 읽기: {info.filename}")
+            return self._zip.read(info)
+
+    def find_entry(self, names) -> Optional[str]:
+        """후보 이름 중 처음으로 존재하는 엔트리 이름 (대소문자 무시)"""
+        lowered = {name.lower(): name for name in self._entries}
+        for candidate in names:
+            found = lowered.get(candidate.lower())
+            if found:
+                return found
+        return None
+
+    def preview_bytes(self) -> Optional[bytes]:
+        """미리보기 이미지 데이터"""
+        name = self.find_entry(THUMBNAIL_NAMES)
+        if name is None:
+            # 정확한 이름이 없으면 preview가 포함된 파일 찾기
+            for entry in self._entries:
+                if 'preview' in entry.lower() and entry.lower().endswith('.png'):
+                    name = entry
+                    break
+
+        return self.read_entry(name) if name else None
+
+    # ==================== 수명 관리 ====================
+
+    def close(self):
+        """ZIP 파일 닫기"""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+    @property
+    def is_closed(self) -> bool:
+        return self._zip is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
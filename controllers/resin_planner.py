@@ -0,0 +1,204 @@
+"""
+VERICOM DLP 3D Printer - Resin Planner
+레이어 노광 면적 기반 레진 토출량 계획 (50cc 주사기, Y축)
+
+레이어 소모량 = 노광 면적(mm²) × 레이어 높이(mm) × 여유 배율
+Y 이동 거리 = 소모량 / Y 1mm당 토출량(mm³/mm), 최소/최대 거리로 제한.
+형상 인덱스가 없으면 기존처럼 고정 토출 거리 사용.
+토출 후 대기 시간은 토출 거리에 비례해 줄임 (적게 밀면 퍼지는 시간도 짧음).
+
+시작 전 예측: 계획 토출량(Push + Return - Pull)을 현재 Y 위치와 비교하여
+주사기 교체가 필요한 첫 레이어와 필요한 교체 횟수를 계산.
+"""
+
+from dataclasses import dataclass
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+# 50cc 주사기 전체 행정 (Y 0~125mm = 잔량 0~100%)
+SYRINGE_VOLUME_MM3 = 50000.0
+SYRINGE_STROKE_MM = 125.0
+
+# Y 1mm당 토출량 기본값 (보정 전, 전체 용량 / 전체 행정)
+DEFAULT_MM3_PER_MM = SYRINGE_VOLUME_MM3 / SYRINGE_STROKE_MM
+
+# 계획 리필 여유 (Y 0 홈 센서에 닿기 전에 멈춤)
+REFILL_RESERVE_MM = 1.0
+
+
+def scaled_delay(distance: float, full_distance: float, full_delay: float) -> float:
+    """토출 거리 비례 대기 시간 (full_distance 이상이면 full_delay)"""
+    if full_distance <= 0:
+        return full_delay
+    return full_delay * min(1.0, max(0.0, distance / full_distance))
+
+
+@dataclass(frozen=True)
+class DispensePlan:
+    """
+    작업 전체 토출 계획
+
+    distances: 레이어별 Y 토출 거리 (mm)
+    volumetric: 면적 기반 계획 여부 (False면 고정 거리)
+    """
+    distances: np.ndarray
+    mm3_per_mm: float
+    volumetric: bool
+
+    @property
+    def total_distance(self) -> float:
+        """총 Y 이동 거리 (mm)"""
+        return float(self.distances.sum())
+
+    @property
+    def total_volume_ml(self) -> float:
+        """총 토출량 (ml)"""
+        return self.total_distance * self.mm3_per_mm / 1000.0
+
+    def distance(self, layer_index: int) -> float:
+        """레이어 토출 거리 (mm, 범위 밖이면 0)"""
+        if not 0 <= layer_index < len(self.distances):
+            return 0.0
+        return float(self.distances[layer_index])
+
+    def total_delay(self, full_distance: float, full_delay: float) -> float:
+        """총 토출 후 대기 시간 (초, 고정 토출은 레이어마다 full_delay)"""
+        if not self.volumetric or full_distance <= 0:
+            return full_delay * len(self.distances)
+        ratios = np.clip(self.distances / full_distance, 0.0, 1.0)
+        return float(ratios.sum()) * full_delay
+
+    def summary(self) -> str:
+        """로그용 요약"""
+        mode = "면적 기반" if self.volumetric else "고정"
+        return (f"{mode} 토출 {len(self.distances)}개 레이어, 총 {self.total_distance:.1f}mm "
+                f"({self.total_volume_ml:.1f}ml)")
+
+
+@dataclass(frozen=True)
+class ResinPlanner:
+    """
+    레진 토출 계획기
+
+    사용 예:
+        planner = ResinPlanner(layer_height=0.05, overfill=1.5)
+        plan = planner.plan(total_layers, areas=geometry.areas_mm2, fixed_distance=1.0)
+    """
+    layer_height: float
+    mm3_per_mm: float = DEFAULT_MM3_PER_MM
+    overfill: float = 1.5        # 소모량 대비 토출 배율 (블레이드 손실, 막 두께 오차)
+    min_distance: float = 0.05   # 레이어당 최소 토출 거리 (mm)
+    max_distance: float = 5.0    # 레이어당 최대 토출 거리 (mm)
+
+    def distances_for_areas(self, areas: Sequence[float]) -> np.ndarray:
+        """노광 면적 배열(mm²) → 레이어별 Y 토출 거리(mm)"""
+        volumes = np.asarray(areas, dtype=np.float64) * self.layer_height * self.overfill
+        distances = volumes / max(1.0, self.mm3_per_mm)
+        low = min(self.min_distance, self.max_distance)
+        return np.clip(distances, low, self.max_distance)
+
+    def distance_for_area(self, area_mm2: float) -> float:
+        """단일 레이어 Y 토출 거리 (mm)"""
+        return float(self.distances_for_areas([area_mm2])[0])
+
+    def plan(self, total_layers: int, areas: Optional[Sequence[float]] = None,
+             fixed_distance: float = 1.0) -> DispensePlan:
+        """
+        작업 전체 토출 계획
+
+        Args:
+            total_layers: 총 레이어 수
+            areas: 레이어별 노광 면적 (mm², 없거나 레이어 수가 다르면 고정 거리)
+            fixed_distance: 고정 토출 거리 (mm/레이어)
+        """
+        if areas is not None and len(areas) == total_layers:
+            return DispensePlan(self.distances_for_areas(areas), self.mm3_per_mm, True)
+        distances = np.full(max(0, total_layers), max(0.0, fixed_distance), dtype=np.float64)
+        return DispensePlan(distances, self.mm3_per_mm, False)
+
+
+@dataclass(frozen=True)
+class ResinForecast:
+    """
+    프린트 시작 전 레진 예측
+
+    required/available: Y 이동 거리 (mm)
+    refill_layer: 주사기 교체가 필요한 첫 레이어 (0부터, 충분하면 None, -1이면 초기 토출)
+    refills: 필요한 주사기 교체 횟수
+    """
+    required: float
+    available: float
+    refill_layer: Optional[int]
+    refills: int
+    mm3_per_mm: float
+
+    @property
+    def sufficient(self) -> bool:
+        return self.refill_layer is None
+
+    @property
+    def required_ml(self) -> float:
+        return self.required * self.mm3_per_mm / 1000.0
+
+    @property
+    def available_ml(self) -> float:
+        return self.available * self.mm3_per_mm / 1000.0
+
+    def message(self) -> str:
+        """시작 전 안내 문구"""
+        text = f"필요 레진 {self.required_ml:.1f}ml / 잔량 {self.available_ml:.1f}ml"
+        if self.sufficient:
+            return text
+        where = "초기 토출" if self.refill_layer < 0 else f"레이어 {self.refill_layer + 1}"
+        return f"{text}\n{where}에서 주사기 교체 필요 (총 {self.refills}회)"
+
+
+def forecast_resin(plan: DispensePlan, start_position: float,
+                   pull_distance: float = 0.0, return_distance: float = 0.0,
+                   initial_distance: float = 0.0,
+                   reserve: float = REFILL_RESERVE_MM) -> ResinForecast:
+    """
+    프린트 전체 레진 소모 예측
+
+    Args:
+        plan: 레이어별 토출 계획
+        start_position: 현재 Y 위치 (mm, 프라이밍 위치 또는 Klipper 위치)
+        pull_distance: 레이어당 되돌리기 거리 (mm)
+        return_distance: 레이어당 다시 밀기 거리 (mm)
+        initial_distance: 초기 평탄화 전 토출 거리 (mm, 초기 평탄화 OFF면 0)
+        reserve: 홈 센서 전 여유 (mm)
+    """
+    # 레이어당 순 소모 = Push + Return - Pull (Pull이 더 크면 Push만)
+    net_extra = max(0.0, return_distance - pull_distance)
+    layer_net = np.where(plan.distances > 0, plan.distances + net_extra, 0.0)
+    initial = initial_distance + net_extra if initial_distance > 0 else 0.0
+    consumed = initial + np.cumsum(layer_net)
+    required = float(consumed[-1]) if len(consumed) else initial
+    available = max(0.0, start_position - reserve)
+
+    refill_layer = None
+    refills = 0
+    if required > available:
+        if initial > available:
+            refill_layer = -1
+        else:
+            refill_layer = int(np.argmax(consumed > available))
+        per_syringe = max(1.0, SYRINGE_STROKE_MM - reserve)
+        refills = math.ceil((required - available) / per_syringe)
+
+    return ResinForecast(required, available, refill_layer, refills, plan.mm3_per_mm)
+
+
+# 테스트용
+if __name__ == "__main__":
+    planner = ResinPlanner(layer_height=0.05)
+    for area in (0.0, 100.0, 2000.0, 8760.0):
+        print(f"{area:7.0f}mm² → {planner.distance_for_area(area):.3f}mm")
+
+    areas = np.linspace(200.0, 3000.0, 1000)
+    print(planner.plan(1000, areas=areas).summary())
+    print(planner.plan(1000, fixed_distance=1.0).summary())
+    print(forecast_resin(planner.plan(1000, fixed_distance=1.0), 80.0, initial_distance=1.0).message())
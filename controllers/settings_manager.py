@@ -34,6 +34,19 @@ class MaterialPreset:
     y_return_delay: float = 2.0     # Return 구간 시간 (초) → speed = dist/delay*60
     blade_start: float = 0.0        # 블레이드 시작 위치 (0~10mm)
     blade_end: float = 130.0        # 블레이드 끝 위치 (120~140mm)
+    blade_fit_sweep: bool = False   # 레이어 노광 영역까지만 평탄화 (형상 인덱스 필요)
+    blade_fit_margin: float = 10.0  # 노광 영역 끝 이후 안전 여유 (mm, 0~50)
+    blade_bidirectional: bool = False  # 양방향 평탄화 (짝수 번째 레이어 역방향, 복귀 생략)
+    lift_mode: str = "fixed"        # Z 리프트 정책 (fixed: +3mm / gcode: 파일 값 / adaptive: 면적 비례)
+    lift_min_height: float = 1.0    # adaptive 최소 리프트 높이 (mm, 0.5~10)
+    lift_full_area: float = 1500.0  # adaptive 파일 리프트를 그대로 쓰는 면적 (mm², 10~8760)
+    y_volumetric: bool = False      # 면적 기반 토출 (Resin Dist. = 레이어당 최대 거리)
+    y_overfill: float = 1.5         # 소모량 대비 토출 배율 (1.0~5.0)
+    y_min_distance: float = 0.05    # 면적 기반 레이어당 최소 토출 거리 (mm, 0~5.0)
+    xy_offset_px: int = 0           # XY 보정 (px, +팽창 / -침식, -10~10)
+    dim_percent: int = 100          # 내부 픽셀 밝기 (%, 50~100, 100=디밍 없음)
+    dim_depth_px: int = 8           # 디밍 시작 깊이 (외곽에서 내부로 px, 1~32)
+    aa_threshold: int = 0           # 안티앨리어싱 임계값 (0=사용 안 함, 1~255)
 
 
 @dataclass
@@ -110,6 +123,14 @@ class PrintSettings:
     y_dispense_speed: int = 3          # Resin 토출속도 (mm/s)
     y_dispense_delay: float = 5.0      # Resin 토출 대기시간 (초)
     y_priming_position: float = 0.0    # Resin 프라이밍 완료 위치 (mm)
+    deep_validation: bool = True       # 파일 선택 시 전체 레이어 심층 검증
+    blade_field_offset: float = 2.6    # 노광 영역 왼쪽 끝의 블레이드 X 위치 (mm)
+    resin_mm3_per_mm: float = 400.0    # Y 1mm당 토출량 (mm³, 50cc 주사기 보정값)
+    planned_refill: bool = True        # 잔량 부족 예상 레이어에서 미리 리필 일시정지
+    uniformity_enabled: bool = False   # 프로젝터 조도 균일화 마스크 적용
+    uniformity_grid: List[List[float]] = field(default_factory=list)  # 측정 조도 (mW/cm², 행=위→아래)
+    uniformity_file: str = ""          # 게인 이미지/.npy 경로 (있으면 격자보다 우선)
+    uniformity_min_gain: float = 0.7   # 최소 게인 (0.3~1.0)
 
 
 @dataclass
@@ -177,7 +198,15 @@ class SettingsManager:
                 y_dispense_distance=print_data.get('y_dispense_distance', 1.0),
                 y_dispense_speed=print_data.get('y_dispense_speed', 5),
                 y_dispense_delay=print_data.get('y_dispense_delay', 2.0),
-                y_priming_position=print_data.get('y_priming_position', 0.0)
+                y_priming_position=print_data.get('y_priming_position', 0.0),
+                deep_validation=print_data.get('deep_validation', True),
+                blade_field_offset=print_data.get('blade_field_offset', 2.6),
+                resin_mm3_per_mm=print_data.get('resin_mm3_per_mm', 400.0),
+                planned_refill=print_data.get('planned_refill', True),
+                uniformity_enabled=print_data.get('uniformity_enabled', False),
+                uniformity_grid=print_data.get('uniformity_grid', []),
+                uniformity_file=print_data.get('uniformity_file', ""),
+                uniformity_min_gain=print_data.get('uniformity_min_gain', 0.7),
             )
 
             # 기타 설정 로드
@@ -207,6 +236,19 @@ class SettingsManager:
                         y_return_delay=m.get('y_return_delay', 2.0),
                         blade_start=m.get('blade_start', 0.0),
                         blade_end=m.get('blade_end', 130.0),
+                        blade_fit_sweep=m.get('blade_fit_sweep', False),
+                        blade_fit_margin=m.get('blade_fit_margin', 10.0),
+                        blade_bidirectional=m.get('blade_bidirectional', False),
+                        lift_mode=m.get('lift_mode', "fixed"),
+                        lift_min_height=m.get('lift_min_height', 1.0),
+                        lift_full_area=m.get('lift_full_area', 1500.0),
+                        y_volumetric=m.get('y_volumetric', False),
+                        y_overfill=m.get('y_overfill', 1.5),
+                        y_min_distance=m.get('y_min_distance', 0.05),
+                        xy_offset_px=m.get('xy_offset_px', 0),
+                        dim_percent=m.get('dim_percent', 100),
+                        dim_depth_px=m.get('dim_depth_px', 8),
+                        aa_threshold=m.get('aa_threshold', 0),
                     ))
 
             self._settings.selected_material = data.get('selected_material', '')
@@ -410,6 +452,69 @@ class SettingsManager:
         self.save()
         print(f"[Settings] Resin priming position saved: {value}mm")
 
+    # ==================== Deep Validation ====================
+
+    def get_deep_validation(self) -> bool:
+        return self._settings.print_settings.deep_validation
+
+    def set_deep_validation(self, enabled: bool):
+        self._settings.print_settings.deep_validation = bool(enabled)
+        self.save()
+
+    # ==================== Blade Field Offset ====================
+
+    def get_blade_field_offset(self) -> float:
+        return self._settings.print_settings.blade_field_offset
+
+    def set_blade_field_offset(self, value: float):
+        value = max(0.0, min(20.0, value))
+        self._settings.print_settings.blade_field_offset = value
+        self.save()
+
+    # ==================== Resin Calibration ====================
+
+    def get_resin_mm3_per_mm(self) -> float:
+        return self._settings.print_settings.resin_mm3_per_mm
+
+    def set_resin_mm3_per_mm(self, value: float):
+        value = max(50.0, min(2000.0, value))
+        self._settings.print_settings.resin_mm3_per_mm = value
+        self.save()
+
+    def get_planned_refill(self) -> bool:
+        return self._settings.print_settings.planned_refill
+
+    def set_planned_refill(self, enabled: bool):
+        self._settings.print_settings.planned_refill = bool(enabled)
+        self.save()
+
+    # ==================== Projector Uniformity ====================
+
+    def get_uniformity_enabled(self) -> bool:
+        return self._settings.print_settings.uniformity_enabled
+
+    def set_uniformity_enabled(self, enabled: bool):
+        self._settings.print_settings.uniformity_enabled = bool(enabled)
+        self.save()
+
+    def get_uniformity_grid(self) -> List[List[float]]:
+        return self._settings.print_settings.uniformity_grid
+
+    def set_uniformity_grid(self, grid: List[List[float]]):
+        """측정 조도 격자 저장 (calibration_pattern 측정 위치 순서, 행=위→아래)"""
+        self._settings.print_settings.uniformity_grid = [[float(v) for v in row] for row in grid]
+        self.save()
+
+    def get_uniformity_file(self) -> str:
+        return self._settings.print_settings.uniformity_file
+
+    def set_uniformity_file(self, path: str):
+        self._settings.print_settings.uniformity_file = path
+        self.save()
+
+    def get_uniformity_min_gain(self) -> float:
+        return self._settings.print_settings.uniformity_min_gain
+
     # ==================== 테스트 모드 소재 프리셋 관리 ====================
 
     def get_test_materials(self) -> List[TestMaterialPreset]:
@@ -507,6 +612,16 @@ class SettingsManager:
             return self._settings.print_settings.y_dispense_delay
         elif key == "y_priming_position":
             return self._settings.print_settings.y_priming_position
+        elif key == "deep_validation":
+            return self._settings.print_settings.deep_validation
+        elif key == "blade_field_offset":
+            return self._settings.print_settings.blade_field_offset
+        elif key == "resin_mm3_per_mm":
+            return self._settings.print_settings.resin_mm3_per_mm
+        elif key == "planned_refill":
+            return self._settings.print_settings.planned_refill
+        elif key == "uniformity_enabled":
+            return self._settings.print_settings.uniformity_enabled
         return default
 
     def set(self, key: str, value):
@@ -527,6 +642,16 @@ class SettingsManager:
             self._settings.print_settings.y_dispense_delay = value
         elif key == "y_priming_position":
             self._settings.print_settings.y_priming_position = value
+        elif key == "deep_validation":
+            self._settings.print_settings.deep_validation = bool(value)
+        elif key == "blade_field_offset":
+            self._settings.print_settings.blade_field_offset = value
+        elif key == "resin_mm3_per_mm":
+            self._settings.print_settings.resin_mm3_per_mm = value
+        elif key == "planned_refill":
+            self._settings.print_settings.planned_refill = bool(value)
+        elif key == "uniformity_enabled":
+            self._settings.print_settings.uniformity_enabled = bool(value)
         self.save()
 
 
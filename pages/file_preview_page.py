@@ -4,7 +4,6 @@ VERICOM DLP 3D Printer GUI - File Preview Page
 """
 
 import os
-import zipfile
 import json
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -18,7 +17,7 @@ from components.numeric_keypad import NumericKeypad
 from styles.colors import Colors
 from styles.fonts import Fonts
 from styles.icons import Icons
-from controllers.gcode_parser import extract_print_parameters
+from controllers.job_manifest import JobManifest, load_manifest
 from controllers.settings_manager import get_settings, MaterialPreset
 
 
@@ -171,7 +170,7 @@ class MaterialSelectDialog(QDialog):
 class ConfirmDialog(QDialog):
     """확인 다이얼로그"""
 
-    def __init__(self, title: str, message: str, parent=None):
+    def __init__(self, title: str, message: str, parent=None, confirm_text: str = "Delete"):
         super().__init__(parent)
 
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
@@ -222,7 +221,7 @@ class ConfirmDialog(QDialog):
         """)
         self.btn_cancel.clicked.connect(self.reject)
 
-        self.btn_confirm = QPushButton("Delete")
+        self.btn_confirm = QPushButton(confirm_text)
         self.btn_confirm.setFixedSize(120, 44)
         self.btn_confirm.setFont(Fonts.body())
         self.btn_confirm.setCursor(Qt.PointingHandCursor)
@@ -323,6 +322,7 @@ class FilePreviewPage(BasePage):
 
         self._file_path = ""
         self._print_params = {}
+        self._manifest = None  # 현재 파일의 JobManifest
         self._selected_material_name = ""
         self._material_preset = None  # MaterialPreset
 
@@ -372,9 +372,25 @@ class FilePreviewPage(BasePage):
         self.lbl_filename.setFixedWidth(280)
         self.lbl_filename.setWordWrap(True)
 
+        # 로컬 스풀 상태 (USB → 내부 저장소 복사)
+        self.lbl_spool = QLabel()
+        self.lbl_spool.setFont(Fonts.body_small())
+        self.lbl_spool.setAlignment(Qt.AlignCenter)
+        self.lbl_spool.setFixedWidth(280)
+        self.lbl_spool.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+
+        # 심층 검증 상태
+        self.lbl_validation = QLabel()
+        self.lbl_validation.setFont(Fonts.body_small())
+        self.lbl_validation.setAlignment(Qt.AlignCenter)
+        self.lbl_validation.setFixedWidth(280)
+        self.lbl_validation.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+
         left_layout.addWidget(self.thumbnail_frame)
         left_layout.addSpacing(12)
         left_layout.addWidget(self.lbl_filename)
+        left_layout.addWidget(self.lbl_spool)
+        left_layout.addWidget(self.lbl_validation)
 
         # === 오른쪽: 정보 + 버튼 ===
         right_layout = QVBoxLayout()
@@ -535,50 +551,64 @@ class FilePreviewPage(BasePage):
             else:
                 row.set_value(f"{val:g} {unit}")
 
-    def set_file(self, file_path: str):
-        """파일 설정 및 정보 표시"""
+    def set_spool_status(self, text: str, color: str = None):
+        """로컬 스풀 상태 표시 (빈 문자열이면 숨김)"""
+        self.lbl_spool.setText(text)
+        self.lbl_spool.setStyleSheet(f"color: {color or Colors.TEXT_SECONDARY};")
+
+    def set_validation_status(self, text: str, color: str = None):
+        """심층 검증 상태 표시 (빈 문자열이면 숨김)"""
+        self.lbl_validation.setText(text)
+        self.lbl_validation.setStyleSheet(f"color: {color or Colors.TEXT_SECONDARY};")
+
+    def set_file(self, file_path: str, manifest: JobManifest = None):
+        """
+        파일 설정 및 정보 표시
+
+        Args:
+            file_path: 프린트 파일 경로
+            manifest: 선택 시 만든 JobManifest (None이면 캐시에서 조회)
+        """
         self._file_path = file_path
+        self._manifest = None
+        self.set_spool_status("")
+        self.set_validation_status("")
 
         # 파일명 표시
         filename = os.path.basename(file_path)
         self.lbl_filename.setText(filename)
 
-        # 파일 형식 확인
+        # 파일 형식 확인 (.dlp는 ZIP/ChiTu 모두 가능, 내용으로 판별)
         ext = os.path.splitext(file_path)[1].lower()
 
-        if ext == '.zip':
-            self._load_zip_info(file_path)
+        if ext in ('.zip', '.dlp', '.ctb', '.photon'):
+            self._load_file_info(file_path, manifest)
         else:
             self._clear_info()
 
-    def _load_zip_info(self, file_path: str):
-        """ZIP 파일에서 정보 로드 (검증은 main.py에서 완료됨)"""
+    def _load_file_info(self, file_path: str, manifest: JobManifest = None):
+        """JobManifest에서 정보 표시 (검증은 app.py에서 완료됨, 파일을 다시 열지 않음)"""
         try:
-            with zipfile.ZipFile(file_path, 'r') as z:
-                # 썸네일 로드
-                preview_names = ['preview_cropping.png', 'preview.png', 'thumbnail.png']
-                thumbnail_loaded = False
-
-                for name in preview_names:
-                    if name in z.namelist():
-                        data = z.read(name)
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(data)
-                        scaled = pixmap.scaled(260, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        self.lbl_thumbnail.setPixmap(scaled)
-                        thumbnail_loaded = True
-                        break
-
-                if not thumbnail_loaded:
-                    self.lbl_thumbnail.setPixmap(Icons.get_pixmap(Icons.FILE, 64, Colors.TEXT_DISABLED))
-
-            # gcode_parser를 사용하여 전체 파라미터 추출 (totalLayer 포함)
-            self._print_params = extract_print_parameters(file_path)
+            if manifest is None or manifest.path != file_path:
+                manifest = load_manifest(file_path)
+            self._manifest = manifest
+
+            # 썸네일
+            preview = manifest.preview
+            if preview is not None:
+                pixmap = QPixmap.fromImage(preview)
+                scaled = pixmap.scaled(260, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                self.lbl_thumbnail.setPixmap(scaled)
+            else:
+                self.lbl_thumbnail.setPixmap(Icons.get_pixmap(Icons.FILE, 64, Colors.TEXT_DISABLED))
+
+            # 전체 파라미터 (totalLayer 포함, ChiTu는 헤더)
+            self._print_params = manifest.params_dict()
             print(f"[FilePreview] 파라미터 추출 완료: totalLayer={self._print_params.get('totalLayer', 0)}")
             self._update_info_display()
 
         except Exception as e:
-            print(f"ZIP 파일 로드 오류: {e}")
+            print(f"프린트 파일 로드 오류: {e}")
             self._clear_info()
             self.lbl_thumbnail.setPixmap(Icons.get_pixmap(Icons.FILE, 64, Colors.TEXT_DISABLED))
 
@@ -659,6 +689,19 @@ class FilePreviewPage(BasePage):
             'yReturnDelay': preset.y_return_delay,
             'bladeStart': preset.blade_start,
             'bladeEnd': preset.blade_end,
+            'bladeFitSweep': preset.blade_fit_sweep,
+            'bladeFitMargin': preset.blade_fit_margin,
+            'bladeBidirectional': preset.blade_bidirectional,
+            'liftMode': preset.lift_mode,
+            'liftMinHeight': preset.lift_min_height,
+            'liftFullArea': preset.lift_full_area,
+            'yVolumetric': preset.y_volumetric,
+            'yOverfill': preset.y_overfill,
+            'yMinDistance': preset.y_min_distance,
+            'xyOffsetPx': preset.xy_offset_px,
+            'dimPercent': preset.dim_percent,
+            'dimDepthPx': preset.dim_depth_px,
+            'aaThreshold': preset.aa_threshold,
             'materialName': preset.name,
         }
         self.start_print.emit(self._file_path, full_params)
@@ -667,6 +710,10 @@ class FilePreviewPage(BasePage):
         """현재 파일 경로 반환"""
         return self._file_path
 
+    def get_manifest(self) -> JobManifest:
+        """현재 파일의 JobManifest (없으면 None)"""
+        return self._manifest
+
     def get_print_params(self) -> dict:
         """프린트 파라미터 반환"""
         if not self._material_preset:
@@ -690,4 +737,17 @@ class FilePreviewPage(BasePage):
             'yReturnDelay': preset.y_return_delay,
             'bladeStart': preset.blade_start,
             'bladeEnd': preset.blade_end,
+            'bladeFitSweep': preset.blade_fit_sweep,
+            'bladeFitMargin': preset.blade_fit_margin,
+            'bladeBidirectional': preset.blade_bidirectional,
+            'liftMode': preset.lift_mode,
+            'liftMinHeight': preset.lift_min_height,
+            'liftFullArea': preset.lift_full_area,
+            'yVolumetric': preset.y_volumetric,
+            'yOverfill': preset.y_overfill,
+            'yMinDistance': preset.y_min_distance,
+            'xyOffsetPx': preset.xy_offset_px,
+            'dimPercent': preset.dim_percent,
+            'dimDepthPx': preset.dim_depth_px,
+            'aaThreshold': preset.aa_threshold,
         }
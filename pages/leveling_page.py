@@ -254,7 +254,7 @@ class LevelingPage(BasePage):
             self.x_move.emit(75.0, 600)  # 10mm/s = 600mm/min
 
     def on_motor_finished(self):
-        """모터 작업 완료 시 main.py에서 호출"""
+        """모터 작업 완료 시 app.py에서 호출"""
         self._busy = False
         self.level_panel.advance_step()
         self.level_panel.set_action_enabled(True)
@@ -3,7 +3,7 @@ VERICOM DLP 3D Printer GUI - Material Preset Page
 소재별 프린트 프리셋 관리 (추가/편집/삭제)
 """
 
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QScrollArea, QDialog, QLineEdit
@@ -17,6 +17,12 @@ from styles.fonts import Fonts
 from styles.icons import Icons
 from styles.stylesheets import Radius
 from controllers.settings_manager import get_settings, MaterialPreset
+from controllers.lift_policy import LIFT_MODES
+from compute.layer_transform import MAX_OFFSET_PX, MIN_DIM_PERCENT
+
+
+# 리프트 정책 버튼 표시 이름
+LIFT_MODE_LABELS = {"fixed": "FIXED", "gcode": "FILE", "adaptive": "AUTO"}
 
 
 class MaterialNameDialog(QDialog):
@@ -348,6 +354,13 @@ class MaterialPage(BasePage):
         self.row_y_return_delay = MaterialEditRow("Return Delay", 2.0, "s", 0.1, 20.0, allow_decimal=True)
         self.row_blade_start = MaterialEditRow("Blade Start", 0.0, "mm", 0.0, 20.0, allow_decimal=True)
         self.row_blade_end = MaterialEditRow("Blade End", 130.0, "mm", 120.0, 140.0, allow_decimal=True)
+        self.row_fit_margin = MaterialEditRow("Fit Margin", 10.0, "mm", 0.0, 50.0, allow_decimal=True)
+        self.row_lift_min = MaterialEditRow("Min Lift", 1.0, "mm", 0.5, 10.0, allow_decimal=True)
+        self.row_lift_area = MaterialEditRow("Full Lift Area", 1500, "mm²", 10, 8760)
+        self.row_y_overfill = MaterialEditRow("Overfill", 1.5, "x", 1.0, 5.0, allow_decimal=True)
+        self.row_y_min_dist = MaterialEditRow("Min Resin Dist.", 0.05, "mm", 0.0, 5.0, allow_decimal=True)
+        self.row_xy_comp = MaterialEditRow("XY Comp.", 0, "px", 0, MAX_OFFSET_PX)
+        self.row_dim = MaterialEditRow("Dimming", 100, "%", MIN_DIM_PERCENT, 100)
 
         # Leveling ON/OFF 토글 버튼
         self._leveling_on = True
@@ -368,6 +381,95 @@ class MaterialPage(BasePage):
         lev_layout.addWidget(self.row_y_delay, 1)
         lev_layout.addWidget(self.btn_leveling, 1)
 
+        # 노광 영역 맞춤 평탄화 ON/OFF 토글 (형상 인덱스 기반)
+        self._fit_sweep_on = False
+        self.btn_fit_sweep = QPushButton("Fit Sweep OFF")
+        self.btn_fit_sweep.setFixedHeight(36)
+        self.btn_fit_sweep.setFont(Fonts.body_small())
+        self.btn_fit_sweep.setCursor(Qt.PointingHandCursor)
+        self.btn_fit_sweep.clicked.connect(self._on_fit_sweep_toggle)
+        self._update_fit_sweep_style()
+
+        # 양방향 평탄화 ON/OFF 토글
+        self._bidir_on = False
+        self.btn_bidir = QPushButton("Bi-Dir OFF")
+        self.btn_bidir.setFixedHeight(36)
+        self.btn_bidir.setFont(Fonts.body_small())
+        self.btn_bidir.setCursor(Qt.PointingHandCursor)
+        self.btn_bidir.clicked.connect(self._on_bidir_toggle)
+        self._update_bidir_style()
+
+        # Fit Margin + Fit Sweep + Bi-Dir 토글 행
+        self._fit_sweep_row = QFrame()
+        self._fit_sweep_row.setFixedHeight(36)
+        self._fit_sweep_row.setStyleSheet("background: transparent; border: none;")
+        fit_layout = QHBoxLayout(self._fit_sweep_row)
+        fit_layout.setContentsMargins(0, 0, 0, 0)
+        fit_layout.setSpacing(6)
+        fit_layout.addWidget(self.row_fit_margin, 2)
+        fit_layout.addWidget(self.btn_fit_sweep, 1)
+        fit_layout.addWidget(self.btn_bidir, 1)
+
+        # 리프트 정책 순환 버튼 (FIXED → FILE → AUTO)
+        self._lift_mode = "fixed"
+        self.btn_lift_mode = QPushButton("Lift FIXED")
+        self.btn_lift_mode.setFixedHeight(36)
+        self.btn_lift_mode.setFont(Fonts.body_small())
+        self.btn_lift_mode.setCursor(Qt.PointingHandCursor)
+        self.btn_lift_mode.clicked.connect(self._on_lift_mode_cycle)
+        self._update_lift_mode_style()
+
+        # Min Lift + Full Lift Area + Lift 모드 행
+        self._lift_row = QFrame()
+        self._lift_row.setFixedHeight(36)
+        self._lift_row.setStyleSheet("background: transparent; border: none;")
+        lift_layout = QHBoxLayout(self._lift_row)
+        lift_layout.setContentsMargins(0, 0, 0, 0)
+        lift_layout.setSpacing(6)
+        lift_layout.addWidget(self.row_lift_min, 2)
+        lift_layout.addWidget(self.row_lift_area, 2)
+        lift_layout.addWidget(self.btn_lift_mode, 1)
+
+        # 면적 기반 토출 ON/OFF 토글 (형상 인덱스 기반, Resin Dist.가 최대값)
+        self._volumetric_on = False
+        self.btn_volumetric = QPushButton("Vol. OFF")
+        self.btn_volumetric.setFixedHeight(36)
+        self.btn_volumetric.setFont(Fonts.body_small())
+        self.btn_volumetric.setCursor(Qt.PointingHandCursor)
+        self.btn_volumetric.clicked.connect(self._on_volumetric_toggle)
+        self._update_volumetric_style()
+
+        # Overfill + Min Resin Dist. + Vol. 토글 행
+        self._volumetric_row = QFrame()
+        self._volumetric_row.setFixedHeight(36)
+        self._volumetric_row.setStyleSheet("background: transparent; border: none;")
+        vol_layout = QHBoxLayout(self._volumetric_row)
+        vol_layout.setContentsMargins(0, 0, 0, 0)
+        vol_layout.setSpacing(6)
+        vol_layout.addWidget(self.row_y_overfill, 2)
+        vol_layout.addWidget(self.row_y_min_dist, 2)
+        vol_layout.addWidget(self.btn_volumetric, 1)
+
+        # XY 보정 방향 버튼 (SHRINK: 침식 / GROW: 팽창, 키패드에 음수 입력이 없으므로 분리)
+        self._xy_grow = False
+        self.btn_xy_dir = QPushButton("XY SHRINK")
+        self.btn_xy_dir.setFixedHeight(36)
+        self.btn_xy_dir.setFont(Fonts.body_small())
+        self.btn_xy_dir.setCursor(Qt.PointingHandCursor)
+        self.btn_xy_dir.clicked.connect(self._on_xy_dir_toggle)
+        self._update_xy_dir_style()
+
+        # XY Comp. + Dimming + 방향 행 (레이어 보정, AA 임계값/디밍 깊이는 프리셋 JSON)
+        self._compensation_row = QFrame()
+        self._compensation_row.setFixedHeight(36)
+        self._compensation_row.setStyleSheet("background: transparent; border: none;")
+        comp_layout = QHBoxLayout(self._compensation_row)
+        comp_layout.setContentsMargins(0, 0, 0, 0)
+        comp_layout.setSpacing(6)
+        comp_layout.addWidget(self.row_xy_comp, 2)
+        comp_layout.addWidget(self.row_dim, 2)
+        comp_layout.addWidget(self.btn_xy_dir, 1)
+
         self._pair_rows = [
             MaterialEditPairRow(self.row_blade_speed, self.row_blade_speed2),
             MaterialEditPairRow(self.row_blade_boundary, self.row_led_power),
@@ -384,6 +486,23 @@ class MaterialPage(BasePage):
             if pair is self._pair_rows[3]:  # Resin Dist/Speed 다음에 Resin Delay + Leveling 행 삽입
                 self.row_y_delay.value_changed.connect(self._on_value_changed)
                 right_layout.addWidget(self._leveling_row)
+                self.row_y_overfill.value_changed.connect(self._on_value_changed)
+                self.row_y_min_dist.value_changed.connect(self._on_value_changed)
+                right_layout.addWidget(self._volumetric_row)
+
+        # Blade Start/End 다음에 Fit Margin + Fit Sweep 행
+        self.row_fit_margin.value_changed.connect(self._on_value_changed)
+        right_layout.addWidget(self._fit_sweep_row)
+
+        # 리프트 정책 행
+        self.row_lift_min.value_changed.connect(self._on_value_changed)
+        self.row_lift_area.value_changed.connect(self._on_value_changed)
+        right_layout.addWidget(self._lift_row)
+
+        # 레이어 보정 행
+        self.row_xy_comp.value_changed.connect(self._on_value_changed)
+        self.row_dim.value_changed.connect(self._on_value_changed)
+        right_layout.addWidget(self._compensation_row)
 
         right_layout.addStretch()
 
@@ -478,6 +597,23 @@ class MaterialPage(BasePage):
         self.row_blade_end.set_value(preset.blade_end)
         self._leveling_on = preset.initial_leveling
         self._update_leveling_style()
+        self.row_fit_margin.set_value(preset.blade_fit_margin)
+        self._fit_sweep_on = preset.blade_fit_sweep
+        self._update_fit_sweep_style()
+        self._bidir_on = preset.blade_bidirectional
+        self._update_bidir_style()
+        self.row_lift_min.set_value(preset.lift_min_height)
+        self.row_lift_area.set_value(preset.lift_full_area)
+        self._lift_mode = preset.lift_mode if preset.lift_mode in LIFT_MODES else "fixed"
+        self._update_lift_mode_style()
+        self.row_y_overfill.set_value(preset.y_overfill)
+        self.row_y_min_dist.set_value(preset.y_min_distance)
+        self._volumetric_on = preset.y_volumetric
+        self._update_volumetric_style()
+        self.row_xy_comp.set_value(abs(preset.xy_offset_px))
+        self._xy_grow = preset.xy_offset_px > 0
+        self._update_xy_dir_style()
+        self.row_dim.set_value(preset.dim_percent)
 
         self._update_list_styles()
 
@@ -486,7 +622,10 @@ class MaterialPage(BasePage):
         if not self._current_material_name:
             return
 
-        preset = MaterialPreset(
+        # 편집 패널에 없는 필드는 기존 프리셋 값 유지
+        current = get_settings().get_material_by_name(self._current_material_name)
+        preset = replace(
+            current or MaterialPreset(),
             name=self._current_material_name,
             blade_speed=int(self.row_blade_speed.get_value()),
             blade_speed2=int(self.row_blade_speed2.get_value()),
@@ -504,6 +643,17 @@ class MaterialPage(BasePage):
             blade_start=self.row_blade_start.get_value(),
             blade_end=self.row_blade_end.get_value(),
             initial_leveling=self._leveling_on,
+            blade_fit_sweep=self._fit_sweep_on,
+            blade_fit_margin=self.row_fit_margin.get_value(),
+            blade_bidirectional=self._bidir_on,
+            lift_mode=self._lift_mode,
+            lift_min_height=self.row_lift_min.get_value(),
+            lift_full_area=self.row_lift_area.get_value(),
+            y_volumetric=self._volumetric_on,
+            y_overfill=self.row_y_overfill.get_value(),
+            y_min_distance=self.row_y_min_dist.get_value(),
+            xy_offset_px=int(self.row_xy_comp.get_value()) * (1 if self._xy_grow else -1),
+            dim_percent=int(self.row_dim.get_value()),
         )
         get_settings().update_material(self._current_material_name, preset)
 
@@ -513,11 +663,69 @@ class MaterialPage(BasePage):
         self._update_leveling_style()
         self._on_value_changed()
 
+    def _on_fit_sweep_toggle(self):
+        """노광 영역 맞춤 평탄화 ON/OFF 토글"""
+        self._fit_sweep_on = not self._fit_sweep_on
+        self._update_fit_sweep_style()
+        self._on_value_changed()
+
+    def _update_fit_sweep_style(self):
+        """Fit Sweep 토글 버튼 스타일 갱신"""
+        self._apply_toggle_style(self.btn_fit_sweep, "Fit Sweep", self._fit_sweep_on)
+
+    def _on_bidir_toggle(self):
+        """양방향 평탄화 ON/OFF 토글"""
+        self._bidir_on = not self._bidir_on
+        self._update_bidir_style()
+        self._on_value_changed()
+
+    def _update_bidir_style(self):
+        """Bi-Dir 토글 버튼 스타일 갱신"""
+        self._apply_toggle_style(self.btn_bidir, "Bi-Dir", self._bidir_on)
+
+    def _on_volumetric_toggle(self):
+        """면적 기반 토출 ON/OFF 토글"""
+        self._volumetric_on = not self._volumetric_on
+        self._update_volumetric_style()
+        self._on_value_changed()
+
+    def _update_volumetric_style(self):
+        """Vol. 토글 버튼 스타일 갱신"""
+        self._apply_toggle_style(self.btn_volumetric, "Vol.", self._volumetric_on)
+
+    def _on_xy_dir_toggle(self):
+        """XY 보정 방향 전환 (침식 ↔ 팽창)"""
+        self._xy_grow = not self._xy_grow
+        self._update_xy_dir_style()
+        self._on_value_changed()
+
+    def _update_xy_dir_style(self):
+        """XY 방향 버튼 스타일 갱신 (GROW 강조)"""
+        self._apply_toggle_style(self.btn_xy_dir, "XY", self._xy_grow)
+        self.btn_xy_dir.setText("XY GROW" if self._xy_grow else "XY SHRINK")
+
+    def _on_lift_mode_cycle(self):
+        """리프트 정책 순환 (fixed → gcode → adaptive)"""
+        index = LIFT_MODES.index(self._lift_mode) if self._lift_mode in LIFT_MODES else -1
+        self._lift_mode = LIFT_MODES[(index + 1) % len(LIFT_MODES)]
+        self._update_lift_mode_style()
+        self._on_value_changed()
+
+    def _update_lift_mode_style(self):
+        """Lift 모드 버튼 스타일 갱신 (fixed 외에는 강조)"""
+        self._apply_toggle_style(self.btn_lift_mode, "Lift", self._lift_mode != "fixed")
+        self.btn_lift_mode.setText(f"Lift {LIFT_MODE_LABELS.get(self._lift_mode, 'FIXED')}")
+
     def _update_leveling_style(self):
         """토글 버튼 스타일 갱신"""
-        if self._leveling_on:
-            self.btn_leveling.setText("Leveling ON")
-            self.btn_leveling.setStyleSheet(f"""
+        self._apply_toggle_style(self.btn_leveling, "Leveling", self._leveling_on)
+
+    @staticmethod
+    def _apply_toggle_style(button: QPushButton, label: str, on: bool):
+        """ON/OFF 토글 버튼 텍스트 + 스타일"""
+        if on:
+            button.setText(f"{label} ON")
+            button.setStyleSheet(f"""
                 QPushButton {{
                     background-color: {Colors.CYAN};
                     color: {Colors.WHITE};
@@ -528,8 +736,8 @@ class MaterialPage(BasePage):
                 QPushButton:pressed {{ background-color: {Colors.CYAN_DARK}; }}
             """)
         else:
-            self.btn_leveling.setText("Leveling OFF")
-            self.btn_leveling.setStyleSheet(f"""
+            button.setText(f"{label} OFF")
+            button.setStyleSheet(f"""
                 QPushButton {{
                     background-color: {Colors.BG_PRIMARY};
                     color: {Colors.TEXT_SECONDARY};
@@ -3,19 +3,22 @@ VERICOM DLP 3D Printer GUI - Print Page (File Selection)
 """
 
 import os
-import zipfile
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLabel, QFrame
 )
-from PySide6.QtCore import Signal, Qt, QTimer, QSize
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Signal, Qt, QSize
+from PySide6.QtGui import QPixmap, QIcon, QImage
 
 from pages.base_page import BasePage
 from components.icon_button import IconButton
 from styles.colors import Colors
 from styles.fonts import Fonts
 from styles.icons import Icons
+from utils.job_cache import file_key
+from utils.media_scanner import get_media_scanner
+from utils.time_formatter import format_duration
+from workers.thumbnail_loader import ThumbnailLoader
 from styles.stylesheets import (
     BUTTON_FILE_ITEM_STYLE, BUTTON_FILE_ITEM_SELECTED_STYLE,
     get_button_nav_style
@@ -23,7 +26,7 @@ from styles.stylesheets import (
 
 
 class FileItem(QFrame):
-    """파일 아이템 위젯 (썸네일 위 + 파일명 아래)"""
+    """파일 아이템 위젯 (썸네일 위 + 파일명 + 레이어 수/예상 시간 아래)"""
     
     clicked = Signal()
     
@@ -32,6 +35,7 @@ class FileItem(QFrame):
         
         self._filename = ""
         self._filepath = ""
+        self._file_key = ""  # 표시 중인 파일의 (경로, 크기, 수정시각) 키 — 같으면 다시 그리지 않음
         self._is_selected = False
         
         self.setCursor(Qt.PointingHandCursor)
@@ -42,13 +46,13 @@ class FileItem(QFrame):
     def _setup_ui(self):
         """UI 구성"""
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(8)
+        layout.setContentsMargins(10, 8, 10, 8)
+        layout.setSpacing(4)
         layout.setAlignment(Qt.AlignCenter)
         
         # 썸네일 이미지
         self.lbl_thumbnail = QLabel()
-        self.lbl_thumbnail.setFixedSize(100, 100)
+        self.lbl_thumbnail.setFixedSize(96, 96)
         self.lbl_thumbnail.setAlignment(Qt.AlignCenter)
         self.lbl_thumbnail.setStyleSheet(f"""
             background-color: {Colors.BG_TERTIARY};
@@ -67,8 +71,16 @@ class FileItem(QFrame):
         """)
         self.lbl_filename.setFixedWidth(180)
         
+        # 레이어 수 / 예상 시간 (비동기 로드 후 표시)
+        self.lbl_info = QLabel()
+        self.lbl_info.setAlignment(Qt.AlignCenter)
+        self.lbl_info.setFont(Fonts.caption())
+        self.lbl_info.setFixedWidth(180)
+        self._set_info("")
+        
         layout.addWidget(self.lbl_thumbnail, alignment=Qt.AlignCenter)
         layout.addWidget(self.lbl_filename, alignment=Qt.AlignCenter)
+        layout.addWidget(self.lbl_info, alignment=Qt.AlignCenter)
     
     def _update_style(self):
         """선택 상태에 따른 스타일"""
@@ -111,51 +123,61 @@ class FileItem(QFrame):
                 display_name = display_name[:15] + "..."
             self.lbl_filename.setText(display_name)
             
-            # 썸네일 로드 시도
-            thumbnail = self._load_thumbnail()
-            if thumbnail:
-                self.lbl_thumbnail.setPixmap(thumbnail)
-            else:
-                # 기본 아이콘
-                self.lbl_thumbnail.setPixmap(
-                    Icons.get_pixmap(Icons.FILE_TEXT, 48, Colors.NAVY)
-                )
+            # 기본 아이콘 먼저 표시, 썸네일은 ThumbnailLoader 결과로 교체
+            self.lbl_thumbnail.setPixmap(
+                Icons.get_pixmap(Icons.FILE_TEXT, 48, Colors.NAVY)
+            )
+            self._set_info("...")
         else:
             self.lbl_filename.setText("")
             self.lbl_thumbnail.setPixmap(
                 Icons.get_pixmap(Icons.FILE, 48, Colors.TEXT_DISABLED)
             )
+            self._set_info("")
     
-    def _load_thumbnail(self) -> QPixmap:
-        """ZIP 파일에서 썸네일 로드"""
-        if not self._filepath:
-            return None
-        
-        ext = os.path.splitext(self._filepath)[1].lower()
-        if ext != '.zip':
-            return None
-        
-        try:
-            with zipfile.ZipFile(self._filepath, 'r') as z:
-                # 미리보기 이미지 찾기
-                preview_names = ['preview_cropping.png', 'preview.png', 'thumbnail.png']
-                for name in preview_names:
-                    if name in z.namelist():
-                        data = z.read(name)
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(data)
-                        # 썸네일 크기에 맞게 스케일
-                        return pixmap.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        except:
-            pass
-        
-        return None
+    def _set_info(self, text: str, color: str = None):
+        """정보 줄 표시 (기본 보조 텍스트 색상)"""
+        self.lbl_info.setText(text)
+        self.lbl_info.setStyleSheet(f"""
+            color: {color or Colors.TEXT_SECONDARY};
+            background-color: transparent;
+            border: none;
+        """)
     
-    def set_file(self, filepath: str):
-        """파일 설정"""
+    def set_file(self, filepath: str) -> bool:
+        """
+        파일 설정 (같은 파일이 바뀌지 않았으면 그대로 유지)
+        
+        Returns:
+            썸네일/메타데이터 로드가 필요하면 True
+        """
+        key = file_key(filepath) if filepath else None
+        if filepath == self._filepath and key == self._file_key:
+            return False
+        self._file_key = key
         self._filepath = filepath
         self._filename = os.path.basename(filepath) if filepath else ""
         self._update_content()
+        return bool(filepath)
+    
+    def set_thumbnail(self, image: QImage):
+        """썸네일 표시 (None이면 기본 아이콘 유지)"""
+        if image is not None and not image.isNull():
+            self.lbl_thumbnail.setPixmap(QPixmap.fromImage(image))
+    
+    def set_meta(self, meta: dict):
+        """레이어 수 / 예상 시간 표시 (검증 실패 파일은 경고 표시)"""
+        if not meta.get('valid', True):
+            self._set_info("✕ Invalid file", Colors.RED)
+            return
+        layers = meta.get('layers', 0)
+        seconds = meta.get('time', 0.0)
+        parts = []
+        if layers > 0:
+            parts.append(f"{layers} L")
+        if seconds > 0:
+            parts.append(format_duration(seconds))
+        self._set_info(" · ".join(parts) if parts else "-")
     
     def set_selected(self, selected: bool):
         """선택 상태 설정"""
@@ -199,8 +221,14 @@ class PrintPage(BasePage):
         self._files_per_page = 6    # 페이지당 파일 수
         self._selected_index = None # 선택된 파일 인덱스
         
+        # 썸네일/메타데이터 비동기 로더 (그리드는 기본 아이콘으로 먼저 표시)
+        self._thumbnail_loader = ThumbnailLoader(self)
+        self._thumbnail_loader.loaded.connect(self._on_thumbnail_loaded)
+        
+        self._scanner = get_media_scanner()
+        self._subscribed = False
+        
         self._setup_content()
-        self._setup_polling()
     
     def _setup_content(self):
         """콘텐츠 구성"""
@@ -288,66 +316,55 @@ class PrintPage(BasePage):
         
         self.content_layout.addLayout(wrapper_layout)
     
-    def _setup_polling(self):
-        """USB 폴링 타이머 설정"""
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._scan_files)
-        self._poll_timer.setInterval(2000)  # 2초마다
-    
     def start_polling(self):
-        """폴링 시작"""
-        self._scan_files()
-        self._poll_timer.start()
+        """USB 파일 목록 구독 시작 (공유 MediaScanner, 마운트/파일 변경 시에만 갱신)"""
+        if not self._subscribed:
+            self._subscribed = True
+            self._scanner.files_changed.connect(self._on_files_changed)
+            self._scanner.start()
+        self._on_files_changed(self._scanner.files())
     
     def stop_polling(self):
-        """폴링 중지"""
-        self._poll_timer.stop()
+        """구독 해제 (대기 중인 썸네일 로드도 취소)"""
+        if self._subscribed:
+            self._subscribed = False
+            self._scanner.files_changed.disconnect(self._on_files_changed)
+            self._scanner.stop()
+        self._thumbnail_loader.cancel_all()
     
-    def _scan_files(self):
-        """USB에서 파일 스캔"""
-        self._file_paths = []
+    def _on_files_changed(self, files: list):
+        """USB 파일 목록 변경"""
+        selected = self.get_selected_file()
+        self._file_paths = list(files)
         
-        # /media 디렉토리에서 마운트된 USB 찾기 (3단계 스캔)
-        media_path = "/media"
-        if os.path.exists(media_path):
-            try:
-                for user in os.listdir(media_path):
-                    user_path = os.path.join(media_path, user)
-                    if os.path.isdir(user_path):
-                        try:
-                            for device in os.listdir(user_path):
-                                device_path = os.path.join(user_path, device)
-                                if os.path.isdir(device_path):
-                                    self._scan_directory(device_path)
-                        except PermissionError:
-                            continue
-            except PermissionError:
-                pass
+        # 목록이 바뀌어도 같은 파일 선택 유지
+        if selected is not None:
+            self._selected_index = (self._file_paths.index(selected)
+                                    if selected in self._file_paths else None)
+            if self._selected_index is None:
+                self.btn_open.setEnabled(False)
+                self._update_open_button()
+        
+        # 파일이 줄어 현재 페이지가 비면 마지막 페이지로
+        total_pages = max(1, (len(self._file_paths) + self._files_per_page - 1) // self._files_per_page)
+        self._current_page = min(self._current_page, total_pages - 1)
         
         self._update_file_grid()
     
-    def _scan_directory(self, path: str):
-        """디렉토리 스캔 (DLP 프린터 파일 찾기)"""
-        try:
-            for item in sorted(os.listdir(path)):
-                item_path = os.path.join(path, item)
-                if os.path.isfile(item_path):
-                    ext = os.path.splitext(item)[1].lower()
-                    # DLP 프린터 파일 확장자
-                    if ext in ['.zip', '.dlp', '.photon', '.ctb']:
-                        self._file_paths.append(item_path)
-        except PermissionError:
-            pass
-    
     def _update_file_grid(self):
         """파일 그리드 업데이트"""
         start_idx = self._current_page * self._files_per_page
+        visible = self._file_paths[start_idx:start_idx + self._files_per_page]
+        
+        # 화면에서 벗어난 파일의 로드 요청 취소
+        self._thumbnail_loader.retain(visible)
         
         for i, item in enumerate(self._file_items):
             file_idx = start_idx + i
             
             if file_idx < len(self._file_paths):
-                item.set_file(self._file_paths[file_idx])
+                if item.set_file(self._file_paths[file_idx]):
+                    self._thumbnail_loader.request(self._file_paths[file_idx])
                 item.setEnabled(True)
                 item.set_selected(file_idx == self._selected_index)
             else:
@@ -360,6 +377,19 @@ class PrintPage(BasePage):
         self.btn_up.setEnabled(self._current_page > 0)
         self.btn_down.setEnabled(self._current_page < total_pages - 1)
     
+    def _on_thumbnail_loaded(self, file_path: str, image, meta: dict):
+        """썸네일/메타데이터 로드 완료 (해당 파일을 표시 중인 아이템에 반영)"""
+        for item in self._file_items:
+            if item.get_filepath() == file_path:
+                item.set_thumbnail(image)
+                item.set_meta(meta)
+    
+    def update_file_meta(self, file_path: str, meta: dict):
+        """백그라운드 카탈로그 분석 결과 반영 (표시 중인 파일만)"""
+        for item in self._file_items:
+            if item.get_filepath() == file_path:
+                item.set_meta(meta)
+    
     def _on_file_clicked(self, grid_index: int):
         """파일 클릭 처리 - 선택만"""
         file_idx = self._current_page * self._files_per_page + grid_index
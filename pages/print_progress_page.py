@@ -16,6 +16,8 @@ from components.numeric_keypad import NumericKeypad
 from styles.colors import Colors
 from styles.fonts import Fonts
 from styles.icons import Icons
+from controllers.lift_policy import LiftPolicy
+from controllers.resin_planner import DispensePlan
 
 
 class ProgressInfoRow(QFrame):
@@ -59,13 +61,13 @@ class ProgressInfoRow(QFrame):
 
 
 class CompletedDialog(QDialog):
-    """완료 다이얼로그"""
+    """완료 다이얼로그 (작업 요약이 있으면 메시지 아래에 표시)"""
     
-    def __init__(self, parent=None):
+    def __init__(self, summary: str = "", parent=None):
         super().__init__(parent)
         
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
-        self.setFixedSize(300, 160)
+        self.setFixedSize(300, 190 if summary else 160)
         self.setStyleSheet(f"""
             QDialog {{
                 background-color: {Colors.BG_PRIMARY};
@@ -83,6 +85,13 @@ class CompletedDialog(QDialog):
         lbl_message.setFont(Fonts.h2())
         lbl_message.setAlignment(Qt.AlignCenter)
         lbl_message.setStyleSheet(f"color: {Colors.CYAN}; background: transparent;")
+
+        # 작업 요약
+        lbl_summary = QLabel(summary)
+        lbl_summary.setFont(Fonts.body_small())
+        lbl_summary.setAlignment(Qt.AlignCenter)
+        lbl_summary.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; background: transparent;")
+        lbl_summary.setVisible(bool(summary))
         
         # 확인 버튼
         btn_ok = QPushButton("확인")
@@ -109,6 +118,7 @@ class CompletedDialog(QDialog):
         btn_layout.addStretch()
         
         layout.addWidget(lbl_message)
+        layout.addWidget(lbl_summary)
         layout.addStretch()
         layout.addLayout(btn_layout)
 
@@ -337,6 +347,7 @@ class PrintProgressPage(BasePage):
         self._blade_speed = 1500
         self._led_power = 100
         self._total_estimated_time = 0
+        self._job_summary = {}  # 워커 작업 요약 (빈 레이어 생략 등)
         
         # 경과 시간 타이머
         self._elapsed_timer = QTimer()
@@ -804,7 +815,11 @@ class PrintProgressPage(BasePage):
                                y_pull_distance: float = 0.0,
                                y_pull_delay: float = 2.0,
                                y_return_distance: float = 0.0,
-                               y_return_delay: float = 2.0) -> int:
+                               y_return_delay: float = 2.0,
+                               blade_bidirectional: bool = False,
+                               lift_policy: LiftPolicy = None,
+                               layer_areas=None,
+                               dispense_plan: DispensePlan = None) -> int:
         """총 예상 시간 계산 (실제 프린트 시퀀스 기반)
 
         레이어별 시퀀스:
@@ -812,8 +827,12 @@ class PrintProgressPage(BasePage):
         2. Resin 토출 (Push + Pull + Return) + 대기
         3. X축 평탄화 (2구간: start→boundary@spd1, boundary→end@spd2)
         4. 이미지 투영 → LED ON → 노광 → LED OFF
-        5. Z축 리프트 (+3mm)
-        6. X축 복귀 (end→start @ 3000mm/min)
+        5. Z축 리프트 (리프트 정책, 기본 +3mm @ 300mm/min)
+        6. X축 복귀 (end→start @ 3000mm/min, 양방향 모드는 없음)
+
+        lift_policy가 adaptive이고 layer_areas(형상 인덱스 면적)가 있으면
+        레이어별 리프트를 합산. dispense_plan이 면적 기반이면 Push 이동/대기도
+        레이어별 토출 거리로 합산.
 
         Returns:
             총 예상 시간 (초)
@@ -827,23 +846,30 @@ class PrintProgressPage(BasePage):
         dist2 = max(0, blade_end - blade_boundary)
         x_forward_time = (dist1 / spd1) + (dist2 / spd2)
         # X축 복귀: end→start @ 3000mm/min (50mm/s) 고정
-        x_return_time = (blade_end - blade_start) / 50.0
+        # 양방향 모드는 복귀 대신 역방향 평탄화 (대칭 경계라 정방향과 같은 시간)
+        x_return_time = 0.0 if blade_bidirectional else (blade_end - blade_start) / 50.0
         x_time = x_forward_time + x_return_time
 
-        # Z축 리프트(+3mm) + 드롭(~3mm) @ 300mm/min 고정
-        # 실제 코드: print_worker.py z_position + 3.0, motor_controller z_speed=300
+        # Z축 리프트 + 드롭: 리프트 정책으로 작업 전체 합산 (fixed = +3mm @ 300mm/min)
+        policy = lift_policy or LiftPolicy()
+        z_total_time = policy.job_time(total_layers, layer_areas)
+
+        # 초기 평탄화 리프트는 정책과 무관하게 +3mm @ 300mm/min 고정
         Z_LIFT = 3.0
         Z_SPEED = 300.0 / 60.0  # 5 mm/s
-        z_lift_time = Z_LIFT / Z_SPEED
-        z_drop_time = Z_LIFT / Z_SPEED
-        z_time = z_lift_time + z_drop_time
 
         # 레진 토출 시간 (3단계: Push + Pull + Return)
         resin_time = 0.0
+        resin_push_total = 0.0  # 면적 기반 토출: 작업 전체 Push 이동 + 대기
+        volumetric = dispense_plan is not None and dispense_plan.volumetric
         if y_dispense_distance > 0 and y_dispense_speed > 0:
             y_speed_mm_s = y_dispense_speed / 60.0
-            # Push 이동 시간 + 대기
-            resin_time = (y_dispense_distance / y_speed_mm_s) + y_dispense_delay
+            # Push 이동 시간 + 대기 (면적 기반은 레이어별 거리/거리 비례 대기로 합산)
+            if volumetric:
+                resin_push_total = (dispense_plan.total_distance / y_speed_mm_s
+                                    + dispense_plan.total_delay(y_dispense_distance, y_dispense_delay))
+            else:
+                resin_time = (y_dispense_distance / y_speed_mm_s) + y_dispense_delay
             # Pull delay (pull_distance > 0일 때)
             if y_pull_distance > 0:
                 resin_time += y_pull_delay
@@ -852,12 +878,12 @@ class PrintProgressPage(BasePage):
                 resin_time += y_return_delay
 
         # 바닥 레이어 시간
-        bottom_time_per_layer = resin_time + x_time + bottom_exposure + z_time
+        bottom_time_per_layer = resin_time + x_time + bottom_exposure
         total_bottom_time = bottom_time_per_layer * bottom_layer_count
 
         # 일반 레이어 시간
         normal_layers = max(0, total_layers - bottom_layer_count)
-        normal_time_per_layer = resin_time + x_time + normal_exposure + z_time
+        normal_time_per_layer = resin_time + x_time + normal_exposure
         total_normal_time = normal_time_per_layer * normal_layers
 
         # 첫 레이어 settle time (layer_idx == 0일 때 추가)
@@ -877,7 +903,8 @@ class PrintProgressPage(BasePage):
                 leveling_time += (y_dispense_distance / init_push_speed) + y_dispense_delay
             leveling_time += settle_time
 
-        return int(leveling_time + total_bottom_time + total_normal_time + first_layer_settle)
+        return int(leveling_time + total_bottom_time + total_normal_time + z_total_time
+                   + resin_push_total + first_layer_settle)
 
     # === Public API (Worker에서 호출) ===
     
@@ -903,7 +930,11 @@ class PrintProgressPage(BasePage):
                        y_return_distance: float = 0.0,
                        y_return_delay: float = 2.0,
                        blade_start: float = 0.0,
-                       blade_end: float = 130.0):
+                       blade_end: float = 130.0,
+                       blade_bidirectional: bool = False,
+                       lift_policy: LiftPolicy = None,
+                       layer_areas=None,
+                       dispense_plan: DispensePlan = None):
         """프린트 정보 설정 (시작 시 호출)"""
         self._file_path = file_path
         self._total_layers = total_layers
@@ -912,6 +943,7 @@ class PrintProgressPage(BasePage):
         self._current_layer = 0
         self._elapsed_sec = 0
         self._status = self.STATUS_PRINTING
+        self._job_summary = {}
 
         # UI 업데이트
         filename = os.path.basename(file_path)
@@ -941,6 +973,10 @@ class PrintProgressPage(BasePage):
             y_return_delay=y_return_delay,
             blade_start=blade_start,
             blade_end=blade_end,
+            blade_bidirectional=blade_bidirectional,
+            lift_policy=lift_policy,
+            layer_areas=layer_areas,
+            dispense_plan=dispense_plan,
         )
         self._total_estimated_time = total_estimated_time
 
@@ -953,6 +989,7 @@ class PrintProgressPage(BasePage):
         self._y_priming_position = y_priming_position
         self._y_current_position = y_priming_position
         self._y_dispense_distance = y_dispense_distance
+        self._dispense_plan = dispense_plan if dispense_plan is not None and dispense_plan.volumetric else None
         resin_pct = int(y_priming_position / 125.0 * 100) if y_priming_position > 0 else 0
         self.row_resin_level.set_value(f"{resin_pct} %")
 
@@ -1004,7 +1041,10 @@ class PrintProgressPage(BasePage):
 
         # Resin 잔량 업데이트
         if hasattr(self, '_y_current_position') and hasattr(self, '_y_dispense_distance'):
-            self._y_current_position -= self._y_dispense_distance
+            if getattr(self, '_dispense_plan', None) is not None:
+                self._y_current_position -= self._dispense_plan.distance(current_layer - 1)
+            else:
+                self._y_current_position -= self._y_dispense_distance
             resin_pct = max(0, int(self._y_current_position / 125.0 * 100))
             self.row_resin_level.set_value(f"{resin_pct} %")
 
@@ -1016,6 +1056,18 @@ class PrintProgressPage(BasePage):
             scaled = pixmap.scaled(270, 270, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             self.lbl_layer_image.setPixmap(scaled)
     
+    def set_job_summary(self, summary: dict):
+        """워커 작업 요약 저장 (완료 다이얼로그에 표시)"""
+        self._job_summary = summary or {}
+
+    def _summary_text(self) -> str:
+        """작업 요약 문구 (표시할 내용이 없으면 빈 문자열)"""
+        empty_layers = self._job_summary.get('empty_layers', 0)
+        if empty_layers <= 0:
+            return ""
+        saved = int(self._job_summary.get('time_saved', 0))
+        return f"빈 레이어 {empty_layers}개 · 노광 {self._format_time(saved)} 절약"
+
     def show_completed(self):
         """완료 - 다이얼로그 표시 후 종료 버튼으로 전환"""
         self._status = self.STATUS_COMPLETED
@@ -1026,7 +1078,7 @@ class PrintProgressPage(BasePage):
         self.lbl_percent.setText("100%")
 
         # 완료 다이얼로그 표시
-        dialog = CompletedDialog(self)
+        dialog = CompletedDialog(self._summary_text(), self)
         dialog.exec()
 
         # 종료 버튼 표시
@@ -1058,9 +1110,9 @@ class PrintProgressPage(BasePage):
         # 종료 버튼 표시
         self._show_finish_buttons()
 
-    def show_resin_empty(self):
-        """레진 부족 — 주사기 교체 안내"""
-        self._update_title("레진 부족")
+    def show_resin_empty(self, title: str = "레진 부족"):
+        """레진 부족 (또는 계획 리필) — 주사기 교체 안내"""
+        self._update_title(title)
         self.btn_pause.hide()
         self.btn_stop.show()
         self.btn_refill.show()
@@ -1081,7 +1133,7 @@ class PrintProgressPage(BasePage):
         self.btn_prime_plus.setEnabled(False)
         self.btn_prime_done.show()
         self.btn_prime_done.setEnabled(False)
-        # main.py에서 G28 Y 홈잉 실행
+        # app.py에서 G28 Y 홈잉 실행
         self.refill_started.emit()
 
     def on_refill_homing_done(self):
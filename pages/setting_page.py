@@ -496,10 +496,10 @@ class YAxisPanel(QFrame):
         self._is_priming = True
         self.btn_prime.setEnabled(False)
         self.status_label.setText("Homing resin pump...")
-        self.priming_started.emit()  # main.py에서 G28 Y 실행
+        self.priming_started.emit()  # app.py에서 G28 Y 실행
 
     def on_homing_completed(self):
-        """G28 Y 홈잉 완료 후 호출 (main.py에서 호출)
+        """G28 Y 홈잉 완료 후 호출 (app.py에서 호출)
 
         홈잉 완료 → 주사기 장착 → 양방향 이동 가능"""
         self.status_label.setText("Mount syringe, adjust & test, then OK")
@@ -3,14 +3,28 @@ VERICOM DLP 3D Printer GUI - Utils Package
 유틸리티 모듈
 """
 
+# controllers 패키지를 import하는 모듈(zip_handler, job_spooler, file_catalogue)은
+# 여기서 내보내지 않음 — controllers.print_archive가 utils.frame_utils를 import하므로
+# 순환 import가 생김. 해당 모듈은 utils.zip_handler 등 서브모듈로 직접 import.
 from .usb_monitor import USBMonitor
-from .zip_handler import ZipHandler
+from .media_scanner import MediaScanner, USBDevice, get_media_scanner
 from .time_formatter import TimeFormatter, format_time, format_duration
+from .job_cache import JobCache
+from .thumbnail_cache import ThumbnailCache, get_thumbnail_cache
+from .uniformity_mask import UniformityConfig, UniformityMask, load_uniformity_mask
 
 __all__ = [
     'USBMonitor',
-    'ZipHandler',
+    'MediaScanner',
+    'USBDevice',
+    'get_media_scanner',
     'TimeFormatter',
     'format_time',
-    'format_duration'
+    'format_duration',
+    'JobCache',
+    'ThumbnailCache',
+    'get_thumbnail_cache',
+    'UniformityConfig',
+    'UniformityMask',
+    'load_uniformity_mask'
 ]
@@ -0,0 +1,250 @@
+"""
+VERICOM DLP 3D Printer - File Catalogue
+USB 파일별 작업 정보 카탈로그 (내용 지문 기준)
+
+레이어 수, 예상 시간, 검증 결과, 썸네일을 data/cache/catalogue 에 저장.
+키는 경로가 아닌 내용 지문(크기 + 앞/뒤 64KB SHA-1)이므로
+같은 파일을 다른 USB로 옮기거나 이름을 바꿔도 다시 분석하지 않음.
+(ZIP은 끝부분 중앙 디렉토리에 모든 항목의 CRC가 있어 내용 변경이 지문에 반영됨)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+try:
+    from controllers.gcode_parser import ZipValidationResult
+    from controllers.job_manifest import load_manifest
+    from utils.job_cache import CACHE_DIR, file_key
+    from utils.thumbnail_cache import THUMBNAIL_SIZE
+except ImportError:
+    from ..controllers.gcode_parser import ZipValidationResult
+    from ..controllers.job_manifest import load_manifest
+    from .job_cache import CACHE_DIR, file_key
+    from .thumbnail_cache import THUMBNAIL_SIZE
+
+
+CATALOGUE_DIR = os.path.join(CACHE_DIR, "catalogue")
+
+# 지문 계산에 읽는 앞/뒤 크기
+FINGERPRINT_CHUNK = 64 * 1024
+
+# 최대 항목 수 (오래 사용하지 않은 것부터 삭제)
+MAX_ENTRIES = 500
+
+
+def content_fingerprint(file_path: str) -> Optional[str]:
+    """파일 내용 지문 (크기 + 앞/뒤 64KB SHA-1, 읽기 실패 시 None)"""
+    try:
+        size = os.path.getsize(file_path)
+        digest = hashlib.sha1(str(size).encode('ascii'))
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(FINGERPRINT_CHUNK))
+            if size > FINGERPRINT_CHUNK:
+                f.seek(max(FINGERPRINT_CHUNK, size - FINGERPRINT_CHUNK))
+                digest.update(f.read(FINGERPRINT_CHUNK))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+@dataclass
+class CatalogueEntry:
+    """파일 1개 분석 결과"""
+    fingerprint: str
+    layers: int = 0
+    time: float = 0.0              # 예상 시간 (초)
+    valid: bool = False
+    error_message: str = ""
+    has_thumbnail: bool = False
+
+    def meta(self) -> dict:
+        """파일 목록 표시용 메타데이터"""
+        return {'layers': self.layers, 'time': self.time, 'valid': self.valid}
+
+    def validation(self) -> ZipValidationResult:
+        return ZipValidationResult(self.valid, self.error_message)
+
+
+class FileCatalogue:
+    """
+    파일 카탈로그 (스레드 안전)
+
+    사용 예:
+        catalogue = get_file_catalogue()
+        entry = catalogue.index(path)          # 없으면 분석 후 저장
+        result = catalogue.validate(path)      # 같은 내용이면 재검증 생략
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.path = os.path.join(CATALOGUE_DIR, "catalogue.json")
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, str] = {}  # file_key → 지문 (같은 파일 반복 읽기 방지)
+        self._entries = self._load()
+
+    # ==================== 조회 ====================
+
+    def fingerprint(self, file_path: str) -> Optional[str]:
+        """지문 (경로/크기/수정시각이 같으면 메모리 값 사용)"""
+        key = file_key(file_path)
+        if key is None:
+            return None
+        with self._lock:
+            cached = self._fingerprints.get(key)
+        if cached is not None:
+            return cached
+        fingerprint = content_fingerprint(file_path)
+        if fingerprint is not None:
+            with self._lock:
+                self._fingerprints[key] = fingerprint
+        return fingerprint
+
+    def lookup(self, file_path: str) -> Optional[CatalogueEntry]:
+        """카탈로그 항목 (분석 전이면 None)"""
+        fingerprint = self.fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        with self._lock:
+            data = self._entries.get(fingerprint)
+            if data is None:
+                return None
+            data['used_at'] = time.time()
+            return self._entry_from(fingerprint, data)
+
+    def index(self, file_path: str) -> Optional[CatalogueEntry]:
+        """
+        카탈로그 항목 (없으면 검증 + 파라미터 + 썸네일 분석 후 저장)
+
+        Returns:
+            CatalogueEntry (파일을 읽을 수 없으면 None)
+        """
+        entry = self.lookup(file_path)
+        if entry is not None:
+            return entry
+
+        fingerprint = self.fingerprint(file_path)
+        if fingerprint is None:
+            return None
+
+        # 검증/파라미터/미리보기를 한 번에 (선택 시 같은 JobManifest 재사용)
+        name = os.path.basename(file_path)
+        manifest = load_manifest(file_path)
+        entry = CatalogueEntry(fingerprint, valid=manifest.is_valid,
+                               error_message=manifest.validation.error_message)
+        if manifest.is_valid:
+            entry.layers = manifest.layer_count
+            entry.time = float(manifest.params.estimatedPrintTime)
+
+        entry.has_thumbnail = self._save_thumbnail(fingerprint, manifest.preview)
+        self._store(entry)
+        print(f"[Catalogue] 분석 완료: {name} ({entry.layers} 레이어, "
+              f"{'정상' if entry.valid else '오류'})")
+        return entry
+
+    def validate(self, file_path: str) -> ZipValidationResult:
+        """파일 검증 (같은 내용의 파일을 이미 검증했으면 저장된 결과)"""
+        entry = self.index(file_path)
+        if entry is None:
+            return ZipValidationResult(False, "파일을 읽을 수 없습니다")
+        return entry.validation()
+
+    def load_thumbnail(self, file_path: str) -> Optional[QImage]:
+        """카탈로그 썸네일 (없으면 분석 후 저장, ThumbnailCache 로더로 사용)"""
+        entry = self.index(file_path)
+        if entry is None or not entry.has_thumbnail:
+            return None
+        image = QImage(self._thumbnail_path(entry.fingerprint))
+        return None if image.isNull() else image
+
+    # ==================== 내부 ====================
+
+    @staticmethod
+    def _entry_from(fingerprint: str, data: dict) -> CatalogueEntry:
+        fields = {k: v for k, v in data.items() if k in CatalogueEntry.__dataclass_fields__}
+        fields['fingerprint'] = fingerprint
+        return CatalogueEntry(**fields)
+
+    @staticmethod
+    def _thumbnail_path(fingerprint: str) -> str:
+        return os.path.join(CATALOGUE_DIR, f"{fingerprint[:16]}.png")
+
+    def _save_thumbnail(self, fingerprint: str, image: Optional[QImage]) -> bool:
+        """썸네일 PNG 저장 (THUMBNAIL_SIZE로 축소)"""
+        if image is None or image.isNull():
+            return False
+        if image.width() > THUMBNAIL_SIZE or image.height() > THUMBNAIL_SIZE:
+            image = image.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+                                 Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        path = self._thumbnail_path(fingerprint)
+        try:
+            os.makedirs(CATALOGUE_DIR, exist_ok=True)
+            if not image.save(path + ".tmp.png", "PNG"):
+                return False
+            os.replace(path + ".tmp.png", path)
+        except OSError as e:
+            print(f"[Catalogue] 썸네일 저장 실패: {e}")
+            return False
+        return True
+
+    def _load(self) -> dict:
+        """카탈로그 파일 로드 (없거나 손상되면 빈 카탈로그)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            print(f"[Catalogue] 카탈로그 로드 실패: {e}")
+            return {}
+
+    def _store(self, entry: CatalogueEntry):
+        """항목 저장 + 오래된 항목 정리 + 파일 기록 (임시 파일 → rename)"""
+        data = asdict(entry)
+        del data['fingerprint']
+        data['used_at'] = time.time()
+
+        with self._lock:
+            self._entries[entry.fingerprint] = data
+            removed = []
+            if len(self._entries) > self.max_entries:
+                by_age = sorted(self._entries, key=lambda k: self._entries[k].get('used_at', 0))
+                for old in by_age[:len(self._entries) - self.max_entries]:
+                    del self._entries[old]
+                    removed.append(old)
+
+            try:
+                os.makedirs(CATALOGUE_DIR, exist_ok=True)
+                temp_path = self.path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                print(f"[Catalogue] 카탈로그 저장 실패: {e}")
+
+        for old in removed:
+            try:
+                os.remove(self._thumbnail_path(old))
+            except OSError:
+                pass
+
+
+_instance: Optional[FileCatalogue] = None
+_instance_lock = threading.Lock()
+
+
+def get_file_catalogue() -> FileCatalogue:
+    """FileCatalogue 싱글톤 인스턴스 반환 (워커 스레드에서도 호출)"""
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = FileCatalogue()
+        return _instance
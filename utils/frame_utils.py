@@ -0,0 +1,178 @@
+"""
+VERICOM DLP 3D Printer - Frame Utils
+레이어 프레임을 프로젝터 네이티브 해상도로 정규화 (워커 스레드용)
+
+프레임은 Grayscale8(8bit) 또는 Mono(1bit) 형식으로 유지하고,
+디스플레이 형식(32bit)으로의 변환은 화면 출력 시점에만 수행
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QImage
+
+
+# PNG 시그니처 (IHDR에서 크기만 빠르게 읽기용)
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 컴팩트 프레임 형식 (이미 이 형식이면 변환 없음)
+COMPACT_FORMATS = (QImage.Format_Mono, QImage.Format_Grayscale8)
+
+
+@dataclass(frozen=True)
+class FramePlan:
+    """
+    프레임 스케일/종횡비 결정 (작업당 1회 계산)
+
+    source 크기를 target 안에 종횡비 유지로 맞추고, 남는 영역은 검은색 여백
+    """
+    source_width: int
+    source_height: int
+    target_width: int
+    target_height: int
+    scaled_width: int
+    scaled_height: int
+    offset_x: int
+    offset_y: int
+
+    @property
+    def passthrough(self) -> bool:
+        """원본과 타겟 해상도가 같으면 리샘플링 불필요"""
+        return (self.source_width == self.target_width and
+                self.source_height == self.target_height)
+
+    def matches(self, width: int, height: int) -> bool:
+        """이 계획이 주어진 원본 크기용인지 확인"""
+        return self.source_width == width and self.source_height == height
+
+
+def plan_frame(source_size: Tuple[int, int], target_size: Tuple[int, int]) -> FramePlan:
+    """
+    프레임 정규화 계획 계산 (Qt.KeepAspectRatio와 동일한 규칙)
+
+    Args:
+        source_size: 원본 (width, height)
+        target_size: 프로젝터 (width, height)
+
+    Returns:
+        FramePlan
+    """
+    src_w, src_h = source_size
+    dst_w, dst_h = target_size
+
+    if src_w <= 0 or src_h <= 0:
+        return FramePlan(src_w, src_h, dst_w, dst_h, dst_w, dst_h, 0, 0)
+
+    # 종횡비 유지: 더 작은 배율 선택
+    if src_w * dst_h <= src_h * dst_w:
+        scaled_h = dst_h
+        scaled_w = max(1, round(src_w * dst_h / src_h))
+    else:
+        scaled_w = dst_w
+        scaled_h = max(1, round(src_h * dst_w / src_w))
+
+    return FramePlan(
+        source_width=src_w,
+        source_height=src_h,
+        target_width=dst_w,
+        target_height=dst_h,
+        scaled_width=scaled_w,
+        scaled_height=scaled_h,
+        offset_x=(dst_w - scaled_w) // 2,
+        offset_y=(dst_h - scaled_h) // 2,
+    )
+
+
+def compact_frame(image: QImage) -> QImage:
+    """
+    디코딩된 프레임을 컴팩트 형식으로 변환
+
+    - 1bit 이미지 (흑백 슬라이서) → Format_Mono (픽셀당 1bit)
+    - 그 외 → Format_Grayscale8 (픽셀당 8bit)
+
+    1920x1080 기준 ARGB32 8.3MB → Grayscale8 2.1MB / Mono 260KB
+
+    Args:
+        image: QImage.fromData() 결과
+
+    Returns:
+        컴팩트 형식 QImage
+    """
+    fmt = image.format()
+    if fmt in COMPACT_FORMATS:
+        return image
+
+    if image.depth() == 1 or _is_binary_palette(image):
+        # 디더링 없이 임계값 변환 (레이어 경계 보존)
+        return image.convertToFormat(QImage.Format_Mono, Qt.ThresholdDither)
+
+    return image.convertToFormat(QImage.Format_Grayscale8)
+
+
+def _is_binary_palette(image: QImage) -> bool:
+    """팔레트가 검은색/흰색 2색 이하인 인덱스 이미지인지 확인"""
+    if image.format() != QImage.Format_Indexed8 or image.colorCount() > 2:
+        return False
+    return all(color & 0xFFFFFF in (0x000000, 0xFFFFFF) for color in image.colorTable())
+
+
+def frame_nbytes(image: QImage) -> int:
+    """프레임 메모리 크기 (바이트)"""
+    return image.sizeInBytes()
+
+
+def normalize_frame(image: QImage, plan: FramePlan) -> QImage:
+    """
+    프레임을 프로젝터 해상도로 정규화
+
+    해상도가 같으면 원본 그대로 반환 (리샘플링 없음, 형식 유지).
+    다르면 Grayscale8로 스무스 스케일 후 중앙 정렬, 여백은 0(검은색)으로 채움.
+
+    Args:
+        image: 디코딩된 레이어 프레임 (compact_frame() 결과)
+        plan: plan_frame() 결과
+
+    Returns:
+        타겟 해상도의 QImage
+    """
+    if plan.passthrough:
+        return image
+
+    # Mono 색상표는 0번이 흰색일 수 있으므로 여백 채우기 전에 Grayscale8로 통일
+    if image.format() != QImage.Format_Grayscale8:
+        image = image.convertToFormat(QImage.Format_Grayscale8)
+
+    scaled = image
+    if image.width() != plan.scaled_width or image.height() != plan.scaled_height:
+        scaled = image.scaled(
+            plan.scaled_width, plan.scaled_height,
+            Qt.IgnoreAspectRatio,
+            Qt.SmoothTransformation
+        )
+        if scaled.format() != QImage.Format_Grayscale8:
+            scaled = scaled.convertToFormat(QImage.Format_Grayscale8)
+
+    if plan.offset_x == 0 and plan.offset_y == 0:
+        return scaled
+
+    # 이미지 밖 영역은 0으로 채워짐 → 검은색 레터박스
+    return scaled.copy(QRect(
+        -plan.offset_x, -plan.offset_y,
+        plan.target_width, plan.target_height
+    ))
+
+
+def png_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    PNG 헤더(IHDR)에서 크기만 읽기 (디코딩 없음)
+
+    Returns:
+        (width, height) 또는 None (PNG가 아닌 경우)
+    """
+    if len(data) < 24 or not data.startswith(PNG_SIGNATURE) or data[12:16] != b'IHDR':
+        return None
+
+    width, height = struct.unpack('>II', data[16:24])
+    return width, height
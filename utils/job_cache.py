@@ -0,0 +1,105 @@
+"""
+VERICOM DLP 3D Printer - Job Cache
+프린트 파일별 분석 결과 캐시 (경로, 크기, 수정시각 기준)
+
+같은 파일을 다시 선택하면 검증/분석을 반복하지 않도록
+결과를 data/cache/<이름>.json 에 저장
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+
+# 캐시 디렉토리 (설정 파일과 같은 data 디렉토리)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache")
+
+
+def file_key(file_path: str) -> Optional[str]:
+    """(절대 경로, 크기, 수정시각) 캐시 키 (파일이 없으면 None)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+class JobCache:
+    """
+    파일 단위 결과 캐시 (JSON)
+
+    항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제.
+
+    사용 예:
+        cache = JobCache("validation")
+        result = cache.get(path)
+        if result is None:
+            cache.put(path, {"ok": True})
+    """
+
+    def __init__(self, name: str, max_entries: int = 200):
+        """
+        Args:
+            name: 캐시 이름 (파일명)
+            max_entries: 최대 항목 수
+        """
+        self.path = os.path.join(CACHE_DIR, f"{name}.json")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> dict:
+        """캐시 파일 로드 (없거나 손상되면 빈 캐시)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            print(f"[JobCache] 캐시 로드 실패 ({self.path}): {e}")
+            return {}
+
+    def _save(self):
+        """캐시 파일 저장 (임시 파일 → rename)"""
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"[JobCache] 캐시 저장 실패 ({self.path}): {e}")
+
+    def get(self, file_path: str) -> Optional[Any]:
+        """캐시된 결과 (없거나 파일이 바뀌었으면 None)"""
+        key = file_key(file_path)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry['used_at'] = time.time()
+            return entry.get('value')
+
+    def put(self, file_path: str, value: Any):
+        """결과 저장"""
+        key = file_key(file_path)
+        if key is None:
+            return
+
+        with self._lock:
+            now = time.time()
+            self._entries[key] = {'value': value, 'used_at': now}
+
+            # 오래 사용하지 않은 항목 정리
+            if len(self._entries) > self.max_entries:
+                by_age = sorted(self._entries, key=lambda k: self._entries[k].get('used_at', 0))
+                for old_key in by_age[:len(self._entries) - self.max_entries]:
+                    del self._entries[old_key]
+
+            self._save()
@@ -0,0 +1,383 @@
+"""
+VERICOM DLP 3D Printer - Job Spooler
+선택한 프린트 파일을 USB에서 내부 저장소로 복사 (체크섬 검증 + LRU 캐시)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QThread, Signal
+
+try:
+    from controllers.layer_store import convert_to_layer_store, estimate_store_size, open_layer_store
+    from compute.layer_transform import LayerTransform
+except ImportError:
+    from ..controllers.layer_store import convert_to_layer_store, estimate_store_size, open_layer_store
+    from ..compute.layer_transform import LayerTransform
+
+
+# 스풀 캐시 경로 (설정 파일과 같은 data 디렉토리)
+SPOOL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "spool")
+
+# 캐시 크기 제한 (CM4 eMMC 보호)
+SPOOL_MAX_BYTES = 4 * 1024 * 1024 * 1024    # 캐시 전체 최대 4GB
+SPOOL_MIN_FREE_BYTES = 512 * 1024 * 1024    # 복사 후에도 남겨둘 여유 공간
+
+# 스풀 메타 파일명
+SPOOL_META_NAME = "spool.json"
+
+# 복사 단위
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def spool_key(source_path: str) -> str:
+    """원본 파일의 (경로, 크기, 수정시각) 기반 캐시 키"""
+    stat = os.stat(source_path)
+    raw = f"{os.path.abspath(source_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def spool_entry_dir(key: str) -> str:
+    """캐시 키의 엔트리 디렉토리"""
+    return os.path.join(SPOOL_DIR, key)
+
+
+def cached_spool_path(source_path: str) -> Optional[str]:
+    """
+    이미 스풀된 로컬 복사본 경로 (없으면 None)
+
+    사용 시 엔트리 수정시각을 갱신하여 LRU 순서 유지
+    """
+    try:
+        key = spool_key(source_path)
+    except OSError:
+        return None
+
+    entry_dir = spool_entry_dir(key)
+    meta = _read_meta(entry_dir)
+    if not meta:
+        return None
+
+    local_path = os.path.join(entry_dir, os.path.basename(source_path))
+    try:
+        if os.path.getsize(local_path) != meta.get('size'):
+            return None
+        os.utime(entry_dir, None)
+    except OSError:
+        return None
+
+    return local_path
+
+
+def spool_cache_size() -> int:
+    """캐시 전체 크기 (바이트)"""
+    total = 0
+    if not os.path.isdir(SPOOL_DIR):
+        return 0
+    for entry in os.listdir(SPOOL_DIR):
+        total += _dir_size(os.path.join(SPOOL_DIR, entry))
+    return total
+
+
+def evict_spool_cache(required_bytes: int, keep: Iterable[str] = ()) -> bool:
+    """
+    LRU 순서(엔트리 수정시각)로 오래된 스풀을 삭제하여 공간 확보
+
+    Args:
+        required_bytes: 새로 필요한 공간 (바이트)
+        keep: 삭제하면 안 되는 캐시 키 (사용 중인 작업)
+
+    Returns:
+        공간 확보 성공 여부
+    """
+    if required_bytes > SPOOL_MAX_BYTES:
+        return False
+
+    os.makedirs(SPOOL_DIR, exist_ok=True)
+    keep = set(keep)
+
+    entries = []
+    for key in os.listdir(SPOOL_DIR):
+        path = spool_entry_dir(key)
+        if os.path.isdir(path):
+            entries.append((os.path.getmtime(path), key, _dir_size(path)))
+    entries.sort()  # 오래된 순
+
+    used = sum(size for _, _, size in entries)
+    free = shutil.disk_usage(SPOOL_DIR).free
+
+    for _, key, size in entries:
+        if used + required_bytes <= SPOOL_MAX_BYTES and free - required_bytes >= SPOOL_MIN_FREE_BYTES:
+            break
+        if key in keep:
+            continue
+        shutil.rmtree(spool_entry_dir(key), ignore_errors=True)
+        used -= size
+        free += size
+        print(f"[Spool] 캐시 삭제 (LRU): {key} ({size / 1024 / 1024:.1f}MB)")
+
+    return used + required_bytes <= SPOOL_MAX_BYTES and free - required_bytes >= SPOOL_MIN_FREE_BYTES
+
+
+def _read_meta(entry_dir: str) -> Optional[dict]:
+    """스풀 메타 읽기 (완료된 엔트리에만 존재)"""
+    meta_path = os.path.join(entry_dir, SPOOL_META_NAME)
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _dir_size(path: str) -> int:
+    """디렉토리 내 파일 크기 합계"""
+    total = 0
+    try:
+        for name in os.listdir(path):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path):
+                total += os.path.getsize(file_path)
+    except OSError:
+        pass
+    return total
+
+
+def _file_sha256(path: str, cancelled=None) -> Optional[str]:
+    """파일 SHA-256 (취소 시 None)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            if cancelled and cancelled():
+                return None
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JobSpooler(QThread):
+    """
+    프린트 파일 스풀링 스레드
+
+    USB 파일을 data/spool/<key>/ 로 스트림 복사하면서 SHA-256 계산,
+    복사 후 로컬 파일을 다시 읽어 체크섬 검증. 프린트는 로컬 복사본에서 실행.
+    복사 완료 후 같은 스레드에서 .vlayers 레이어 스토어로 1회 변환.
+    레이어 보정이 설정되어 있으면 이어서 보정 스토어도 변환 (재출력 시 재사용).
+
+    시그널:
+        progress: 복사 진행률 (0~100)
+        spool_finished: 복사 완료 (원본 경로, 로컬 경로)
+        spool_failed: 복사 실패 (원본 경로, 메시지)
+        convert_progress: 레이어 스토어 변환 진행률 (0~100)
+        store_ready: 변환 완료 (원본 경로, 스토어 경로 — 보정이 있으면 보정 스토어)
+    """
+
+    progress = Signal(int)
+    spool_finished = Signal(str, str)
+    spool_failed = Signal(str, str)
+    convert_progress = Signal(int)
+    store_ready = Signal(str, str)
+
+    def __init__(self, source_path: str, transform: Optional[LayerTransform] = None, parent=None):
+        super().__init__(parent)
+        self.source_path = source_path
+        self.local_path = ""
+        self._cancelled = False
+        self._transform = transform
+        self._transform_lock = threading.Lock()
+        self._transform_closed = False
+
+    def cancel(self):
+        """복사 취소 (부분 파일은 삭제됨)"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def set_transform(self, transform: Optional[LayerTransform]) -> bool:
+        """
+        레이어 보정 설정 (스풀 중 소재 선택 시, GUI 스레드에서 호출)
+
+        Returns:
+            반영되면 True, 이미 변환을 마쳐 반영할 수 없으면 False
+        """
+        with self._transform_lock:
+            if self._transform_closed:
+                return False
+            self._transform = transform
+            return True
+
+    def run(self):
+        try:
+            self._run()
+        finally:
+            # 이후 set_transform()은 False → 호출 측에서 새 스풀러로 다시 변환
+            with self._transform_lock:
+                self._transform_closed = True
+
+    def _run(self):
+        try:
+            local_path = self._spool()
+        except Exception as e:
+            print(f"[Spool] 오류: {e}")
+            self.spool_failed.emit(self.source_path, str(e))
+            return
+
+        if local_path is None:
+            if not self._cancelled:
+                self.spool_failed.emit(self.source_path, "스풀 실패")
+            return
+
+        self.local_path = local_path
+        self.progress.emit(100)
+        self.spool_finished.emit(self.source_path, local_path)
+
+        if self._cancelled:
+            return
+        store_path = self._build_layer_store(local_path)
+        if not store_path:
+            return
+
+        # 보정 스토어 (변환 중 소재가 바뀌면 새 설정으로 한 번 더)
+        built = ""
+        while not self._cancelled:
+            with self._transform_lock:
+                transform = self._transform
+                if transform is None or transform.is_identity or transform.key() == built:
+                    self._transform_closed = True
+                    break
+            transform_path = self._build_layer_store(local_path, transform)
+            if not transform_path:
+                return
+            built = transform.key()
+            store_path = transform_path
+
+        if not self._cancelled:
+            self.store_ready.emit(self.source_path, store_path)
+
+    def _build_layer_store(self, local_path: str,
+                           transform: Optional[LayerTransform] = None) -> Optional[str]:
+        """
+        로컬 복사본을 .vlayers로 변환 (이미 최신이면 생략)
+
+        Returns:
+            스토어 경로 (실패/취소 시 None → ZIP 또는 선읽기 보정으로 출력)
+        """
+        key = transform.key() if transform else ""
+        store = open_layer_store(local_path, key)
+        if store:
+            store.close()
+            return store.path
+
+        # 스토어는 스풀 엔트리에 기록되므로 변환 전에 최대 크기만큼 공간 확보 (4GB 상한/여유 공간 유지)
+        entry_key = os.path.basename(os.path.dirname(local_path))
+        try:
+            estimate = estimate_store_size(local_path, transform)
+        except Exception as e:
+            print(f"[Spool] 레이어 스토어 크기 확인 실패 (변환 생략): {e}")
+            return None
+        if not evict_spool_cache(estimate, keep=[entry_key]):
+            print(f"[Spool] 저장 공간 부족 (최대 {estimate / 1024 / 1024:.0f}MB), 레이어 스토어 변환 생략")
+            return None
+
+        try:
+            store_path = convert_to_layer_store(
+                local_path,
+                progress=self.convert_progress.emit,
+                cancelled=self.is_cancelled,
+                transform=transform,
+            )
+        except Exception as e:
+            if transform:
+                print(f"[Spool] 보정 스토어 변환 실패 (선읽기 중 보정): {e}")
+            else:
+                print(f"[Spool] 레이어 스토어 변환 실패 (ZIP으로 출력): {e}")
+            return None
+
+        if store_path:
+            evict_spool_cache(0, keep=[entry_key])
+        return store_path
+
+    def _spool(self) -> Optional[str]:
+        """복사 + 검증, 성공 시 로컬 경로 반환"""
+        source = self.source_path
+
+        # 캐시 적중 (같은 경로/크기/수정시각)
+        cached = cached_spool_path(source)
+        if cached:
+            print(f"[Spool] 캐시 사용: {cached}")
+            return cached
+
+        key = spool_key(source)
+        size = os.path.getsize(source)
+        if not evict_spool_cache(size, keep=[key]):
+            raise OSError("내부 저장소 공간이 부족합니다")
+
+        entry_dir = spool_entry_dir(key)
+        os.makedirs(entry_dir, exist_ok=True)
+        local_path = os.path.join(entry_dir, os.path.basename(source))
+        temp_path = local_path + ".part"
+
+        print(f"[Spool] 복사 시작: {source} → {local_path} ({size / 1024 / 1024:.1f}MB)")
+        start = time.monotonic()
+
+        try:
+            # 1. 스트림 복사 + 원본 체크섬
+            digest = hashlib.sha256()
+            copied = 0
+            last_percent = -1
+            with open(source, 'rb') as src, open(temp_path, 'wb') as dst:
+                while True:
+                    if self._cancelled:
+                        raise InterruptedError()
+                    chunk = src.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    digest.update(chunk)
+                    copied += len(chunk)
+
+                    # 복사 95%, 검증 5%
+                    percent = int(copied * 95 / size) if size else 95
+                    if percent != last_percent:
+                        last_percent = percent
+                        self.progress.emit(percent)
+                dst.flush()
+                os.fsync(dst.fileno())
+
+            source_sha = digest.hexdigest()
+
+            # 2. 로컬 복사본 재읽기 검증
+            local_sha = _file_sha256(temp_path, self.is_cancelled)
+            if local_sha is None:
+                raise InterruptedError()
+            if local_sha != source_sha or copied != size:
+                raise IOError("체크섬 불일치 (복사 손상)")
+
+            os.replace(temp_path, local_path)
+            with open(os.path.join(entry_dir, SPOOL_META_NAME), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source': os.path.abspath(source),
+                    'size': size,
+                    'sha256': source_sha,
+                    'spooled_at': time.time(),
+                }, f, indent=2, ensure_ascii=False)
+
+        except InterruptedError:
+            print(f"[Spool] 취소됨: {source}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+        except Exception:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            raise
+
+        print(f"[Spool] 완료: {local_path} ({time.monotonic() - start:.1f}s, sha256 {source_sha[:12]})")
+        return local_path
@@ -0,0 +1,326 @@
+"""
+VERICOM DLP 3D Printer - Media Scanner
+USB 장치/파일 목록 공유 스캐너 (이벤트 기반)
+
+/media 트리는 inotify(QFileSystemWatcher), 마운트 변경은 /proc/self/mountinfo
+(poll 예외 이벤트)로 감지하고, 디렉토리 탐색은 스레드 풀에서 실행.
+PrintPage, USBMonitor 등은 폴링하지 않고 시그널을 구독.
+/proc이 없는 환경(Windows 개발)에서만 타이머 폴링으로 대체.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from PySide6.QtCore import (
+    QFileSystemWatcher, QObject, QRunnable, QSocketNotifier, QThreadPool, QTimer, Signal
+)
+
+
+# 지원 파일 확장자
+SUPPORTED_EXTENSIONS = ('.zip', '.dlp', '.photon', '.ctb')
+
+# Linux USB 마운트 경로 (/media/{user}/{device}/)
+MEDIA_PATH = "/media"
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# 이벤트 묶음 처리 대기 (마운트 직후 이벤트가 연달아 발생)
+DEBOUNCE_MS = 300
+
+# /proc 없는 환경의 폴링 간격
+FALLBACK_POLL_MS = 2000
+
+
+@dataclass
+class USBDevice:
+    """USB 장치 정보"""
+    path: str
+    name: str
+    files: List[str]
+
+
+def scan_files(directory: str) -> List[str]:
+    """
+    디렉토리 내 지원 파일 스캔
+
+    Returns:
+        파일 경로 리스트 (이름순)
+    """
+    files = []
+    try:
+        for entry in os.listdir(directory):
+            entry_path = os.path.join(directory, entry)
+            if entry.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(entry_path):
+                files.append(entry_path)
+    except PermissionError:
+        pass
+    except OSError as e:
+        print(f"[USB] 파일 스캔 오류: {e}")
+
+    files.sort()
+    return files
+
+
+def scan_media(media_path: str = MEDIA_PATH,
+               extra_paths: Sequence[str] = ()) -> Dict[str, USBDevice]:
+    """
+    USB 장치 스캔 (워커 스레드에서 호출)
+
+    Args:
+        media_path: 마운트 루트 (/media/{user}/{device}/)
+        extra_paths: 추가 장치 경로 (Windows 테스트용)
+
+    Returns:
+        장치 경로 → USBDevice (파일이 없는 장치 포함)
+    """
+    devices = {}
+
+    if os.path.isdir(media_path):
+        try:
+            for user in sorted(os.listdir(media_path)):
+                user_path = os.path.join(media_path, user)
+                if not os.path.isdir(user_path):
+                    continue
+                try:
+                    for device in sorted(os.listdir(user_path)):
+                        device_path = os.path.join(user_path, device)
+                        if os.path.isdir(device_path):
+                            devices[device_path] = USBDevice(
+                                path=device_path, name=device, files=scan_files(device_path)
+                            )
+                except PermissionError:
+                    continue
+        except PermissionError:
+            print(f"[USB] {media_path} 접근 권한 없음")
+        except OSError as e:
+            print(f"[USB] 스캔 오류: {e}")
+
+    for path in extra_paths:
+        if os.path.isdir(path):
+            devices[path] = USBDevice(path=path, name=os.path.basename(path),
+                                      files=scan_files(path))
+
+    return devices
+
+
+class _ScanSignals(QObject):
+    """스캔 작업 → 스캐너 결과 전달"""
+    finished = Signal(dict)
+
+
+class _ScanTask(QRunnable):
+    """스레드 풀 디렉토리 스캔 작업"""
+
+    def __init__(self, media_path: str, extra_paths: List[str], signals: _ScanSignals):
+        super().__init__()
+        self.media_path = media_path
+        self.extra_paths = extra_paths
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(scan_media(self.media_path, self.extra_paths))
+
+
+class MediaScanner(QObject):
+    """
+    공유 USB 스캐너
+
+    사용 예:
+        scanner = get_media_scanner()
+        scanner.files_changed.connect(on_files)
+        scanner.start()   # 구독 시작 (구독자 수만큼 stop 호출 시 중지)
+    """
+
+    devices_changed = Signal(list)  # List[USBDevice]
+    files_changed = Signal(list)    # 전체 파일 경로 (장치 순서, 파일 이름순)
+
+    def __init__(self, media_path: str = MEDIA_PATH, parent=None):
+        super().__init__(parent)
+        self._media_path = media_path
+        self._extra_paths: List[str] = []
+        self._devices: Dict[str, USBDevice] = {}
+        self._users = 0
+        self._scanning = False
+        self._rescan = False
+
+        self._signals = _ScanSignals(self)
+        self._signals.finished.connect(self._on_scan_finished)
+
+        # 이벤트 묶음 → 스캔 1회
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._start_scan)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule_scan)
+
+        self._mountinfo = None
+        self._mount_notifier: Optional[QSocketNotifier] = None
+        self._fallback_timer: Optional[QTimer] = None
+
+    # ==================== 구독 ====================
+
+    def start(self):
+        """구독 시작 (첫 구독자일 때 감시 시작, 항상 즉시 한 번 스캔)"""
+        self._users += 1
+        if self._users == 1:
+            self._start_watching()
+            print("[USB] 미디어 감시 시작")
+        self._schedule_scan(immediate=True)
+
+    def stop(self):
+        """구독 해제 (마지막 구독자일 때 감시 중지)"""
+        if self._users == 0:
+            return
+        self._users -= 1
+        if self._users == 0:
+            self._stop_watching()
+            print("[USB] 미디어 감시 중지")
+
+    def is_active(self) -> bool:
+        return self._users > 0
+
+    def add_path(self, path: str):
+        """추가 장치 경로 (Windows 테스트용)"""
+        if os.path.isdir(path) and path not in self._extra_paths:
+            self._extra_paths.append(path)
+            if self.is_active():
+                self._watcher.addPath(path)
+                self._schedule_scan()
+
+    def rescan(self):
+        """즉시 다시 스캔"""
+        self._schedule_scan(immediate=True)
+
+    def devices(self) -> List[USBDevice]:
+        """마지막 스캔의 장치 목록"""
+        return list(self._devices.values())
+
+    def files(self) -> List[str]:
+        """마지막 스캔의 전체 파일 목록"""
+        return [f for device in self._devices.values() for f in device.files]
+
+    # ==================== 감시 ====================
+
+    def _start_watching(self):
+        """inotify + mountinfo 감시 등록"""
+        try:
+            # mountinfo는 마운트 테이블이 바뀌면 poll 예외(POLLPRI) 이벤트 발생
+            self._mountinfo = open(MOUNTINFO_PATH, 'rb')
+            self._mountinfo.read()
+            self._mount_notifier = QSocketNotifier(
+                self._mountinfo.fileno(), QSocketNotifier.Exception, self
+            )
+            self._mount_notifier.activated.connect(self._on_mount_changed)
+        except OSError:
+            self._mountinfo = None
+            self._fallback_timer = QTimer(self)
+            self._fallback_timer.timeout.connect(self._schedule_scan)
+            self._fallback_timer.start(FALLBACK_POLL_MS)
+            print(f"[USB] {MOUNTINFO_PATH} 없음, {FALLBACK_POLL_MS}ms 폴링 사용")
+
+        self._update_watch_paths()
+
+    def _stop_watching(self):
+        self._debounce.stop()
+        paths = self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        if self._mount_notifier is not None:
+            self._mount_notifier.setEnabled(False)
+            self._mount_notifier.deleteLater()
+            self._mount_notifier = None
+        if self._mountinfo is not None:
+            self._mountinfo.close()
+            self._mountinfo = None
+        if self._fallback_timer is not None:
+            self._fallback_timer.stop()
+            self._fallback_timer.deleteLater()
+            self._fallback_timer = None
+
+    def _update_watch_paths(self):
+        """감시 대상: 마운트 루트, 사용자 폴더, 장치 폴더 (파일 복사/삭제 감지)"""
+        wanted = set(self._extra_paths) | set(self._devices)
+        if os.path.isdir(self._media_path):
+            wanted.add(self._media_path)
+            wanted.update(os.path.dirname(path) for path in self._devices
+                          if path.startswith(self._media_path))
+        wanted = {path for path in wanted if os.path.isdir(path)}
+
+        current = set(self._watcher.directories())
+        if current - wanted:
+            self._watcher.removePaths(list(current - wanted))
+        if wanted - current:
+            self._watcher.addPaths(list(wanted - current))
+
+    def _on_mount_changed(self):
+        """마운트 테이블 변경 (다음 이벤트를 받으려면 다시 읽어야 함)"""
+        try:
+            self._mountinfo.seek(0)
+            self._mountinfo.read()
+        except (OSError, AttributeError):
+            pass
+        self._schedule_scan()
+
+    # ==================== 스캔 ====================
+
+    def _schedule_scan(self, *args, immediate: bool = False):
+        if not self.is_active():
+            return
+        if immediate:
+            self._debounce.stop()
+            self._start_scan()
+        else:
+            self._debounce.start()
+
+    def _start_scan(self):
+        """워커 스레드에서 스캔 (진행 중이면 끝난 뒤 한 번 더)"""
+        if self._scanning:
+            self._rescan = True
+            return
+        self._scanning = True
+        self._rescan = False
+        QThreadPool.globalInstance().start(
+            _ScanTask(self._media_path, list(self._extra_paths), self._signals)
+        )
+
+    def _on_scan_finished(self, devices: dict):
+        """스캔 결과 (GUI 스레드)"""
+        self._scanning = False
+        if not self.is_active():
+            return
+
+        if devices != self._devices:
+            old_files = self.files()
+            old_paths = set(self._devices)
+            self._devices = devices
+            for path in set(devices) - old_paths:
+                print(f"[USB] 장치 연결됨: {path}")
+            for path in old_paths - set(devices):
+                print(f"[USB] 장치 해제됨: {path}")
+            self.devices_changed.emit(self.devices())
+            if self.files() != old_files:
+                self.files_changed.emit(self.files())
+
+        self._update_watch_paths()
+        if self._rescan:
+            self._start_scan()
+
+
+_instance: Optional[MediaScanner] = None
+
+
+def get_media_scanner() -> MediaScanner:
+    """MediaScanner 싱글톤 인스턴스 반환 (GUI 스레드에서 생성)"""
+    global _instance
+    if _instance is None:
+        _instance = MediaScanner()
+    return _instance
+
+
+# 테스트용
+if __name__ == "__main__":
+    for device in scan_media().values():
+        print(f"{device.name}: {len(device.files)}개 파일 ({device.path})")
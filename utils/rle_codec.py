@@ -0,0 +1,224 @@
+"""
+VERICOM DLP 3D Printer - RLE Codec
+레이어 슬라이스용 런렝스 인코딩 (NumPy 벡터화 디코더)
+
+레진 슬라이스는 대부분 검은 배경 + 몇 개의 단색 영역이므로
+프레임 전체를 하나의 픽셀 스트림으로 보고 (값, 길이) 런으로 저장.
+디코딩은 np.repeat 한 번으로 Grayscale8 버퍼를 채움 (PNG inflate + 필터 복원 없음).
+
+데이터 구조 (리틀 엔디안):
+    [헤더 12B] width, height, run_count
+    [값]      uint8 x run_count
+    [패딩]    2바이트 정렬
+    [길이]    uint16 x run_count (65535 초과 런은 분할)
+"""
+
+import struct
+from typing import Union
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+
+# 헤더: width, height, run_count
+_HEADER = struct.Struct('<III')
+
+# 런 길이 최대값 (uint16)
+MAX_RUN = 0xFFFF
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def encode_rle(pixels: np.ndarray) -> bytes:
+    """
+    Grayscale8 픽셀 배열을 RLE로 인코딩
+
+    Args:
+        pixels: (height, width) uint8 배열
+
+    Returns:
+        RLE 데이터
+    """
+    height, width = pixels.shape
+    flat = np.ascontiguousarray(pixels, dtype=np.uint8).ravel()
+
+    if flat.size == 0:
+        return _HEADER.pack(width, height, 0)
+
+    # 값이 바뀌는 위치 = 런 시작
+    starts = np.concatenate(([0], np.flatnonzero(flat[1:] != flat[:-1]) + 1))
+    lengths = np.diff(np.append(starts, flat.size))
+    values = flat[starts]
+
+    # uint16 범위를 넘는 런은 MAX_RUN 단위로 분할
+    if lengths.max() > MAX_RUN:
+        pieces = (lengths + MAX_RUN - 1) // MAX_RUN
+        values = np.repeat(values, pieces)
+        split = np.full(int(pieces.sum()), MAX_RUN, dtype=np.int64)
+        split[np.cumsum(pieces) - 1] = lengths - (pieces - 1) * MAX_RUN
+        lengths = split
+
+    run_count = values.size
+    pad = b'\x00' * ((_HEADER.size + run_count) % 2)
+
+    return b''.join((
+        _HEADER.pack(width, height, run_count),
+        values.astype(np.uint8).tobytes(),
+        pad,
+        lengths.astype('<u2').tobytes(),
+    ))
+
+
+def decode_rle(data: Buffer, out: np.ndarray = None) -> np.ndarray:
+    """
+    RLE 데이터를 Grayscale8 픽셀 배열로 디코딩
+
+    Args:
+        data: encode_rle() 결과 (memoryview 가능, 복사 없이 읽음)
+        out: 결과를 기록할 (height, width) uint8 배열 (None이면 새로 할당)
+
+    Returns:
+        (height, width) uint8 배열
+
+    Raises:
+        ValueError: 데이터가 잘렸거나 픽셀 수가 맞지 않는 경우
+    """
+    width, height, run_count = _HEADER.unpack_from(data, 0)
+
+    values_offset = _HEADER.size
+    lengths_offset = values_offset + run_count + (values_offset + run_count) % 2
+    if len(data) < lengths_offset + run_count * 2:
+        raise ValueError("RLE 데이터가 잘렸습니다")
+
+    values = np.frombuffer(data, dtype=np.uint8, count=run_count, offset=values_offset)
+    lengths = np.frombuffer(data, dtype='<u2', count=run_count, offset=lengths_offset)
+
+    pixels = np.repeat(values, lengths)
+    if pixels.size != width * height:
+        raise ValueError(f"RLE 픽셀 수 불일치: {pixels.size} (기대 {width * height})")
+
+    pixels = pixels.reshape(height, width)
+    if out is None:
+        return pixels
+
+    out[:, :] = pixels
+    return out
+
+
+def rle_size(data: Buffer) -> tuple:
+    """RLE 데이터의 (width, height)"""
+    width, height, _ = _HEADER.unpack_from(data, 0)
+    return width, height
+
+
+def image_pixels(image: QImage) -> np.ndarray:
+    """
+    Grayscale8 QImage의 픽셀 배열 뷰 (스캔라인 패딩 제외, 복사 없음)
+
+    Args:
+        image: Format_Grayscale8 QImage
+    """
+    bytes_per_line = image.bytesPerLine()
+    buffer = np.frombuffer(image.constBits(), dtype=np.uint8,
+                           count=bytes_per_line * image.height())
+    return buffer.reshape(image.height(), bytes_per_line)[:, :image.width()]
+
+
+def pixels_image(pixels: np.ndarray) -> QImage:
+    """
+    (height, width) uint8 배열 → Grayscale8 QImage (QImage 소유 버퍼로 복사)
+    """
+    height, width = pixels.shape
+    image = QImage(width, height, QImage.Format_Grayscale8)
+    target = np.frombuffer(image.bits(), dtype=np.uint8, count=image.bytesPerLine() * height)
+    target.reshape(height, image.bytesPerLine())[:, :width] = pixels
+    return image
+
+
+def encode_image(image: QImage) -> bytes:
+    """Grayscale8 QImage → RLE (다른 형식은 Grayscale8로 변환 후 인코딩)"""
+    if image.format() != QImage.Format_Grayscale8:
+        image = image.convertToFormat(QImage.Format_Grayscale8)
+    return encode_rle(image_pixels(image))
+
+
+def decode_image(data: Buffer) -> QImage:
+    """
+    RLE → Grayscale8 QImage
+
+    QImage가 소유한 버퍼에 직접 디코딩 (중간 버퍼 → QImage 복사 없음)
+    """
+    width, height = rle_size(data)
+    image = QImage(width, height, QImage.Format_Grayscale8)
+
+    bytes_per_line = image.bytesPerLine()
+    target = np.frombuffer(image.bits(), dtype=np.uint8, count=bytes_per_line * height)
+    target = target.reshape(height, bytes_per_line)
+    decode_rle(data, out=target[:, :width])
+    return image
+
+
+# 테스트용 (벤치마크: PNG 경로 vs RLE)
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+    import zlib
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from controllers.print_archive import PrintArchive
+    from utils.frame_utils import compact_frame
+
+    if len(sys.argv) < 2:
+        print("사용법: python rle_codec.py <print.zip> [최대 레이어 수]")
+        sys.exit(1)
+
+    zip_path = sys.argv[1]
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    png_bytes = rle_bytes = zlib_bytes = raw_bytes = 0
+    png_time = rle_time = zlib_time = 0.0
+
+    with PrintArchive(zip_path) as archive:
+        count = archive.layer_count if limit is None else min(limit, archive.layer_count)
+        for idx in range(count):
+            png = archive.layer_bytes(idx)
+
+            # 현재 경로: PNG 디코딩 + Grayscale8 변환
+            start = time.perf_counter()
+            image = compact_frame(QImage.fromData(png))
+            png_time += time.perf_counter() - start
+            if image.format() != QImage.Format_Grayscale8:
+                image = image.convertToFormat(QImage.Format_Grayscale8)
+
+            raw = image_pixels(image)
+            encoded = encode_rle(raw)
+            packed = zlib.compress(raw.tobytes(), 1)
+
+            start = time.perf_counter()
+            decoded = decode_image(encoded)
+            rle_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            zlib.decompress(packed)
+            zlib_time += time.perf_counter() - start
+
+            if not np.array_equal(image_pixels(decoded), raw):
+                print(f"레이어 {idx}: RLE 왕복 불일치!")
+                sys.exit(1)
+
+            png_bytes += len(png)
+            rle_bytes += len(encoded)
+            zlib_bytes += len(packed)
+            raw_bytes += raw.size
+
+    print(f"레이어 {count}개 ({os.path.basename(zip_path)})")
+    print(f"{'형식':<8}{'크기(MB)':>12}{'비율':>10}{'디코딩(ms/레이어)':>22}")
+    for name, size, elapsed in (
+        ("RAW", raw_bytes, 0.0),
+        ("PNG", png_bytes, png_time),
+        ("ZLIB-1", zlib_bytes, zlib_time),
+        ("RLE", rle_bytes, rle_time),
+    ):
+        print(f"{name:<8}{size / 1024 / 1024:>12.2f}{size / raw_bytes:>10.3f}"
+              f"{elapsed * 1000 / count:>22.2f}")
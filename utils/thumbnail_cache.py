@@ -0,0 +1,210 @@
+"""
+VERICOM DLP 3D Printer - Thumbnail Cache
+파일 목록 썸네일 캐시 (메모리 LRU + 디스크 PNG)
+
+키는 (경로, 크기, 수정시각)이므로 파일이 바뀌면 자동으로 새로 생성.
+그리드 갱신/페이지 이동 시 ZIP/ChiTu 파일을 다시 열지 않음.
+미리보기가 없는 파일도 기록하여 반복 탐색하지 않음.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+try:
+    from utils.job_cache import CACHE_DIR, file_key
+except ImportError:
+    from .job_cache import CACHE_DIR, file_key
+
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+
+# 썸네일 최대 크기 (px, 종횡비 유지)
+THUMBNAIL_SIZE = 96
+
+# 메모리 캐시 항목 수 (목록 여러 페이지 분량)
+MEMORY_ENTRIES = 128
+
+# 디스크 캐시 최대 용량 (오래 사용하지 않은 것부터 삭제)
+DISK_MAX_BYTES = 16 * 1024 * 1024
+
+# 미리보기 없음 표시 파일 확장자
+_NONE_SUFFIX = ".none"
+
+
+class ThumbnailCache:
+    """
+    썸네일 캐시
+
+    사용 예:
+        cache = get_thumbnail_cache()
+        image = cache.get_or_load(path, load_preview_image)   # QImage 또는 None
+    """
+
+    def __init__(self, memory_entries: int = MEMORY_ENTRIES, disk_max_bytes: int = DISK_MAX_BYTES):
+        self.memory_entries = memory_entries
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, Optional[QImage]]" = OrderedDict()
+        self._keys: Dict[str, str] = {}  # 절대 경로 → 현재 키 (파일 변경 시 이전 항목 제거)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _disk_path(key: str) -> str:
+        return os.path.join(THUMBNAIL_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest()[:16])
+
+    def get(self, file_path: str) -> Optional[QImage]:
+        """캐시된 썸네일 (없거나 미리보기 없는 파일이면 None)"""
+        found, image = self.lookup(file_path)
+        return image if found else None
+
+    def lookup(self, file_path: str):
+        """
+        캐시 조회
+
+        Returns:
+            (캐시 여부, QImage 또는 None) — 미리보기 없는 파일은 (True, None)
+        """
+        key = file_key(file_path)
+        if key is None:
+            return False, None
+
+        with self._lock:
+            self._forget_stale(file_path, key)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return True, self._memory[key]
+
+        # 디스크 조회 (메모리에 없을 때만)
+        base = self._disk_path(key)
+        image = None
+        if os.path.exists(base + _NONE_SUFFIX):
+            found = True
+            os.utime(base + _NONE_SUFFIX)
+        elif os.path.exists(base + ".png"):
+            image = QImage(base + ".png")
+            found = not image.isNull()
+            if found:
+                os.utime(base + ".png")  # LRU 갱신
+            else:
+                image = None
+        else:
+            found = False
+
+        if found:
+            self._remember(file_path, key, image)
+        return found, image
+
+    def put(self, file_path: str, image: Optional[QImage]):
+        """
+        썸네일 저장 (THUMBNAIL_SIZE로 축소, None이면 미리보기 없음으로 기록)
+        """
+        key = file_key(file_path)
+        if key is None:
+            return
+
+        if image is not None and not image.isNull():
+            if image.width() > THUMBNAIL_SIZE or image.height() > THUMBNAIL_SIZE:
+                image = image.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+                                     Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            image = None
+
+        self._remember(file_path, key, image)
+        self._write_disk(key, image)
+
+    def get_or_load(self, file_path: str,
+                    loader: Callable[[str], Optional[QImage]]) -> Optional[QImage]:
+        """
+        캐시된 썸네일, 없으면 loader로 미리보기를 읽어 저장
+
+        Args:
+            file_path: 프린트 파일 경로
+            loader: 원본 미리보기 로더 (예: load_preview_image)
+        """
+        found, image = self.lookup(file_path)
+        if found:
+            return image
+        self.put(file_path, loader(file_path))
+        return self.get(file_path)
+
+    def invalidate(self, file_path: str):
+        """파일 항목 제거 (삭제된 파일 등)"""
+        with self._lock:
+            key = self._keys.pop(os.path.abspath(file_path), None)
+            if key is not None:
+                self._memory.pop(key, None)
+
+    # ==================== 내부 ====================
+
+    def _forget_stale(self, file_path: str, key: str):
+        """같은 경로의 이전 버전 메모리 항목 제거 (lock 보유 상태에서 호출)"""
+        old_key = self._keys.get(os.path.abspath(file_path))
+        if old_key is not None and old_key != key:
+            self._memory.pop(old_key, None)
+            del self._keys[os.path.abspath(file_path)]
+
+    def _remember(self, file_path: str, key: str, image: Optional[QImage]):
+        """메모리 캐시 등록 (LRU)"""
+        with self._lock:
+            self._forget_stale(file_path, key)
+            self._keys[os.path.abspath(file_path)] = key
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                old_key, _ = self._memory.popitem(last=False)
+                for path in [p for p, k in self._keys.items() if k == old_key]:
+                    del self._keys[path]
+
+    def _write_disk(self, key: str, image: Optional[QImage]):
+        """디스크 캐시 저장 후 용량 초과분 정리"""
+        base = self._disk_path(key)
+        try:
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            if image is None:
+                open(base + _NONE_SUFFIX, 'wb').close()
+            else:
+                temp_path = base + ".tmp.png"
+                if not image.save(temp_path, "PNG"):
+                    return
+                os.replace(temp_path, base + ".png")
+        except OSError as e:
+            print(f"[Thumbnail] 캐시 저장 실패: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """디스크 캐시 용량 제한 (오래 사용하지 않은 것부터 삭제)"""
+        try:
+            entries = [os.path.join(THUMBNAIL_DIR, name) for name in os.listdir(THUMBNAIL_DIR)]
+            stats = [(path, os.stat(path)) for path in entries if os.path.isfile(path)]
+        except OSError:
+            return
+
+        total = sum(stat.st_size for _, stat in stats)
+        if total <= self.disk_max_bytes:
+            return
+        stats.sort(key=lambda item: item[1].st_mtime)
+        for path, stat in stats:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= stat.st_size
+            except OSError:
+                pass
+
+
+_instance: Optional[ThumbnailCache] = None
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """ThumbnailCache 싱글톤 인스턴스 반환"""
+    global _instance
+    if _instance is None:
+        _instance = ThumbnailCache()
+    return _instance
@@ -0,0 +1,313 @@
+"""
+VERICOM DLP 3D Printer - Uniformity Mask
+프로젝터 조도 균일화 마스크 (픽셀별 게인, 모든 레이어 프레임에 곱함)
+
+NVR2+ 광원은 124.8 x 70.2mm 노광 영역 전체에서 밝기가 균일하지 않음.
+DLPController.set_brightness는 전체 밝기만 바꾸므로, 가장 어두운 지점에 맞춰
+밝은 영역을 픽셀 단위로 낮추는 게인 맵을 레이어마다 곱함.
+
+게인 맵 출처:
+- 측정 격자: 흰 화면을 투사하고 격자 지점의 조도(mW/cm²)를 측정하여 입력
+  (calibration_pattern()으로 측정 위치 표시 프레임 생성)
+- 파일: 그레이스케일 이미지(8/16bit, 흰색=게인 1.0) 또는 .npy 실수 배열
+
+게인은 프로젝터 네이티브 해상도(1920x1080)의 uint16 고정소수점(256=1.0)으로
+한 번 계산하여 data/cache/uniformity/<키>.npy 에 저장.
+적용은 uint8 x uint16 곱 + 시프트 (오버플로 없음), 선읽기 스레드에서 실행.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPen
+
+try:
+    from utils.job_cache import CACHE_DIR
+    from utils.rle_codec import image_pixels
+except ImportError:
+    from .job_cache import CACHE_DIR
+    from .rle_codec import image_pixels
+
+
+MASK_DIR = os.path.join(CACHE_DIR, "uniformity")
+
+# 프로젝터 네이티브 해상도
+NATIVE_SIZE = (1920, 1080)
+
+# 고정소수점 게인 (256 = 1.0, 255 x 256 + 반올림이 uint16 범위 안)
+GAIN_SHIFT = 8
+GAIN_ONE = 1 << GAIN_SHIFT
+
+# 최소 게인 (측정 오류로 프레임이 과하게 어두워지는 것 방지)
+DEFAULT_MIN_GAIN = 0.7
+
+
+@dataclass(frozen=True)
+class UniformityConfig:
+    """
+    균일화 마스크 설정 (설정 파일 값, 작업 시작 시 워커로 전달)
+
+    grid: 측정 조도 (행=위→아래, 열=왼쪽→오른쪽, 각 셀 중심에서 측정)
+    file: 게인 이미지/.npy 경로 (있으면 grid보다 우선)
+    """
+    enabled: bool = False
+    grid: Tuple[Tuple[float, ...], ...] = ()
+    file: str = ""
+    min_gain: float = DEFAULT_MIN_GAIN
+
+    @property
+    def has_source(self) -> bool:
+        return bool(self.file) or (len(self.grid) > 0 and len(self.grid[0]) > 0)
+
+    def cache_key(self, size: Tuple[int, int]) -> Optional[str]:
+        """캐시 키 (설정/원본 파일/해상도 기준, 파일을 읽을 수 없으면 None)"""
+        source = {'grid': self.grid, 'min_gain': self.min_gain, 'size': list(size)}
+        if self.file:
+            try:
+                stat = os.stat(self.file)
+            except OSError:
+                return None
+            source['file'] = [os.path.abspath(self.file), stat.st_size, stat.st_mtime_ns]
+        raw = json.dumps(source, sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _resize_linear(values: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    격자 값을 (height, width)로 쌍선형 보간 (값은 각 셀 중심, 바깥은 가장자리 값 유지)
+    """
+    rows, cols = values.shape
+
+    def axis(count: int, size: int):
+        # 출력 픽셀 중심이 격자의 어느 두 셀 사이에 있는지
+        position = (np.arange(size, dtype=np.float32) + 0.5) * count / size - 0.5
+        position = np.clip(position, 0, count - 1)
+        low = np.floor(position).astype(np.intp)
+        high = np.minimum(low + 1, count - 1)
+        return low, high, (position - low).astype(np.float32)
+
+    y0, y1, fy = axis(rows, height)
+    x0, x1, fx = axis(cols, width)
+
+    horizontal = values[:, x0] * (1 - fx) + values[:, x1] * fx          # (rows, width)
+    return horizontal[y0] * (1 - fy)[:, None] + horizontal[y1] * fy[:, None]
+
+
+def gain_from_grid(grid: Sequence[Sequence[float]], size: Tuple[int, int] = NATIVE_SIZE) -> np.ndarray:
+    """
+    측정 조도 격자 → 게인 맵 (가장 어두운 지점 = 1.0)
+
+    Returns:
+        (height, width) float32 배열
+    """
+    irradiance = np.asarray(grid, dtype=np.float32)
+    if irradiance.ndim != 2 or irradiance.size == 0 or irradiance.min() <= 0:
+        raise ValueError("조도 격자는 양수 값의 2차원 배열이어야 합니다")
+    width, height = size
+    return _resize_linear(irradiance.min() / irradiance, width, height)
+
+
+def gain_from_file(path: str, size: Tuple[int, int] = NATIVE_SIZE) -> np.ndarray:
+    """
+    게인 파일 → 게인 맵 (해상도가 다르면 쌍선형 보간)
+
+    .npy: 실수 게인 배열 (1.0 = 원래 밝기)
+    이미지: 그레이스케일 (8bit 255 / 16bit 65535 = 1.0)
+
+    Returns:
+        (height, width) float32 배열
+
+    Raises:
+        ValueError: 파일을 읽을 수 없는 경우
+    """
+    if path.lower().endswith('.npy'):
+        gain = np.load(path).astype(np.float32)
+    else:
+        image = QImage(path)
+        if image.isNull():
+            raise ValueError(f"게인 이미지를 읽을 수 없습니다: {path}")
+        if image.depth() > 8:
+            image = image.convertToFormat(QImage.Format_Grayscale16)
+            buffer = np.frombuffer(image.constBits(), dtype=np.uint16,
+                                   count=image.bytesPerLine() // 2 * image.height())
+            pixels = buffer.reshape(image.height(), -1)[:, :image.width()]
+            gain = pixels.astype(np.float32) / 65535.0
+        else:
+            image = image.convertToFormat(QImage.Format_Grayscale8)
+            gain = image_pixels(image).astype(np.float32) / 255.0
+
+    if gain.ndim != 2:
+        raise ValueError(f"게인 맵은 2차원이어야 합니다: {gain.shape}")
+    width, height = size
+    if gain.shape != (height, width):
+        gain = _resize_linear(gain, width, height)
+    return gain
+
+
+class UniformityMask:
+    """
+    고정소수점 게인 맵 (워커 스레드에서 프레임에 적용)
+
+    사용 예:
+        mask = load_uniformity_mask(config)
+        frame = mask.apply(frame)   # Grayscale8/Mono, 마스크와 같은 크기
+    """
+
+    def __init__(self, gain: np.ndarray):
+        """
+        Args:
+            gain: (height, width) uint16 고정소수점 게인 (GAIN_ONE = 1.0)
+        """
+        self.gain = np.ascontiguousarray(gain, dtype=np.uint16)
+        self.height, self.width = self.gain.shape
+
+    @classmethod
+    def from_gain(cls, gain: np.ndarray, min_gain: float = DEFAULT_MIN_GAIN) -> 'UniformityMask':
+        """실수 게인 맵 → 고정소수점 (min_gain~1.0으로 제한)"""
+        gain = np.clip(gain, max(0.0, min(1.0, min_gain)), 1.0)
+        return cls(np.rint(gain * GAIN_ONE).astype(np.uint16))
+
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def min_gain(self) -> float:
+        return float(self.gain.min()) / GAIN_ONE
+
+    def apply(self, image: QImage) -> QImage:
+        """
+        프레임에 게인 적용 (새 Grayscale8 QImage, 입력은 변경하지 않음)
+
+        Raises:
+            ValueError: 프레임 크기가 마스크와 다른 경우
+        """
+        if (image.width(), image.height()) != (self.width, self.height):
+            raise ValueError(f"마스크 크기 불일치: {image.width()}x{image.height()} "
+                             f"(마스크 {self.width}x{self.height})")
+        if image.format() != QImage.Format_Grayscale8:
+            image = image.convertToFormat(QImage.Format_Grayscale8)
+
+        # (p * g + 0.5) >> 8, 최대 255 * 256 + 128 < 65536
+        product = np.multiply(image_pixels(image), self.gain, dtype=np.uint16)
+        product += GAIN_ONE // 2
+        np.right_shift(product, GAIN_SHIFT, out=product)
+
+        result = QImage(self.width, self.height, QImage.Format_Grayscale8)
+        target = np.frombuffer(result.bits(), dtype=np.uint8,
+                               count=result.bytesPerLine() * self.height)
+        target.reshape(self.height, result.bytesPerLine())[:, :self.width] = product
+        return result
+
+    def benchmark(self, iterations: int = 20) -> float:
+        """적용 시간 측정 (ms/프레임, 전체 흰색 프레임)"""
+        frame = QImage(self.width, self.height, QImage.Format_Grayscale8)
+        frame.fill(255)
+        self.apply(frame)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.apply(frame)
+        return (time.perf_counter() - start) * 1000 / iterations
+
+
+_cache: dict = {}
+_cache_lock = threading.Lock()
+
+
+def load_uniformity_mask(config: UniformityConfig,
+                         size: Tuple[int, int] = NATIVE_SIZE) -> Optional[UniformityMask]:
+    """
+    설정의 균일화 마스크 (메모리 → .npy 캐시 → 계산 순, 워커 스레드에서 호출)
+
+    Returns:
+        UniformityMask (비활성/출처 없음/읽기 실패 시 None)
+    """
+    if not config.enabled or not config.has_source:
+        return None
+    key = config.cache_key(size)
+    if key is None:
+        print(f"[Uniformity] 게인 파일 없음: {config.file}")
+        return None
+
+    with _cache_lock:
+        mask = _cache.get(key)
+    if mask is not None:
+        return mask
+
+    path = os.path.join(MASK_DIR, f"{key}.npy")
+    mask = None
+    if os.path.exists(path):
+        try:
+            mask = UniformityMask(np.load(path))
+            if mask.size() != tuple(size):
+                mask = None
+        except Exception as e:
+            print(f"[Uniformity] 캐시 로드 실패: {e}")
+            mask = None
+
+    if mask is None:
+        try:
+            if config.file:
+                gain = gain_from_file(config.file, size)
+            else:
+                gain = gain_from_grid(config.grid, size)
+        except Exception as e:
+            print(f"[Uniformity] 게인 맵 생성 실패: {e}")
+            return None
+        mask = UniformityMask.from_gain(gain, config.min_gain)
+        try:
+            os.makedirs(MASK_DIR, exist_ok=True)
+            temp_path = path + ".tmp.npy"
+            np.save(temp_path, mask.gain)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"[Uniformity] 캐시 저장 실패: {e}")
+
+    print(f"[Uniformity] 마스크 준비: {mask.width}x{mask.height}, "
+          f"최소 게인 {mask.min_gain():.2f}, 적용 {mask.benchmark():.1f}ms/프레임")
+    with _cache_lock:
+        _cache[key] = mask
+    return mask
+
+
+def calibration_pattern(cols: int, rows: int, size: Tuple[int, int] = NATIVE_SIZE) -> QImage:
+    """
+    측정용 프레임 (전체 흰색 + 각 셀 중심의 측정 위치 십자 표시)
+
+    Args:
+        cols, rows: 측정 격자 크기 (UniformityConfig.grid와 같은 배치)
+    """
+    width, height = size
+    image = QImage(width, height, QImage.Format_Grayscale8)
+    image.fill(255)
+
+    painter = QPainter(image)
+    painter.setPen(QPen(QColor(0, 0, 0), 3, Qt.SolidLine))
+    arm = 20
+    for row in range(rows):
+        for col in range(cols):
+            x = int((col + 0.5) * width / cols)
+            y = int((row + 0.5) * height / rows)
+            painter.drawLine(x - arm, y, x - arm // 2, y)
+            painter.drawLine(x + arm // 2, y, x + arm, y)
+            painter.drawLine(x, y - arm, x, y - arm // 2)
+            painter.drawLine(x, y + arm // 2, x, y + arm)
+    painter.end()
+    return image
+
+
+# 테스트용 (벤치마크)
+if __name__ == "__main__":
+    grid = ((4.6, 4.9, 5.0, 4.8, 4.5),
+            (4.8, 5.2, 5.4, 5.1, 4.7),
+            (4.5, 4.8, 4.9, 4.7, 4.4))
+    start = time.perf_counter()
+    mask = UniformityMask.from_gain(gain_from_grid(grid))
+    print(f"게인 맵 계산: {(time.perf_counter() - start) * 1000:.1f}ms, "
+          f"게인 {mask.min_gain():.3f}~{float(mask.gain.max()) / GAIN_ONE:.3f}")
+    print(f"적용: {mask.benchmark(50):.2f}ms/프레임 ({mask.width}x{mask.height})")
@@ -10,6 +10,11 @@ from dataclasses import dataclass
 
 from PySide6.QtGui import QPixmap, QImage
 
+try:
+    from controllers.print_archive import PrintArchive
+except ImportError:
+    from ..controllers.print_archive import PrintArchive
+
 
 @dataclass
 class ZipFileInfo:
@@ -53,27 +58,16 @@ class ZipHandler:
             if not os.path.exists(zip_path):
                 return None
 
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                namelist = z.namelist()
-
+            with PrintArchive(zip_path) as archive:
                 # 미리보기 확인
-                has_preview = any(
-                    name in namelist
-                    for name in ZipHandler.PREVIEW_NAMES
-                )
-
-                # 레이어 이미지 개수
-                layer_count = sum(
-                    1 for name in namelist
-                    if name.endswith('.png') and name[:-4].isdigit()
-                )
+                has_preview = archive.find_entry(ZipHandler.PREVIEW_NAMES) is not None
 
                 return ZipFileInfo(
                     path=zip_path,
                     name=os.path.basename(zip_path),
                     size=os.path.getsize(zip_path),
                     has_preview=has_preview,
-                    layer_count=layer_count
+                    layer_count=archive.layer_count
                 )
 
         except Exception as e:
@@ -150,68 +144,49 @@ class ZipHandler:
         return None
 
     @staticmethod
-    def get_layer_image(zip_path: str, layer_index: int) -> Optional[QPixmap]:
+    def get_layer_image(zip_path: str, layer_index: int,
+                        archive: Optional[PrintArchive] = None) -> Optional[QPixmap]:
         """
         특정 레이어 이미지 추출
 
         Args:
             zip_path: ZIP 파일 경로
             layer_index: 레이어 인덱스 (0부터 시작)
+            archive: 열린 PrintArchive (None이면 한 번 열어서 조회)
 
         Returns:
             QPixmap 또는 None
         """
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                namelist = z.namelist()
-
-                # 다양한 파일명 형식 시도
-                patterns = [
-                    f"{layer_index:04d}.png",   # 0001.png
-                    f"{layer_index:05d}.png",   # 00001.png
-                    f"{layer_index + 1:04d}.png",  # 1-based
-                    f"{layer_index}.png",        # 0.png
-                ]
-
-                for pattern in patterns:
-                    if pattern in namelist:
-                        data = z.read(pattern)
-                        qimage = QImage.fromData(data)
-
-                        if not qimage.isNull():
-                            return QPixmap.fromImage(qimage)
-
-        except Exception as e:
-            print(f"[ZipHandler] 레이어 이미지 추출 오류: {e}")
+        data = ZipHandler.get_layer_image_bytes(zip_path, layer_index, archive)
+        if data:
+            qimage = QImage.fromData(data)
+            if not qimage.isNull():
+                return QPixmap.fromImage(qimage)
 
         return None
 
     @staticmethod
-    def get_layer_image_bytes(zip_path: str, layer_index: int) -> Optional[bytes]:
+    def get_layer_image_bytes(zip_path: str, layer_index: int,
+                              archive: Optional[PrintArchive] = None) -> Optional[bytes]:
         """
         특정 레이어 이미지 바이트 데이터 추출
 
+        레이어 인덱스는 PrintArchive의 정렬된 레이어 테이블 기준
+
         Args:
             zip_path: ZIP 파일 경로
             layer_index: 레이어 인덱스
+            archive: 열린 PrintArchive (None이면 한 번 열어서 조회)
 
         Returns:
             이미지 바이트 데이터 또는 None
         """
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                namelist = z.namelist()
-
-                patterns = [
-                    f"{layer_index:04d}.png",
-                    f"{layer_index:05d}.png",
-                    f"{layer_index + 1:04d}.png",
-                    f"{layer_index}.png",
-                ]
+            if archive is not None:
+                return archive.layer_bytes(layer_index)
 
-                for pattern in patterns:
-                    if pattern in namelist:
-                        return z.read(pattern)
+            with PrintArchive(zip_path) as temp_archive:
+                return temp_archive.layer_bytes(layer_index)
 
         except Exception as e:
             print(f"[ZipHandler] 레이어 이미지 추출 오류: {e}")
@@ -229,22 +204,14 @@ class ZipHandler:
         Returns:
             레이어 파일명 리스트 (정렬됨)
         """
-        layers = []
-
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                for name in z.namelist():
-                    # 숫자.png 패턴 확인
-                    base = name.replace('.png', '').replace('.PNG', '')
-                    if name.lower().endswith('.png') and base.isdigit():
-                        layers.append(name)
+            with PrintArchive(zip_path) as archive:
+                return archive.layer_names()
 
         except Exception as e:
             print(f"[ZipHandler] 레이어 목록 추출 오류: {e}")
 
-        # 숫자순 정렬
-        layers.sort(key=lambda x: int(x.replace('.png', '').replace('.PNG', '')))
-        return layers
+        return []
 
     @staticmethod
     def extract_gcode(zip_path: str) -> Optional[str]:
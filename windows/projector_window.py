@@ -1,11 +1,14 @@
 """
 VERICOM DLP 3D Printer - Projector Window
 두 번째 모니터(프로젝터)에 이미지를 표시하는 전체화면 윈도우
+
+프린트 레이어는 실제로 그려진 뒤 frame_presented 시그널로 알려서
+PrintWorker가 이전 프레임/빈 화면 위에서 LED를 켜지 않도록 함.
 """
 
 import os
 from PySide6.QtWidgets import QMainWindow, QLabel, QApplication
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QPixmap, QImage, QPainter, QColor
 
 # 로고 이미지 경로
@@ -14,13 +17,28 @@ LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "
 TEST_IMAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "1.png")
 
 
+class _FrameLabel(QLabel):
+    """그리기 완료를 알리는 이미지 라벨"""
+
+    painted = Signal()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        self.painted.emit()
+
+
 class ProjectorWindow(QMainWindow):
     """
     프로젝터 출력용 전체화면 윈도우
 
     두 번째 모니터에 레이어 이미지를 투영
+
+    시그널:
+        frame_presented: show_image()로 받은 프레임이 화면에 그려짐 (QPixmap.cacheKey)
     """
 
+    frame_presented = Signal(int)
+
     # 프로젝터 해상도
     PROJECTOR_WIDTH = 1920
     PROJECTOR_HEIGHT = 1080
@@ -35,6 +53,7 @@ class ProjectorWindow(QMainWindow):
 
         self.screen_index = screen_index
         self._current_pixmap: QPixmap = None
+        self._pending_key = 0  # 그려지기를 기다리는 프레임 (QPixmap.cacheKey, 0=없음)
 
         self._setup_ui()
         self._setup_window()
@@ -42,9 +61,10 @@ class ProjectorWindow(QMainWindow):
     def _setup_ui(self):
         """UI 설정"""
         # 이미지 표시용 라벨
-        self.image_label = QLabel()
+        self.image_label = _FrameLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setStyleSheet("background-color: black;")
+        self.image_label.painted.connect(self._on_label_painted)
 
         self.setCentralWidget(self.image_label)
 
@@ -90,10 +110,26 @@ class ProjectorWindow(QMainWindow):
             print(f"[Projector] 스크린 {self.screen_index} 없음, 기본 스크린 사용")
             self.showFullScreen()
 
+    def target_size(self) -> tuple:
+        """
+        프로젝터 출력 해상도 (프린트 워커가 레이어를 미리 맞출 크기)
+
+        Returns:
+            (width, height) - 스크린이 없으면 기본 프로젝터 해상도
+        """
+        screens = QApplication.screens()
+        if self.screen_index < len(screens):
+            geometry = screens[self.screen_index].geometry()
+            return geometry.width(), geometry.height()
+        return self.PROJECTOR_WIDTH, self.PROJECTOR_HEIGHT
+
     def show_image(self, pixmap: QPixmap):
         """
         이미지 표시
 
+        프린트 레이어는 워커에서 이미 프로젝터 해상도로 맞춰져 오므로
+        크기가 같으면 스케일 없이 바로 표시
+
         Args:
             pixmap: 표시할 QPixmap
         """
@@ -103,7 +139,18 @@ class ProjectorWindow(QMainWindow):
 
         self._current_pixmap = pixmap
 
-        # 윈도우 크기에 맞게 스케일링
+        # 화면에 없으면 그려지지 않으므로 바로 알림 (기다려도 표시되지 않음)
+        if self.isVisible():
+            self._pending_key = pixmap.cacheKey()
+        else:
+            self._pending_key = 0
+            self.frame_presented.emit(pixmap.cacheKey())
+
+        if pixmap.size() == self.image_label.size():
+            self.image_label.setPixmap(pixmap)
+            return
+
+        # 크기가 다른 경우만 (테스트 패턴, 커스텀 이미지 등) 윈도우 크기에 맞게 스케일링
         scaled_pixmap = pixmap.scaled(
             self.image_label.size(),
             Qt.KeepAspectRatio,
@@ -124,9 +171,22 @@ class ProjectorWindow(QMainWindow):
             pixmap = QPixmap.fromImage(qimage)
             self.show_image(pixmap)
 
+    def _on_label_painted(self):
+        """
+        라벨 그리기 완료 → 대기 중인 프레임 표시 알림
+
+        paintEvent 직후에는 아직 백킹 스토어가 화면으로 flush되지 않았으므로
+        이벤트 루프 한 바퀴 뒤(같은 repaint 처리가 끝난 다음)에 알림.
+        """
+        if self._pending_key:
+            key = self._pending_key
+            self._pending_key = 0
+            QTimer.singleShot(0, lambda: self.frame_presented.emit(key))
+
     def clear_screen(self):
         """화면 클리어 (검은색)"""
         self._current_pixmap = None
+        self._pending_key = 0
         self.image_label.clear()
         self.image_label.setStyleSheet("background-color: black;")
 
@@ -227,11 +287,13 @@ class ProjectorWindow(QMainWindow):
         return pixmap
 
     def resizeEvent(self, event):
-        """리사이즈 시 이미지 재스케일링"""
+        """리사이즈 시 이미지 재스케일링 (표시 중인 크기가 라벨과 다를 때만)"""
         super().resizeEvent(event)
 
         if self._current_pixmap and not self._current_pixmap.isNull():
-            self.show_image(self._current_pixmap)
+            shown = self.image_label.pixmap()
+            if shown is None or shown.isNull() or shown.size() != self.image_label.size():
+                self.show_image(self._current_pixmap)
 
     def keyPressEvent(self, event):
         """ESC 키로 닫기"""
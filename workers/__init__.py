@@ -4,8 +4,16 @@ VERICOM DLP 3D Printer GUI - Workers Package
 """
 
 from .print_worker import PrintWorker, PrintStatus
+from .job_validator import JobValidator
+from .geometry_indexer import GeometryIndexer
+from .thumbnail_loader import ThumbnailLoader
+from .file_indexer import FileIndexer
 
 __all__ = [
     'PrintWorker',
-    'PrintStatus'
+    'PrintStatus',
+    'JobValidator',
+    'GeometryIndexer',
+    'ThumbnailLoader',
+    'FileIndexer'
 ]
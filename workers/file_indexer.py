@@ -0,0 +1,50 @@
+"""
+VERICOM DLP 3D Printer - File Indexer
+USB 삽입 시 모든 프린트 파일을 백그라운드에서 카탈로그에 등록
+(검증 + 파라미터 + 썸네일, 이미 등록된 내용이면 지문 확인만)
+"""
+
+import os
+from typing import List
+
+from PySide6.QtCore import QThread, Signal
+
+try:
+    from utils.file_catalogue import get_file_catalogue
+except ImportError:
+    from ..utils.file_catalogue import get_file_catalogue
+
+
+class FileIndexer(QThread):
+    """
+    파일 카탈로그 등록 스레드
+
+    사용 예:
+        indexer = FileIndexer(files)
+        indexer.file_indexed.connect(on_indexed)   # (경로, {'layers', 'time', 'valid'})
+        indexer.start(QThread.LowPriority)
+    """
+
+    file_indexed = Signal(str, dict)   # (파일 경로, 메타데이터)
+
+    def __init__(self, file_paths: List[str], parent=None):
+        super().__init__(parent)
+        self.file_paths = list(file_paths)
+        self._cancelled = False
+
+    def cancel(self):
+        """등록 취소 (현재 파일까지만 처리)"""
+        self._cancelled = True
+
+    def run(self):
+        catalogue = get_file_catalogue()
+        for file_path in self.file_paths:
+            if self._cancelled:
+                return
+            try:
+                entry = catalogue.index(file_path)
+            except Exception as e:
+                print(f"[Catalogue] 분석 오류 ({os.path.basename(file_path)}): {e}")
+                continue
+            if entry is not None and not self._cancelled:
+                self.file_indexed.emit(file_path, entry.meta())
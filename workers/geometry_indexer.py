@@ -0,0 +1,75 @@
+"""
+VERICOM DLP 3D Printer - Geometry Indexer
+파일 선택 시 레이어 형상 인덱스를 백그라운드에서 계산 (캐시 사이드카 사용)
+"""
+
+import os
+
+from PySide6.QtCore import QThread, Signal
+
+try:
+    from controllers.job_manifest import load_manifest
+    from controllers.layer_geometry import (
+        build_layer_geometry, load_layer_geometry, save_layer_geometry
+    )
+except ImportError:
+    from ..controllers.job_manifest import load_manifest
+    from ..controllers.layer_geometry import (
+        build_layer_geometry, load_layer_geometry, save_layer_geometry
+    )
+
+
+class GeometryIndexer(QThread):
+    """
+    형상 인덱스 계산 스레드
+
+    사용 예:
+        indexer = GeometryIndexer(path)
+        indexer.index_ready.connect(on_ready)   # (경로, LayerGeometry)
+        indexer.start()
+    """
+
+    progress = Signal(int)              # 분석 진행률 (0~100)
+    index_ready = Signal(str, object)   # (파일 경로, LayerGeometry)
+    index_failed = Signal(str, str)     # (파일 경로, 오류 메시지)
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self._cancelled = False
+
+    def cancel(self):
+        """분석 취소 (결과 시그널 없이 종료)"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        name = os.path.basename(self.file_path)
+
+        geometry = load_layer_geometry(self.file_path)
+        if geometry is not None:
+            print(f"[Geometry] 캐시된 인덱스 사용: {name}")
+            self.progress.emit(100)
+            self.index_ready.emit(self.file_path, geometry)
+            return
+
+        try:
+            machine = load_manifest(self.file_path).machine  # 선택 시 만든 매니페스트 재사용
+            machine_size = (machine.get('machineX') or 124.8, machine.get('machineY') or 70.2)
+            geometry = build_layer_geometry(self.file_path, machine_size,
+                                            progress=self.progress.emit,
+                                            cancelled=self.is_cancelled)
+        except Exception as e:
+            print(f"[Geometry] 분석 실패: {name} {e}")
+            if not self._cancelled:
+                self.index_failed.emit(self.file_path, str(e))
+            return
+
+        if geometry is None or self._cancelled:
+            print(f"[Geometry] 취소됨: {name}")
+            return
+
+        save_layer_geometry(self.file_path, geometry)
+        self.index_ready.emit(self.file_path, geometry)
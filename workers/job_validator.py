@@ -0,0 +1,151 @@
+"""
+VERICOM DLP 3D Printer - Job Validator
+전체 레이어 심층 검증 (ZIP CRC, PNG 무결성, 해상도, 비트 깊이)
+
+레이어 묶음을 프로세스 풀에 분배하여 CM4의 모든 코어에서 병렬 검사.
+결과는 (경로, 크기, 수정시각) 기준으로 캐시되어 같은 파일은 한 번만 검증.
+"""
+
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import List, Tuple
+
+from PySide6.QtCore import QThread, Signal
+
+try:
+    from compute.layer_check import check_zip_layers
+    from compute.process_pool import spawn_pool
+    from controllers.chitu_file import is_chitu_file
+    from controllers.gcode_parser import MACHINE_RESOLUTION
+    from controllers.print_archive import PrintArchive
+    from utils.job_cache import JobCache
+except ImportError:
+    from ..compute.layer_check import check_zip_layers
+    from ..compute.process_pool import spawn_pool
+    from ..controllers.chitu_file import is_chitu_file
+    from ..controllers.gcode_parser import MACHINE_RESOLUTION
+    from ..controllers.print_archive import PrintArchive
+    from ..utils.job_cache import JobCache
+
+
+# 작업 단위 (프로세스 간 전달 비용과 진행률 갱신 빈도의 절충)
+CHUNK_LAYERS = 50
+
+# 취소 확인 간격
+POLL_INTERVAL = 0.2  # 초
+
+# 오류 메시지에 표시할 최대 레이어 수
+MAX_REPORTED_ERRORS = 5
+
+_cache = JobCache("validation")
+
+
+class JobValidator(QThread):
+    """
+    심층 검증 스레드
+
+    사용 예:
+        validator = JobValidator(path)
+        validator.progress.connect(on_progress)
+        validator.validation_finished.connect(on_finished)
+        validator.start()
+    """
+
+    progress = Signal(int)                          # 검증 진행률 (0~100)
+    validation_finished = Signal(str, bool, str)    # (파일 경로, 정상 여부, 메시지)
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self._cancelled = False
+
+    def cancel(self):
+        """검증 취소 (결과 시그널 없이 종료)"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        cached = _cache.get(self.file_path)
+        if cached is not None:
+            print(f"[Validator] 캐시된 결과 사용: {os.path.basename(self.file_path)}")
+            self.progress.emit(100)
+            self.validation_finished.emit(self.file_path, cached['ok'], cached['message'])
+            return
+
+        # 캐시는 확정된 판정(전체 검사 완료 또는 실제 손상 발견)만 저장
+        # USB 분리(OSError), 작업자 종료(BrokenProcessPool) 등 일시적 오류는 다음 선택 시 재검증
+        definite = True
+        try:
+            ok, message = self._validate()
+        except Exception as e:
+            ok, message = False, f"검증 오류: {e}"
+            definite = False
+
+        if self._cancelled:
+            print(f"[Validator] 취소됨: {os.path.basename(self.file_path)}")
+            return
+
+        if definite:
+            _cache.put(self.file_path, {'ok': ok, 'message': message})
+        print(f"[Validator] {'정상' if ok else '오류'}: {os.path.basename(self.file_path)} {message}")
+        self.progress.emit(100)
+        self.validation_finished.emit(self.file_path, ok, message)
+
+    def _validate(self) -> Tuple[bool, str]:
+        """전체 레이어 검사 → (정상 여부, 메시지)"""
+        # ChiTu 바이너리는 PNG/CRC가 없으므로 빠른 검증(헤더, 데이터 범위)으로 충분
+        if is_chitu_file(self.file_path):
+            return True, ""
+
+        if not zipfile.is_zipfile(self.file_path):
+            return False, "지원하지 않는 파일 형식입니다"
+
+        with PrintArchive(self.file_path) as archive:
+            names = archive.layer_names()
+        if not names:
+            return False, "레이어 이미지가 없습니다"
+
+        chunks = [names[i:i + CHUNK_LAYERS] for i in range(0, len(names), CHUNK_LAYERS)]
+        errors = self._run_pool(chunks, len(names))
+        if self._cancelled:
+            return False, ""
+
+        if errors:
+            errors.sort()
+            shown = "\n".join(f"{name}: {error}" for name, error in errors[:MAX_REPORTED_ERRORS])
+            more = len(errors) - MAX_REPORTED_ERRORS
+            if more > 0:
+                shown += f"\n... 외 {more}개"
+            return False, f"손상된 레이어 {len(errors)}개\n{shown}"
+
+        return True, f"{len(names)}개 레이어 정상"
+
+    def _run_pool(self, chunks: List[List[str]], total: int) -> List[Tuple[str, str]]:
+        """프로세스 풀에서 레이어 묶음 검사"""
+        errors: List[Tuple[str, str]] = []
+        checked = 0
+
+        workers = max(1, os.cpu_count() or 1)
+        print(f"[Validator] 시작: {total}개 레이어, 프로세스 {workers}개")
+
+        executor = spawn_pool(workers)
+        try:
+            pending = {
+                executor.submit(check_zip_layers, self.file_path, chunk, MACHINE_RESOLUTION): len(chunk)
+                for chunk in chunks
+            }
+
+            while pending and not self._cancelled:
+                done, _ = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    checked += pending.pop(future)
+                    errors.extend(future.result())
+                if done:
+                    self.progress.emit(min(99, checked * 100 // total))
+        finally:
+            executor.shutdown(wait=not self._cancelled, cancel_futures=True)
+
+        return errors
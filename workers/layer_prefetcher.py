@@ -0,0 +1,167 @@
+"""
+VERICOM DLP 3D Printer - Layer Prefetcher
+레이어 N 처리(토출/평탄화/노광) 중 N+1..N+k 레이어를 미리 읽고 디코딩
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from PySide6.QtGui import QImage
+
+
+# 레이어 로더: 레이어 인덱스 → 디코딩된 프레임 (실패 시 None 또는 예외)
+LayerLoader = Callable[[int], Optional[QImage]]
+
+# 건너뛸 레이어 판정: 레이어 인덱스 → True면 읽지 않음 (형상 인덱스상 빈 레이어)
+LayerFilter = Callable[[int], bool]
+
+
+class LayerPrefetcher:
+    """
+    백그라운드 레이어 선읽기 파이프라인
+
+    크기 제한 큐(lookahead depth)를 사용하여 최대 depth개 레이어만 미리 준비.
+    소비 측(PrintWorker)은 take()로 순서대로 프레임을 가져감.
+    skip으로 지정한 레이어는 읽지도, 큐에 넣지도 않음 (소비 측도 take()하지 않음).
+    cancel() 호출 시 생산 스레드는 다음 확인 지점에서 즉시 종료.
+    """
+
+    # 레이어 로드 재시도 (USB 순간 지연 대비)
+    MAX_RETRIES = 3
+    RETRY_DELAY = 0.5  # 초
+
+    # 큐 대기 중 취소 확인 간격
+    POLL_INTERVAL = 0.1  # 초
+
+    def __init__(self, loader: LayerLoader, start_layer: int, end_layer: int,
+                 depth: int = 3, skip: Optional[LayerFilter] = None):
+        """
+        Args:
+            loader: 레이어 로드 함수 (워커 스레드에서 호출됨)
+            start_layer: 첫 선읽기 레이어 인덱스
+            end_layer: 마지막 레이어 인덱스 + 1
+            depth: 미리 준비할 최대 레이어 수 (큐 크기)
+            skip: 건너뛸 레이어 판정 함수 (None이면 모든 레이어 로드)
+        """
+        self._loader = loader
+        self._skip = skip
+        self._start_layer = start_layer
+        self._end_layer = end_layer
+        self._depth = max(1, depth)
+
+        self._queue: "queue.Queue[Tuple[int, Optional[QImage]]]" = queue.Queue(maxsize=self._depth)
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def start_layer(self) -> int:
+        return self._start_layer
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def start(self):
+        """선읽기 스레드 시작"""
+        self._thread = threading.Thread(
+            target=self._run, name="LayerPrefetcher", daemon=True
+        )
+        self._thread.start()
+        print(f"[Prefetch] 시작: 레이어 {self._start_layer}~{self._end_layer - 1} (depth {self._depth})")
+
+    def cancel(self, wait: bool = True):
+        """
+        선읽기 취소
+
+        Args:
+            wait: True면 스레드 종료까지 대기
+        """
+        self._cancel_event.set()
+
+        # 큐가 가득 차서 put()에서 대기 중인 생산자를 풀어줌
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        if wait and self._thread and self._thread.is_alive() \
+                and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+
+    def take(self, layer_idx: int, timeout: float = 5.0) -> Optional[QImage]:
+        """
+        레이어 프레임 가져오기
+
+        Args:
+            layer_idx: 요청 레이어 인덱스
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            디코딩된 프레임, 준비되지 않았거나 실패 시 None (호출 측에서 동기 로드)
+        """
+        if layer_idx < self._start_layer or layer_idx >= self._end_layer:
+            return None
+
+        deadline = time.monotonic() + timeout
+        while not self._cancel_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                idx, frame = self._queue.get(timeout=min(remaining, self.POLL_INTERVAL))
+            except queue.Empty:
+                if self._thread is not None and not self._thread.is_alive():
+                    break
+                continue
+
+            if idx < layer_idx:
+                # 이미 지나간 레이어 (버림)
+                continue
+            if idx == layer_idx:
+                return frame
+            # 요청보다 앞선 레이어 → 순서 불일치, 동기 로드로 처리
+            print(f"[Prefetch] 순서 불일치: 요청 {layer_idx}, 수신 {idx}")
+            return None
+
+        print(f"[Prefetch] 레이어 {layer_idx} 준비 안 됨 → 동기 로드")
+        return None
+
+    def _run(self):
+        """생산 스레드: 레이어를 순서대로 로드하여 큐에 적재"""
+        for layer_idx in range(self._start_layer, self._end_layer):
+            if self._cancel_event.is_set():
+                break
+            if self._skip is not None and self._skip(layer_idx):
+                continue
+
+            frame = self._load_with_retry(layer_idx)
+
+            # 큐에 자리가 날 때까지 대기 (취소 확인하며)
+            while not self._cancel_event.is_set():
+                try:
+                    self._queue.put((layer_idx, frame), timeout=self.POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
+
+        print("[Prefetch] 종료")
+
+    def _load_with_retry(self, layer_idx: int) -> Optional[QImage]:
+        """레이어 로드 (재시도 포함, 실패 시 None)"""
+        for attempt in range(self.MAX_RETRIES):
+            if self._cancel_event.is_set():
+                return None
+            try:
+                frame = self._loader(layer_idx)
+                if frame is not None and not frame.isNull():
+                    return frame
+                raise ValueError(f"레이어 {layer_idx} 디코딩 실패")
+            except Exception as e:
+                print(f"[Prefetch] 레이어 {layer_idx} 로드 오류 (시도 {attempt + 1}/{self.MAX_RETRIES}): {e}")
+                if attempt < self.MAX_RETRIES - 1:
+                    self._cancel_event.wait(self.RETRY_DELAY)
+
+        return None
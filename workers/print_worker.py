@@ -4,9 +4,8 @@ QThread 기반 프린팅 시퀀스 실행
 """
 
 import time
-import zipfile
 from enum import Enum, auto
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from dataclasses import dataclass
 
 from PySide6.QtCore import QThread, Signal, QMutex, QWaitCondition
@@ -20,12 +19,39 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from controllers.motor_controller import MotorController
     from controllers.dlp_controller import DLPController
-    from controllers.gcode_parser import GCodeParser, PrintParameters
+    from controllers.gcode_parser import PrintParameters
+    from controllers.layer_source import LayerSource, open_layer_source
+    from controllers.layer_geometry import LayerGeometry, is_blank_frame
+    from controllers.motion_planner import BLADE_RETURN_SPEED, BladeSweep, plan_blade_sweep
+    from controllers.lift_policy import LiftMove, LiftPolicy
+    from compute.layer_transform import LayerTransform
+    from controllers.resin_planner import (
+        DEFAULT_MM3_PER_MM, REFILL_RESERVE_MM, DispensePlan, ResinPlanner, scaled_delay
+    )
+    from workers.layer_prefetcher import LayerPrefetcher
+    from utils.frame_utils import FramePlan, plan_frame, normalize_frame
+    from utils.uniformity_mask import UniformityConfig, UniformityMask, load_uniformity_mask
 except ImportError:
     # 상대 임포트 시도
     from ..controllers.motor_controller import MotorController
     from ..controllers.dlp_controller import DLPController
-    from ..controllers.gcode_parser import GCodeParser, PrintParameters
+    from ..controllers.gcode_parser import PrintParameters
+    from ..controllers.layer_source import LayerSource, open_layer_source
+    from ..controllers.layer_geometry import LayerGeometry, is_blank_frame
+    from ..controllers.motion_planner import BLADE_RETURN_SPEED, BladeSweep, plan_blade_sweep
+    from ..controllers.lift_policy import LiftMove, LiftPolicy
+    from ..compute.layer_transform import LayerTransform
+    from ..controllers.resin_planner import (
+        DEFAULT_MM3_PER_MM, REFILL_RESERVE_MM, DispensePlan, ResinPlanner, scaled_delay
+    )
+    from .layer_prefetcher import LayerPrefetcher
+    from ..utils.frame_utils import FramePlan, plan_frame, normalize_frame
+    from ..utils.uniformity_mask import UniformityConfig, UniformityMask, load_uniformity_mask
+
+
+# 프로젝터 프레임 표시 확인 대기 (LED ON 전)
+FRAME_PRESENT_TIMEOUT_MS = 100     # 정상 대기 (초과 시 지연 프레임으로 기록)
+FRAME_PRESENT_MAX_WAIT_MS = 2000   # 최대 대기 (초과 시 출력 중지)
 
 
 class PrintStatus(Enum):
@@ -50,6 +76,10 @@ class PrintJob:
     blade_boundary: float = 60.0  # 구간 경계 위치 (mm)
     blade_start: float = 0.0  # 블레이드 시작 위치 (mm)
     blade_end: float = 130.0  # 블레이드 끝 위치 (mm)
+    blade_fit_sweep: bool = False    # 레이어 노광 영역까지만 평탄화 (형상 인덱스 필요)
+    blade_fit_margin: float = 10.0   # 노광 영역 끝 이후 안전 여유 (mm)
+    blade_field_offset: float = 2.6  # 노광 영역 왼쪽 끝의 블레이드 X 위치 (mm)
+    blade_bidirectional: bool = False  # 양방향 평탄화 (짝수 번째 레이어 역방향, 복귀 생략)
     led_power: int = 440
     z_offset: float = 0.0    # Z 오프셋 (mm)
     settle_time: float = 0.0 # 초기+첫레이어 토출 후 대기 (초)
@@ -64,6 +94,17 @@ class PrintJob:
     y_pull_delay: float = 2.0          # Pull 구간 시간 (초) → speed 자동계산
     y_return_distance: float = 0.0     # 다시 밀기 거리 (mm, 0=비활성)
     y_return_delay: float = 2.0        # Return 구간 시간 (초) → speed 자동계산
+    y_volumetric: bool = False         # 면적 기반 토출 (y_dispense_distance = 레이어당 최대)
+    y_overfill: float = 1.5            # 소모량 대비 토출 배율
+    y_min_distance: float = 0.05       # 레이어당 최소 토출 거리 (mm)
+    resin_mm3_per_mm: float = DEFAULT_MM3_PER_MM  # Y 1mm당 토출량 (mm³, 주사기 보정값)
+    dispense_plan: Optional[DispensePlan] = None  # 레이어별 토출 거리 (작업 시작 시 계산)
+    planned_refill: bool = False       # 토출 전 잔량 부족 예상 시 미리 일시정지 (소진 대기 대신)
+    prefetch_depth: int = 3            # 레이어 선읽기 깊이 (0=비활성, 동기 로드)
+    lift_policy: LiftPolicy = LiftPolicy()  # Z 리프트 정책 (기본 fixed: +3mm @ 300mm/min)
+    geometry: Optional[LayerGeometry] = None  # 레이어 형상 인덱스 (없으면 적응형 기능 비활성)
+    layer_transform: LayerTransform = LayerTransform()  # 레이어 보정 (XY 보정/내부 디밍/AA 임계값)
+    uniformity: UniformityConfig = UniformityConfig()   # 프로젝터 조도 균일화 마스크 설정
 
 
 class PrintWorker(QThread):
@@ -77,6 +118,7 @@ class PrintWorker(QThread):
         error_occurred: 에러 발생 시 (message)
         print_completed: 프린트 완료 시
         print_stopped: 프린트 중지 시
+        job_summary: 완료/중지 직전 작업 요약 (dict)
     """
 
     # 시그널 정의
@@ -87,7 +129,9 @@ class PrintWorker(QThread):
     print_completed = Signal()
     print_stopped = Signal()
     resin_empty = Signal()  # Resin 부족 알림 (position_min=0 도달)
+    refill_planned = Signal(int)  # 계획 리필 일시정지 (layer_index, 다음 토출 전 잔량 부족 예상)
     priming_requested = Signal()  # 프라이밍 요청 (프린트 중 프라이밍 필요 시)
+    job_summary = Signal(dict)  # 작업 요약 (완료/중지 시그널 직전)
 
     # 이미지 표시 요청 시그널 (ProjectorWindow로 전달)
     show_image = Signal(object)  # QPixmap
@@ -113,14 +157,35 @@ class PrintWorker(QThread):
         self._pause_condition = QWaitCondition()
         self._resin_mutex = QMutex()
         self._resin_condition = QWaitCondition()
+        self._present_mutex = QMutex()
+        self._present_condition = QWaitCondition()
+        self._presented_key = 0          # 프로젝터가 마지막으로 그린 프레임 (QPixmap.cacheKey)
+        self._frame_ack = False          # 프레임 표시 확인 후 LED ON (프로젝터 윈도우 표시 중일 때)
 
         # Resin 토출 상태
         self._y_position = 0.0           # Resin pump 현재 위치
         self._y_dispensing_disabled = False  # True면 토출 스킵 (수동 공급 모드)
         self._y_resin_waiting = False     # Resin 부족 응답 대기 중
 
+        # 블레이드 현재 위치 (양방향 평탄화 시작점 판단용)
+        self._blade_position = 0.0
+
         # 현재 작업
         self._job: Optional[PrintJob] = None
+        self._layer_source: Optional[LayerSource] = None  # 작업 동안 열려있는 레이어 소스 (.vlayers/ChiTu/ZIP)
+        self._prefetcher: Optional[LayerPrefetcher] = None  # 레이어 선읽기
+
+        # 프로젝터 네이티브 해상도 (레이어 프레임을 워커에서 미리 맞춤)
+        self._projector_size = (1920, 1080)
+        self._frame_plan: Optional[FramePlan] = None  # 작업당 1회 계산
+        self._uniformity_mask: Optional[UniformityMask] = None  # 조도 균일화 게인 (작업당 1회 로드)
+        self._blank_layers = set()  # 프레임 로드 시 판정한 빈 레이어 (형상 인덱스가 없는 경우)
+
+        # 작업 요약 (빈 레이어 생략 등)
+        self._empty_layers = 0
+        self._time_saved = 0.0  # 빈 레이어 노광 생략으로 절약한 시간 (초)
+        self._late_frames = 0   # 표시 확인이 FRAME_PRESENT_TIMEOUT_MS를 넘은 프레임 수
+        self._present_max_ms = 0.0  # 최대 표시 확인 시간 (ms)
 
         # 시뮬레이션 모드
         self.simulation = False
@@ -138,11 +203,36 @@ class PrintWorker(QThread):
 
     # ==================== 제어 메서드 ====================
 
+    def set_projector_size(self, width: int, height: int):
+        """프로젝터 실제 해상도 설정 (프린트 시작 전 호출)"""
+        if width > 0 and height > 0:
+            self._projector_size = (width, height)
+
+    def set_frame_ack(self, enabled: bool):
+        """
+        프레임 표시 확인 사용 (프린트 시작 전 호출)
+
+        켜면 show_image 후 notify_frame_presented()가 같은 프레임으로 호출될 때까지
+        LED ON을 미룸. 화면에 표시되지 않는 프로젝터 윈도우에서는 끔.
+        """
+        self._frame_ack = bool(enabled)
+
+    def notify_frame_presented(self, key: int):
+        """프로젝터가 프레임을 그림 (ProjectorWindow.frame_presented, GUI 스레드)"""
+        self._present_mutex.lock()
+        self._presented_key = key
+        self._present_condition.wakeAll()
+        self._present_mutex.unlock()
+
     def start_print(self, file_path: str, params: Dict[str, Any],
                    blade_speed: int = 300, blade_speed2: int = 1200,
                    blade_boundary: float = 60.0,
                    blade_start: float = 0.0,
                    blade_end: float = 130.0, led_power: int = 440,
+                   blade_fit_sweep: bool = False,
+                   blade_fit_margin: float = 10.0,
+                   blade_field_offset: float = 2.6,
+                   blade_bidirectional: bool = False,
                    z_offset: float = 0.0, settle_time: float = 0.0,
                    initial_leveling: bool = True,
                    leveling_cycles: int = 1, blade_cycles: int = 1,
@@ -153,7 +243,19 @@ class PrintWorker(QThread):
                    y_pull_distance: float = 0.0,
                    y_pull_delay: float = 2.0,
                    y_return_distance: float = 0.0,
-                   y_return_delay: float = 2.0):
+                   y_return_delay: float = 2.0,
+                   y_volumetric: bool = False,
+                   y_overfill: float = 1.5,
+                   y_min_distance: float = 0.05,
+                   resin_mm3_per_mm: float = DEFAULT_MM3_PER_MM,
+                   planned_refill: bool = False,
+                   prefetch_depth: int = 3,
+                   lift_mode: str = "fixed",
+                   lift_min_height: float = 1.0,
+                   lift_full_area: float = 1500.0,
+                   geometry: Optional[LayerGeometry] = None,
+                   layer_transform: Optional[LayerTransform] = None,
+                   uniformity: Optional[UniformityConfig] = None):
         """
         프린트 시작
 
@@ -163,6 +265,10 @@ class PrintWorker(QThread):
             blade_speed: 블레이드 속도 (mm/min)
             blade_start: 블레이드 시작 위치 (mm, 0~10)
             blade_end: 블레이드 끝 위치 (mm, 120~130)
+            blade_fit_sweep: 레이어 노광 영역(형상 인덱스)까지만 평탄화
+            blade_fit_margin: 노광 영역 끝 이후 안전 여유 (mm)
+            blade_field_offset: 노광 영역 왼쪽 끝의 블레이드 X 위치 (mm)
+            blade_bidirectional: 양방향 평탄화 (홀수 번째 레이어 정방향, 짝수 번째 역방향)
             led_power: LED 밝기 (91~1023)
             leveling_cycles: 레진 평탄화 횟수
             blade_cycles: 매 레이어 블레이드 왕복 횟수 (1~3)
@@ -174,6 +280,18 @@ class PrintWorker(QThread):
             y_pull_delay: Pull 구간 시간 (초)
             y_return_distance: 다시 밀기 거리 (mm, 0=비활성)
             y_return_delay: Return 구간 시간 (초)
+            y_volumetric: 면적 기반 토출 (형상 인덱스 필요, y_dispense_distance가 최대값)
+            y_overfill: 소모량 대비 토출 배율
+            y_min_distance: 레이어당 최소 토출 거리 (mm)
+            resin_mm3_per_mm: Y 1mm당 토출량 (mm³, 주사기 보정값)
+            planned_refill: 토출 전 잔량이 부족할 레이어에서 미리 리필 일시정지
+            prefetch_depth: 레이어 선읽기 깊이 (0=비활성)
+            lift_mode: Z 리프트 정책 (fixed / gcode / adaptive)
+            lift_min_height: adaptive 최소 리프트 높이 (mm)
+            lift_full_area: adaptive 파일 리프트를 그대로 쓰는 면적 (mm²)
+            geometry: 레이어 형상 인덱스 (파일 선택 시 계산, 없으면 None)
+            layer_transform: 레이어 보정 (보정 스토어가 있으면 사용, 없으면 선읽기 중 적용)
+            uniformity: 프로젝터 조도 균일화 마스크 설정 (정규화된 프레임마다 게인 곱)
         """
         if self.isRunning():
             print("[PrintWorker] 이미 실행 중")
@@ -194,6 +312,10 @@ class PrintWorker(QThread):
             blade_boundary=blade_boundary,
             blade_start=blade_start,
             blade_end=blade_end,
+            blade_fit_sweep=blade_fit_sweep,
+            blade_fit_margin=blade_fit_margin,
+            blade_field_offset=blade_field_offset,
+            blade_bidirectional=blade_bidirectional,
             led_power=led_power,
             z_offset=z_offset,
             settle_time=settle_time,
@@ -208,9 +330,27 @@ class PrintWorker(QThread):
             y_pull_delay=y_pull_delay,
             y_return_distance=y_return_distance,
             y_return_delay=y_return_delay,
+            y_volumetric=y_volumetric,
+            y_overfill=y_overfill,
+            y_min_distance=y_min_distance,
+            resin_mm3_per_mm=resin_mm3_per_mm,
+            planned_refill=planned_refill,
+            prefetch_depth=prefetch_depth,
+            lift_policy=LiftPolicy.from_params(print_params.to_dict(), mode=lift_mode,
+                                               min_height=lift_min_height,
+                                               full_area=lift_full_area),
+            geometry=geometry,
+            layer_transform=layer_transform or LayerTransform(),
+            uniformity=uniformity or UniformityConfig(),
         )
 
         # 플래그 초기화
+        self._frame_plan = None
+        self._blank_layers = set()
+        self._empty_layers = 0
+        self._time_saved = 0.0
+        self._late_frames = 0
+        self._present_max_ms = 0.0
         self._is_paused = False
         self._is_stopped = False
         self._y_position = y_priming_position  # 프라이밍 위치에서 시작
@@ -249,6 +389,10 @@ class PrintWorker(QThread):
         self._y_resin_waiting = False
         self._resin_condition.wakeAll()
         self._resin_mutex.unlock()
+        # 레이어 선읽기 취소 (스레드 종료 대기는 _cleanup에서)
+        prefetcher = self._prefetcher
+        if prefetcher:
+            prefetcher.cancel(wait=False)
         self._set_status(PrintStatus.STOPPING)
         print("[PrintWorker] 정지 요청")
 
@@ -313,8 +457,59 @@ class PrintWorker(QThread):
         print(f"  - 블레이드 범위: {job.blade_start}~{job.blade_end} mm")
         print(f"  - LED 파워: {job.led_power}")
 
+        # 레이어 소스는 작업 동안 한 번만 열기 (변환된 .vlayers 우선, 레이어마다 재오픈 방지)
+        try:
+            self._layer_source = open_layer_source(job.file_path, job.layer_transform)
+            print(f"[PrintWorker] 레이어 소스: {type(self._layer_source).__name__} "
+                  f"({self._layer_source.layer_count}개)")
+            if not job.layer_transform.is_identity:
+                print(f"[PrintWorker] 레이어 보정: {job.layer_transform.summary()}")
+        except Exception as e:
+            self.error_occurred.emit(f"프린트 파일을 열 수 없습니다: {e}")
+            self._is_stopped = True
+            return
+
+        # 형상 인덱스는 레이어 수가 일치할 때만 사용
+        if job.geometry is not None:
+            if job.geometry.layer_count == self._layer_source.layer_count:
+                print(f"[PrintWorker] 형상 인덱스: {job.geometry.summary()}")
+            else:
+                print(f"[PrintWorker] 형상 인덱스 레이어 수 불일치 → 사용 안 함 "
+                      f"({job.geometry.layer_count} != {self._layer_source.layer_count})")
+                job.geometry = None
+        lift = job.lift_policy
+        if lift.mode == "fixed":
+            print(f"[PrintWorker] Z 리프트: fixed (+{lift.normal_height}mm @ {lift.normal_speed}mm/min)")
+        else:
+            print(f"[PrintWorker] Z 리프트: {lift.mode} (바닥 {lift.bottom_height}mm @ {lift.bottom_speed}, "
+                  f"일반 {lift.normal_height}mm @ {lift.normal_speed}, 하강 {lift.drop_speed}mm/min)")
+            if lift.mode == "adaptive" and job.geometry is None:
+                print("[PrintWorker] 형상 인덱스 없음 → 면적 비례 리프트 대신 파일 리프트 사용")
+        if job.blade_bidirectional:
+            print("[PrintWorker] 양방향 평탄화: 홀수 레이어 정방향, 짝수 레이어 역방향 (복귀 생략)")
+        if job.blade_fit_sweep:
+            if job.geometry is not None:
+                print(f"[PrintWorker] 평탄화 범위: 노광 영역 + {job.blade_fit_margin}mm "
+                      f"(영역 시작 X {job.blade_field_offset}mm)")
+            else:
+                print("[PrintWorker] 형상 인덱스 없음 → 전체 범위 평탄화")
+
+        # 레이어별 토출 거리 (면적 기반은 형상 인덱스 필요)
+        job.dispense_plan = self._plan_dispense(job, self._layer_source.layer_count)
+        print(f"[PrintWorker] Resin 계획: {job.dispense_plan.summary()}")
+        if job.y_volumetric and not job.dispense_plan.volumetric:
+            print("[PrintWorker] 형상 인덱스 없음 → 고정 토출 거리 사용")
+
+        # 프레임 스케일/종횡비 결정 (작업당 1회)
+        self._plan_job_frames()
+
+        # 조도 균일화 마스크 (프로젝터 해상도, 캐시 없으면 이 스레드에서 계산)
+        self._uniformity_mask = load_uniformity_mask(job.uniformity, self._projector_size)
+        if job.uniformity.enabled and self._uniformity_mask is None:
+            print("[PrintWorker] 조도 균일화 마스크 없음 → 보정 없이 출력")
+
         # 컨트롤러 설정 (시뮬레이션 모드가 아닐 때)
-        # 주의: DLP는 main.py에서 이미 초기화됨, 다시 초기화하면 안됨
+        # 주의: DLP는 app.py에서 이미 초기화됨, 다시 초기화하면 안됨
         if not self.simulation:
             if self.dlp and self.dlp.is_initialized:
                 self.dlp.set_brightness(job.led_power)
@@ -403,6 +598,11 @@ class PrintWorker(QThread):
         self._set_status(PrintStatus.PRINTING)
         total_layers = params.totalLayer
 
+        # 첫 레이어부터 선읽기 시작 (레이어 0 토출/평탄화 중 디코딩)
+        if job.prefetch_depth > 0:
+            self._start_prefetch(0)
+
+        layers_done = 0
         for layer_idx in range(total_layers):
             # 정지 체크
             if self._check_stopped():
@@ -420,8 +620,10 @@ class PrintWorker(QThread):
             # 레이어 처리 (실패 시 루프 종료)
             if not self._process_layer(layer_idx, job):
                 break
+            layers_done += 1
 
         # 5. 완료 또는 정지
+        self._emit_job_summary(layers_done)
         if self._is_stopped:
             self._set_status(PrintStatus.STOPPING)
             self.print_stopped.emit()
@@ -437,9 +639,9 @@ class PrintWorker(QThread):
         1. Z축 레이어 높이로 이동
         2. Resin 토출 + 대기
         3. X축 시작→끝 (평탄화)
-        4. 이미지 투영 → LED ON → 노광 → LED OFF
-        5. Z축 리프트 (+5mm)
-        6. X축 끝→시작 (복귀)
+        4. 이미지 투영 → LED ON → 노광 → LED OFF (빈 레이어는 생략)
+        5. Z축 리프트 (리프트 정책: 고정 / 파일 값 / 면적 비례)
+        6. X축 끝→시작 (복귀, 양방향 모드는 생략하고 다음 레이어를 역방향 평탄화)
 
         Returns:
             bool: 성공 시 True, 실패 시 False (이미지 로드 실패 등)
@@ -456,8 +658,8 @@ class PrintWorker(QThread):
         # Z축 위치 계산
         z_position = job.z_offset + (layer_idx + 1) * params.layerHeight
 
-        # 1. Z축 레이어 높이로 이동
-        if not self._motor_z_move(z_position):
+        # 1. Z축 레이어 높이로 이동 (이전 레이어 리프트 위치에서 하강)
+        if not self._motor_z_move(z_position, job.lift_policy.drop_speed):
             self.error_occurred.emit(f"레이어 {layer_idx}: Z축 이동 실패")
             self._is_stopped = True
             return False
@@ -465,6 +667,15 @@ class PrintWorker(QThread):
         # 2. Resin 토출 (3단계: Push → Pull → Return)
         # 소진 감지는 _dispense_3step() 내부에서 Push 직후 처리
         if job.y_dispense_distance > 0:
+            distance, delay = self._dispense_for_layer(layer_idx, job)
+
+            # 계획 리필: 이번 토출로 홈 센서 여유를 넘으면 토출 전에 주사기 교체 대기
+            if job.planned_refill and not self._y_dispensing_disabled and self._refill_due(distance, job):
+                print(f"[PrintWorker] Layer {layer_idx}: Planned refill "
+                      f"(pos: {self._y_position:.1f}mm, need: {distance:.2f}mm)")
+                if not self._wait_for_refill(lambda: self.refill_planned.emit(layer_idx)):
+                    return False
+
             if self._y_dispensing_disabled:
                 # 수동 공급 모드: Y축 스킵, delay만 유지
                 print(f"[PrintWorker] Layer {layer_idx}: Manual feed mode — Y skip, waiting {job.y_dispense_delay}s")
@@ -472,7 +683,7 @@ class PrintWorker(QThread):
                     return False
             else:
                 # 정상 토출 (소진 시 _dispense_3step 내부에서 resin_empty 처리)
-                if not self._dispense_3step(layer_idx, job):
+                if not self._dispense_3step(layer_idx, job, push_distance=distance, push_delay=delay):
                     return False
 
         # Settle time 대기 (첫 레이어만)
@@ -481,15 +692,13 @@ class PrintWorker(QThread):
             if not self._wait_interruptible(job.settle_time):
                 return True
 
-        # 3. X축 평탄화 (2구간: start→boundary→end)
-        if not self._motor_x_move(job.blade_boundary, job.blade_speed):
-            self.error_occurred.emit(f"레이어 {layer_idx}: X축 평탄화(구간1) 실패")
-            self._is_stopped = True
-            return False
-        if not self._motor_x_move(job.blade_end, job.blade_speed2):
-            self.error_occurred.emit(f"레이어 {layer_idx}: X축 평탄화(구간2) 실패")
-            self._is_stopped = True
-            return False
+        # 3. X축 평탄화 (2구간: start→boundary→end, 제한 모드는 노광 영역 끝까지)
+        sweep = self._plan_blade_sweep(layer_idx, job)
+        for segment, (target, speed) in enumerate(sweep.moves, start=1):
+            if not self._motor_x_move(target, speed):
+                self.error_occurred.emit(f"레이어 {layer_idx}: X축 평탄화(구간{segment}) 실패")
+                self._is_stopped = True
+                return False
 
         # 정지/일시정지 체크 (LED ON 전에)
         if self._check_stopped():
@@ -498,20 +707,39 @@ class PrintWorker(QThread):
         if self._check_stopped():
             return True
 
-        # 4. 이미지 투영 (실패 시 프린트 중지)
-        if not self._show_layer_image(job.file_path, layer_idx):
-            self._mutex.lock()
-            self._is_stopped = True
-            self._mutex.unlock()
-            return False
+        # 4. 레이어 프레임 준비 (형상 인덱스상 빈 레이어는 디코딩 생략)
+        frame = None
+        if not self._is_empty_layer(layer_idx):
+            frame = self._take_layer_frame(layer_idx)
+            if frame is None:
+                self._mutex.lock()
+                self._is_stopped = True
+                self._mutex.unlock()
+                return False
 
-        # 5. LED ON + 노광 (블레이드 끝 위치 = 빛 안 가림)
-        self._dlp_led_on(job.led_power)
-        self._wait_exposure(exposure_time)
+        # 빈 프레임 판정은 로드 시(선읽기 스레드) 완료 → 노광 직전에는 조회만
+        blank = frame is None or layer_idx in self._blank_layers
+        self._blank_layers.discard(layer_idx)
+        if blank:
+            # 빈 레이어: 이미지 전송, LED ON/OFF, 노광 대기 생략 (Z/리코팅은 유지)
+            print(f"[PrintWorker] Layer {layer_idx}: 빈 레이어 → 노광 생략 ({exposure_time}초)")
+            self._empty_layers += 1
+            self._time_saved += exposure_time
+        else:
+            # 5. 이미지 투영 → 표시 확인 → LED ON + 노광 (블레이드 끝 위치 = 빛 안 가림)
+            if not self._present_frame(frame, layer_idx):
+                self.clear_image.emit()
+                self.error_occurred.emit(f"레이어 {layer_idx}: 프로젝터 화면 갱신 확인 실패")
+                self._mutex.lock()
+                self._is_stopped = True
+                self._mutex.unlock()
+                return False
+            self._dlp_led_on(job.led_power)
+            self._wait_exposure(exposure_time)
 
-        # 6. LED OFF
-        self._dlp_led_off()
-        self.clear_image.emit()
+            # 6. LED OFF
+            self._dlp_led_off()
+            self.clear_image.emit()
 
         # LED OFF 후 일시정지/정지 체크
         if self._check_stopped():
@@ -520,20 +748,20 @@ class PrintWorker(QThread):
         if self._check_stopped():
             return True
 
-        # 7. Z축 리프트 (+3mm)
-        z_lift_position = z_position + 3.0
-        if not self._motor_z_move(z_lift_position):
+        # 7. Z축 리프트 (레이어 면적에 따라 높이/속도 결정)
+        lift = self._lift_for_layer(layer_idx, job)
+        if not self._motor_z_move(z_position + lift.height, lift.speed):
             self.error_occurred.emit(f"레이어 {layer_idx}: Z축 리프트 실패")
             self._is_stopped = True
             return False
 
-        # 8. X축 시작 위치 복귀
+        # 8. X축 시작 위치 복귀 (양방향 모드는 제자리, 다음 레이어가 역방향 평탄화)
         # 복귀는 평탄화가 아니므로 빠른 고정 속도 사용 (50mm/s = 3000mm/min)
-        x_return_position = job.blade_start
-        if not self._motor_x_move(x_return_position, 3000):
-            self.error_occurred.emit(f"레이어 {layer_idx}: X축 홈 복귀 실패")
-            self._is_stopped = True
-            return False
+        if sweep.return_position is not None:
+            if not self._motor_x_move(sweep.return_position, BLADE_RETURN_SPEED):
+                self.error_occurred.emit(f"레이어 {layer_idx}: X축 홈 복귀 실패")
+                self._is_stopped = True
+                return False
 
         return True
 
@@ -557,10 +785,13 @@ class PrintWorker(QThread):
         """
         print("[PrintWorker] X축 홈 이동")
         if self.motor and not self.simulation:
-            return self.motor.x_home(force=force)
+            success = self.motor.x_home(force=force)
         else:
             time.sleep(0.3)
-            return True
+            success = True
+        if success:
+            self._blade_position = 0.0
+        return success
 
     def _motor_z_move(self, position: float, speed: int = 300) -> bool:
         """Z축 이동"""
@@ -573,10 +804,13 @@ class PrintWorker(QThread):
     def _motor_x_move(self, position: float, speed: int = 300) -> bool:
         """X축 이동"""
         if self.motor and not self.simulation:
-            return self.motor.x_move_absolute(position, speed)
+            success = self.motor.x_move_absolute(position, speed)
         else:
             time.sleep(0.2)
-            return True
+            success = True
+        if success:
+            self._blade_position = position
+        return success
 
     def _motor_y_home(self) -> bool:
         """Resin pump 홈"""
@@ -610,6 +844,43 @@ class PrintWorker(QThread):
         if self.dlp and not self.simulation:
             self.dlp.projector_off()
 
+    def _present_frame(self, frame: QImage, layer_idx: int) -> bool:
+        """
+        프레임 투영 요청 후 프로젝터가 실제로 그릴 때까지 대기
+
+        이전 프레임/빈 화면이 노광되지 않도록 LED ON 직전에 호출.
+        프레임은 QPixmap.cacheKey로 구분 (큐 연결로 전달되어도 같은 키).
+
+        Returns:
+            bool: 표시 확인(또는 확인 미사용) 시 True, 최대 대기 초과 시 False
+        """
+        pixmap = QPixmap.fromImage(frame)
+        key = pixmap.cacheKey()
+        start = time.monotonic()
+        self.show_image.emit(pixmap)
+        if not self._frame_ack:
+            return True
+
+        self._present_mutex.lock()
+        try:
+            while self._presented_key != key:
+                elapsed_ms = (time.monotonic() - start) * 1000
+                if elapsed_ms >= FRAME_PRESENT_MAX_WAIT_MS:
+                    print(f"[PrintWorker] Layer {layer_idx}: 프레임 표시 확인 없음 "
+                          f"({FRAME_PRESENT_MAX_WAIT_MS}ms)")
+                    return False
+                self._present_condition.wait(self._present_mutex,
+                                             int(FRAME_PRESENT_MAX_WAIT_MS - elapsed_ms) + 1)
+        finally:
+            self._present_mutex.unlock()
+
+        elapsed_ms = (time.monotonic() - start) * 1000
+        self._present_max_ms = max(self._present_max_ms, elapsed_ms)
+        if elapsed_ms > FRAME_PRESENT_TIMEOUT_MS:
+            self._late_frames += 1
+            print(f"[PrintWorker] Layer {layer_idx}: 프레임 표시 지연 {elapsed_ms:.0f}ms")
+        return True
+
     def _dlp_led_on(self, brightness: int):
         """LED ON"""
         if self.dlp and not self.simulation:
@@ -620,32 +891,108 @@ class PrintWorker(QThread):
         if self.dlp and not self.simulation:
             self.dlp.led_off()
 
-    def _show_layer_image(self, zip_path: str, layer_idx: int) -> bool:
+    def _plan_blade_sweep(self, layer_idx: int, job: PrintJob) -> BladeSweep:
+        """
+        레이어 평탄화 계획
+
+        제한 모드 + 형상 인덱스가 있으면 노광 영역 X 범위까지만,
+        양방향 모드면 짝수 번째 레이어(layer_idx 홀수)를 역방향으로 평탄화
+        """
+        x_extent = None
+        if job.blade_fit_sweep and job.geometry is not None:
+            x_extent = job.geometry.x_extent_mm(layer_idx)
+        return plan_blade_sweep(
+            job.blade_start, job.blade_end, job.blade_boundary,
+            job.blade_speed, job.blade_speed2,
+            x_extent=x_extent,
+            bbox_limited=x_extent is not None,
+            field_offset=job.blade_field_offset,
+            margin=job.blade_fit_margin,
+            bidirectional=job.blade_bidirectional,
+            reverse=job.blade_bidirectional and layer_idx % 2 == 1,
+            position=self._blade_position,
+        )
+
+    def _lift_for_layer(self, layer_idx: int, job: PrintJob) -> LiftMove:
+        """레이어 리프트 (형상 인덱스가 있으면 노광 면적 기준, 없으면 최대 리프트)"""
+        area = None
+        if job.geometry is not None:
+            area = job.geometry.area_mm2(layer_idx)
+        return job.lift_policy.for_layer(layer_idx, area)
+
+    @staticmethod
+    def _plan_dispense(job: PrintJob, layer_count: int) -> DispensePlan:
+        """작업 전체 토출 계획 (면적 기반 모드 + 형상 인덱스가 있을 때만 레이어별 거리)"""
+        planner = ResinPlanner(
+            layer_height=job.params.layerHeight,
+            mm3_per_mm=job.resin_mm3_per_mm,
+            overfill=job.y_overfill,
+            min_distance=job.y_min_distance,
+            max_distance=job.y_dispense_distance,
+        )
+        areas = job.geometry.areas_mm2 if job.y_volumetric and job.geometry is not None else None
+        return planner.plan(layer_count, areas=areas, fixed_distance=job.y_dispense_distance)
+
+    def _refill_due(self, distance: float, job: PrintJob) -> bool:
+        """이번 토출(Push + Return - Pull)로 Y가 홈 센서 여유 아래로 내려가는지"""
+        net = distance + max(0.0, job.y_return_distance - job.y_pull_distance)
+        return self._y_position - net < REFILL_RESERVE_MM
+
+    def _wait_for_refill(self, notify: Callable[[], None]) -> bool:
+        """
+        주사기 교체/수동 공급 응답 대기 (refill_resin 또는 disable_y_dispensing)
+
+        Args:
+            notify: 대기 플래그 설정 후 호출할 알림 (시그널 emit)
+
+        Returns:
+            bool: 계속 진행 시 True, 정지 시 False
+        """
+        self._y_resin_waiting = True
+        notify()
+        self._resin_mutex.lock()
+        while self._y_resin_waiting and not self._is_stopped:
+            self._resin_condition.wait(self._resin_mutex, 1000)
+        self._resin_mutex.unlock()
+        return not self._check_stopped()
+
+    def _dispense_for_layer(self, layer_idx: int, job: PrintJob) -> tuple:
+        """레이어 토출 (거리 mm, 대기 초) — 면적 기반이면 대기도 거리 비례로 단축"""
+        plan = job.dispense_plan
+        if plan is None or not plan.volumetric:
+            return job.y_dispense_distance, job.y_dispense_delay
+        distance = plan.distance(layer_idx)
+        return distance, scaled_delay(distance, job.y_dispense_distance, job.y_dispense_delay)
+
+    def _is_empty_layer(self, layer_idx: int) -> bool:
+        """형상 인덱스 기준 빈 레이어 여부 (인덱스가 없으면 False → 프레임에서 확인)"""
+        geometry = self._job.geometry if self._job else None
+        return geometry is not None and geometry.is_empty(layer_idx)
+
+    def _take_layer_frame(self, layer_idx: int) -> Optional[QImage]:
         """
-        레이어 이미지 표시
+        레이어 프레임 가져오기
+
+        선읽기 스테이지에서 디코딩된 프레임을 우선 사용하고,
+        준비되지 않은 경우에만 레이어 소스에서 동기 로드.
+        컴팩트 프레임(Grayscale8/Mono)은 QPixmap 변환 시점에만 디스플레이 형식으로 확장.
 
         Args:
-            zip_path: ZIP 파일 경로
             layer_idx: 레이어 인덱스
 
         Returns:
-            bool: 성공 시 True, 실패 시 False
+            프레임, 실패 시 None (error_occurred 발생)
         """
+        qimage = self._take_prefetched_frame(layer_idx)
+        if qimage is not None:
+            return qimage
+
         max_retries = 3
         retry_delay = 0.5  # 500ms
 
         for attempt in range(max_retries):
             try:
-                image_data = GCodeParser.get_layer_image(zip_path, layer_idx)
-                if image_data:
-                    qimage = QImage.fromData(image_data)
-                    if qimage.isNull():
-                        raise ValueError(f"이미지 데이터 손상 (레이어 {layer_idx})")
-                    pixmap = QPixmap.fromImage(qimage)
-                    self.show_image.emit(pixmap)
-                    return True
-                else:
-                    raise FileNotFoundError(f"레이어 {layer_idx} 이미지를 찾을 수 없음")
+                return self._load_layer_frame(layer_idx)
             except Exception as e:
                 print(f"[PrintWorker] 이미지 로드 오류 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
@@ -655,9 +1002,119 @@ class PrintWorker(QThread):
                     error_msg = f"레이어 {layer_idx} 이미지 로드 실패: {e}"
                     print(f"[PrintWorker] 치명적 오류: {error_msg}")
                     self.error_occurred.emit(error_msg)
-                    return False
+                    return None
+
+        return None
+
+    def _emit_job_summary(self, layers_done: int):
+        """작업 요약 로그 + 시그널"""
+        summary = {
+            'layers': layers_done,
+            'empty_layers': self._empty_layers,
+            'time_saved': round(self._time_saved, 1),
+            'late_frames': self._late_frames,
+            'present_max_ms': round(self._present_max_ms, 1),
+        }
+        print(f"[PrintWorker] 작업 요약: {layers_done}개 레이어, 빈 레이어 {self._empty_layers}개 "
+              f"(노광 생략 {self._time_saved:.1f}초)")
+        if self._frame_ack:
+            print(f"[PrintWorker] 프레임 표시 확인: 최대 {self._present_max_ms:.0f}ms, "
+                  f"지연 {self._late_frames}개 (>{FRAME_PRESENT_TIMEOUT_MS}ms)")
+        self.job_summary.emit(summary)
+
+    def _load_layer_frame(self, layer_idx: int) -> QImage:
+        """
+        레이어 읽기 + 디코딩 (선읽기 스레드와 워커 스레드 양쪽에서 호출)
 
-        return False
+        Raises:
+            FileNotFoundError: 레이어가 없는 경우
+            ValueError: 이미지 데이터가 손상된 경우
+        """
+        # 소스 프레임은 이미 컴팩트 형식 (Grayscale8/Mono, .vlayers RAW는 mmap 제로카피)
+        source = self._layer_source
+        qimage = source.layer_image(layer_idx) if source else None
+        if qimage is None:
+            raise FileNotFoundError(f"레이어 {layer_idx} 이미지를 찾을 수 없음")
+        if qimage.isNull():
+            raise ValueError(f"이미지 데이터 손상 (레이어 {layer_idx})")
+
+        # 형상 인덱스가 없으면 빈 레이어 여부를 원본(컴팩트) 프레임에서 판정
+        job = self._job
+        if job is not None and job.geometry is None and is_blank_frame(qimage):
+            self._blank_layers.add(layer_idx)
+
+        # 프로젝터 해상도로 정규화 (같으면 리샘플링 없이 통과)
+        plan = self._frame_plan
+        if plan is None or not plan.matches(qimage.width(), qimage.height()):
+            plan = plan_frame((qimage.width(), qimage.height()), self._projector_size)
+            self._frame_plan = plan
+        frame = normalize_frame(qimage, plan)
+
+        # 조도 균일화 (프로젝터 해상도 프레임에 픽셀별 게인)
+        mask = self._uniformity_mask
+        if mask is not None:
+            frame = mask.apply(frame)
+        return frame
+
+    def _plan_job_frames(self):
+        """레이어 소스 헤더로 프레임 정규화 계획 계산 (디코딩 없음)"""
+        size = None
+        try:
+            size = self._layer_source.frame_size() if self._layer_source else None
+        except Exception as e:
+            print(f"[PrintWorker] 첫 레이어 크기 확인 실패: {e}")
+
+        if size is None:
+            # 첫 프레임 디코딩 시 계산
+            self._frame_plan = None
+            return
+
+        self._frame_plan = plan_frame(size, self._projector_size)
+        plan = self._frame_plan
+        if plan.passthrough:
+            print(f"[PrintWorker] 레이어 {size[0]}x{size[1]} = 프로젝터 해상도 → 스케일 생략")
+        else:
+            print(f"[PrintWorker] 레이어 {size[0]}x{size[1]} → {plan.scaled_width}x{plan.scaled_height} "
+                  f"(프로젝터 {plan.target_width}x{plan.target_height})")
+
+    # ==================== 레이어 선읽기 ====================
+
+    def _take_prefetched_frame(self, layer_idx: int) -> Optional[QImage]:
+        """
+        선읽기된 프레임 가져오기 (없으면 None)
+
+        일시정지 등으로 선읽기가 취소된 경우 현재 레이어부터 다시 시작
+        """
+        job = self._job
+        if not job or job.prefetch_depth <= 0 or not self._layer_source:
+            return None
+
+        prefetcher = self._prefetcher
+        if prefetcher is None or prefetcher.is_cancelled or layer_idx < prefetcher.start_layer:
+            self._start_prefetch(layer_idx)
+            prefetcher = self._prefetcher
+
+        return prefetcher.take(layer_idx)
+
+    def _start_prefetch(self, start_layer: int):
+        """start_layer부터 선읽기 시작 (기존 선읽기는 취소)"""
+        self._stop_prefetch()
+
+        total_layers = min(self._job.params.totalLayer, self._layer_source.layer_count)
+        self._prefetcher = LayerPrefetcher(
+            loader=self._load_layer_frame,
+            skip=self._is_empty_layer,
+            start_layer=start_layer,
+            end_layer=total_layers,
+            depth=self._job.prefetch_depth,
+        )
+        self._prefetcher.start()
+
+    def _stop_prefetch(self):
+        """선읽기 취소 및 스레드 종료 대기"""
+        if self._prefetcher:
+            self._prefetcher.cancel()
+            self._prefetcher = None
 
     # ==================== 토출 헬퍼 ====================
 
@@ -671,17 +1128,24 @@ class PrintWorker(QThread):
         return True
 
     def _dispense_3step(self, layer_idx: int, job: PrintJob,
-                        push_speed_override: int = 0) -> bool:
+                        push_speed_override: int = 0,
+                        push_distance: Optional[float] = None,
+                        push_delay: Optional[float] = None) -> bool:
         """
         3단계 토출: Push → [Resin Delay] → Pull → Return
         - Pull/Return 거리가 0이면 해당 단계 스킵
         - layer_idx=-1이면 초기 토출
+        - push_distance/push_delay: 토출 계획 값 (None이면 y_dispense_distance/delay)
         """
         label = "Initial" if layer_idx < 0 else f"Layer {layer_idx}"
         push_speed = push_speed_override if push_speed_override else job.y_dispense_speed
+        if push_distance is None:
+            push_distance = job.y_dispense_distance
+        if push_delay is None:
+            push_delay = job.y_dispense_delay
 
         # === Step 1: Push ===
-        push_dist = -job.y_dispense_distance
+        push_dist = -push_distance
         success, actual = self._motor_y_move(push_dist, push_speed)
         if not success:
             self.error_occurred.emit(f"{label}: Resin push failed")
@@ -728,13 +1192,7 @@ class PrintWorker(QThread):
                     print(f"[PrintWorker] {label}: Max retries reached — treating as empty")
 
             print(f"[PrintWorker] {label}: Resin exhausted (pos: {self._y_position:.1f}mm, endstop: {'triggered' if endstop_triggered else 'max retries'})")
-            self._y_resin_waiting = True
-            self.resin_empty.emit()
-            self._resin_mutex.lock()
-            while self._y_resin_waiting and not self._is_stopped:
-                self._resin_condition.wait(self._resin_mutex, 1000)
-            self._resin_mutex.unlock()
-            if self._check_stopped():
+            if not self._wait_for_refill(self.resin_empty.emit):
                 return False
             if self._y_dispensing_disabled:
                 # 수동배급 선택 → delay만 대기 후 계속
@@ -748,9 +1206,9 @@ class PrintWorker(QThread):
                 # Pull/Return은 아래 로직에서 계속 진행
 
         # === Resin Delay: Push 후 대기 ===
-        if job.y_dispense_delay > 0:
-            print(f"[PrintWorker] {label}: Resin Delay {job.y_dispense_delay}s")
-            if not self._wait_interruptible(job.y_dispense_delay):
+        if push_delay > 0:
+            print(f"[PrintWorker] {label}: Resin Delay {push_delay:.2f}s")
+            if not self._wait_interruptible(push_delay):
                 return False
 
         # Pull 거리 없으면 여기서 종료
@@ -860,6 +1318,8 @@ class PrintWorker(QThread):
         if self._is_paused and not self._is_stopped:
             # Klipper에 일시정지 알림 (idle timeout 방지)
             self._mutex.unlock()
+            # 선읽기 취소 (재개 후 현재 레이어부터 다시 시작)
+            self._stop_prefetch()
             if self.motor and not self.simulation:
                 self.motor.klipper_pause()
             self._mutex.lock()
@@ -906,6 +1366,7 @@ class PrintWorker(QThread):
                 self._is_stopped = True
                 self._mutex.unlock()
                 return
+            self._blade_position = 0.0
 
             print("[PrintWorker] Klipper 복구 완료")
             # CLEAR_PAUSE 후 진행
@@ -922,6 +1383,13 @@ class PrintWorker(QThread):
         # LED OFF
         self._dlp_led_off()
 
+        # 선읽기 종료 후 레이어 소스 닫기 (.vlayers 프레임은 mmap 참조)
+        self._stop_prefetch()
+        if self._layer_source:
+            self._layer_source.close()
+            self._layer_source = None
+        self._uniformity_mask = None
+
         # 프로젝터는 끄지 않음 (앱 실행 동안 계속 ON 유지)
 
         # 이미지 클리어
@@ -0,0 +1,125 @@
+"""
+VERICOM DLP 3D Printer - Thumbnail Loader
+파일 목록 썸네일 + 메타데이터(레이어 수, 예상 시간) 비동기 로드
+
+QThreadPool에서 썸네일 캐시 → 파일 카탈로그 순으로 읽고, 결과는 GUI 스레드로 전달.
+화면에서 벗어난 파일의 요청은 대기 중이면 풀에서 제거, 실행 중이면 결과를 버림.
+"""
+
+import threading
+from typing import Dict, Iterable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+try:
+    from utils.file_catalogue import get_file_catalogue
+    from utils.thumbnail_cache import get_thumbnail_cache
+except ImportError:
+    from ..utils.file_catalogue import get_file_catalogue
+    from ..utils.thumbnail_cache import get_thumbnail_cache
+
+
+# 로드 스레드 수 (GUI/프린트 작업에 코어를 남겨둠)
+MAX_THREADS = 2
+
+
+def load_file_meta(file_path: str) -> dict:
+    """
+    파일 목록 표시용 메타데이터 (파일 카탈로그 사용)
+
+    Returns:
+        {'layers': 총 레이어 수, 'time': 예상 시간(초), 'valid': 검증 통과 여부}
+    """
+    entry = get_file_catalogue().index(file_path)
+    if entry is None:
+        return {'layers': 0, 'time': 0.0, 'valid': False}
+    return entry.meta()
+
+
+class _LoaderSignals(QObject):
+    """작업 → 로더 결과 전달 (GUI 스레드 객체, 큐 연결)"""
+    loaded = Signal(str, object, dict)   # (파일 경로, QImage 또는 None, 메타데이터)
+
+
+class _ThumbnailTask(QRunnable):
+    """파일 1개 썸네일 + 메타데이터 로드 작업"""
+
+    def __init__(self, file_path: str, signals: _LoaderSignals):
+        super().__init__()
+        self.setAutoDelete(False)  # tryTake로 취소할 수 있도록 로더가 소유
+        self.file_path = file_path
+        self.signals = signals
+        self.cancelled = threading.Event()
+
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        image = get_thumbnail_cache().get_or_load(self.file_path,
+                                                  get_file_catalogue().load_thumbnail)
+        if self.cancelled.is_set():
+            return
+        meta = load_file_meta(self.file_path)
+        if self.cancelled.is_set():
+            return
+        self.signals.loaded.emit(self.file_path, image, meta)
+
+
+class ThumbnailLoader(QObject):
+    """
+    썸네일/메타데이터 비동기 로더
+
+    사용 예:
+        loader = ThumbnailLoader(self)
+        loader.loaded.connect(on_loaded)   # (경로, QImage 또는 None, {'layers', 'time', 'valid'})
+        loader.retain(visible_paths)       # 화면 밖 요청 취소
+        loader.request(path)
+    """
+
+    loaded = Signal(str, object, dict)
+
+    def __init__(self, parent=None, max_threads: int = MAX_THREADS):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._signals = _LoaderSignals(self)
+        self._signals.loaded.connect(self._on_task_loaded)
+        self._pending: Dict[str, _ThumbnailTask] = {}
+
+    def request(self, file_path: str):
+        """로드 요청 (같은 파일이 이미 대기/실행 중이면 무시)"""
+        if not file_path or file_path in self._pending:
+            return
+        task = _ThumbnailTask(file_path, self._signals)
+        self._pending[file_path] = task
+        self._pool.start(task)
+
+    def retain(self, file_paths: Iterable[str]):
+        """지정한 파일 외의 요청 취소 (페이지 이동 시)"""
+        keep = set(file_paths)
+        for path in [p for p in self._pending if p not in keep]:
+            self._cancel(path)
+
+    def cancel_all(self):
+        """모든 요청 취소"""
+        for path in list(self._pending):
+            self._cancel(path)
+
+    def wait_for_done(self, msecs: int = 1000) -> bool:
+        """실행 중인 작업 종료 대기 (종료 시 사용)"""
+        self.cancel_all()
+        return self._pool.waitForDone(msecs)
+
+    def _cancel(self, file_path: str):
+        task = self._pending.pop(file_path, None)
+        if task is None:
+            return
+        task.cancelled.set()
+        self._pool.tryTake(task)  # 아직 시작 전이면 풀에서 제거
+
+    def _on_task_loaded(self, file_path: str, image, meta: dict):
+        """작업 결과 (GUI 스레드) — 취소된 요청의 결과는 버림"""
+        task = self._pending.get(file_path)
+        if task is None or task.cancelled.is_set():
+            return
+        del self._pending[file_path]
+        self.loaded.emit(file_path, image, meta)